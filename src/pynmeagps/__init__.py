@@ -10,14 +10,27 @@ Created on 4 Mar 2021
 
 from pynmeagps._version import __version__
 from pynmeagps.exceptions import (
+    NMEAChecksumError,
+    NMEAHeaderError,
+    NMEALengthError,
     NMEAMessageError,
     NMEAParseError,
     NMEAStreamError,
     NMEATypeError,
 )
+from pynmeagps.nmeaais import AISAssembler, AISMessage, decode_ais
+from pynmeagps.nmeaasyncreader import AsyncNMEAReader
+from pynmeagps.nmeaclasses import get_message_class
+from pynmeagps.nmeaclient import NMEAClient
+from pynmeagps.nmeadatagramreader import NMEADatagramReader
+from pynmeagps.nmeafilereader import NMEAFileReader
+from pynmeagps.nmeaframer import NMEAFramer
 from pynmeagps.nmeahelpers import *
 from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeaparallel import get_ranges, parse_file_parallel
 from pynmeagps.nmeareader import NMEAReader
+from pynmeagps.nmeastreamparser import NMEAStreamParser
+from pynmeagps.nmeatypes_ais import *
 from pynmeagps.nmeatypes_core import *
 from pynmeagps.nmeatypes_decodes import *
 from pynmeagps.nmeatypes_get import *
@@ -21,6 +21,24 @@ class NMEAStreamError(Exception):
     """
 
 
+class NMEAChecksumError(NMEAParseError):
+    """
+    NMEA invalid sentence or TAG block checksum.
+    """
+
+
+class NMEAHeaderError(NMEAParseError):
+    """
+    NMEA unknown protocol header (non-NMEA data in stream).
+    """
+
+
+class NMEALengthError(NMEAStreamError):
+    """
+    NMEA sentence exceeds maximum length.
+    """
+
+
 class NMEAMessageError(Exception):
     """
     NMEA Undefined message class/id.
@@ -0,0 +1,356 @@
+"""
+AISMessage and AISAssembler classes.
+
+Decodes AIS (ITU-R M.1371) messages encapsulated in !AIVDM and
+!AIVDO sentences, reassembling multi-sentence messages as required.
+
+The armoured 6-bit payload is converted to a single integer via a
+precomputed character table, and each bit field is then extracted
+from it by shifting and masking, using bit offsets compiled once
+per message type from the payload definitions in nmeatypes_ais.
+
+Message types 1-5, 18, 19, 21 and 24 are decoded in full; for all
+other message types, only the common header (msgtype, repeat and
+mmsi) is decoded.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=invalid-name, too-many-positional-arguments
+
+from types import NoneType
+
+import pynmeagps.exceptions as nme
+from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeatypes_ais import (
+    AIS_BOOL,
+    AIS_HEADER,
+    AIS_INT,
+    AIS_OCTAL,
+    AIS_PAYLOADS,
+    AIS_SIXBIT,
+    AIS_TEXT,
+)
+
+DEFAULT_MAXPENDING = 32
+"""Default maximum number of incomplete multi-sentence messages retained"""
+
+
+def _compile(fields: tuple) -> tuple:
+    """
+    Compile payload definition to tuple of (name, end bit offset,
+    width, type, scale) for each field.
+
+    :param tuple fields: payload definition
+    :return: compiled payload definition
+    :rtype: tuple
+    """
+
+    layout = []
+    end = 0
+    for name, width, kind, scale in fields:
+        end += width
+        layout.append((name, end, width, kind, scale))
+    return tuple(layout)
+
+
+_HEADER = _compile(AIS_HEADER)
+_LAYOUTS = {key: _compile(fields) for key, fields in AIS_PAYLOADS.items()}
+
+
+def decode_ais(payload: str, fillbits: int = 0) -> dict:
+    """
+    Decode armoured AIS payload to dict of typed field values.
+
+    Any numeric field extending beyond the end of a truncated payload
+    is returned as None; any such text field is truncated.
+
+    :param str payload: armoured 6-bit payload e.g. "15M67FC000G?ufbE`FepT@3n00Sa"
+    :param int fillbits: number of fill bits at end of payload (0)
+    :return: dict of field values, starting with msgtype
+    :rtype: dict
+    :raises: NMEAMessageError (if payload is invalid)
+    """
+    # pylint: disable=too-many-locals
+
+    try:
+        bits = int(payload.translate(AIS_OCTAL), 8)
+    except ValueError as err:
+        raise nme.NMEAMessageError(f"Invalid AIS payload {payload}") from err
+    size = len(payload) * 6
+    avail = size - fillbits
+    msgtype = bits >> (size - 6)
+    key = str(msgtype)
+    if msgtype == 24:  # part A or B
+        key = "24B" if avail >= 40 and (bits >> (size - 40)) & 3 else "24A"
+    vals = {}
+    for name, end, width, kind, scale in _LAYOUTS.get(key, _HEADER):
+        if end > avail:  # truncated payload
+            if kind != AIS_TEXT or end - width > avail:
+                vals[name] = None
+                continue
+            width -= (end - avail + 5) // 6 * 6
+            end -= (end - avail + 5) // 6 * 6
+        val = (bits >> (size - end)) & ((1 << width) - 1)
+        if kind == AIS_TEXT:
+            chars = [AIS_SIXBIT[(val >> sh) & 0x3F] for sh in range(width - 6, -1, -6)]
+            val = "".join(chars).split("@", 1)[0].rstrip()  # strip "@" padding
+        elif kind == AIS_BOOL:
+            val = bool(val)
+        elif kind == AIS_INT and val >> (width - 1):
+            val -= 1 << width
+        if scale:
+            val /= scale
+        vals[name] = val
+    return vals
+
+
+class AISMessage:
+    """AIS Message Class."""
+
+    def __init__(
+        self,
+        payload: str,
+        fillbits: int = 0,
+        talker: str = "AI",
+        msgID: str = "VDM",
+        aischan: str = "",
+    ):
+        """Constructor.
+
+        :param str payload: armoured 6-bit payload (of all sentences, concatenated)
+        :param int fillbits: number of fill bits at end of payload (0)
+        :param str talker: talker of encapsulating sentence ("AI")
+        :param str msgID: msgID of encapsulating sentence, "VDM" or "VDO" ("VDM")
+        :param str aischan: AIS radio channel "A" or "B" ("")
+        :raises: NMEAMessageError (if payload is invalid)
+        """
+
+        # object is mutable during initialisation only
+        super().__setattr__("_immutable", False)
+        self._talker = talker
+        self._msgID = msgID
+        self._aischan = aischan
+        self._payload = payload
+        self._fillbits = fillbits
+        self.__dict__.update(decode_ais(payload, fillbits))
+        self._immutable = True  # once initialised, object is immutable
+
+    def __str__(self) -> str:
+        """
+        Human readable representation.
+
+        :return: human readable representation
+        :rtype: str
+        """
+
+        stg = f"<AIS({self.identity}"
+        for att, val in self.__dict__.items():
+            if att[0] != "_":  # only show public attributes
+                stg += f", {att}={val}"
+        stg += ")>"
+
+        return stg
+
+    def __repr__(self) -> str:
+        """
+        Machine readable representation.
+
+        eval(repr(obj)) = obj
+
+        :return: machine readable representation
+        :rtype: str
+        """
+
+        return (
+            f"AISMessage({self._payload!r}, {self._fillbits}, "
+            f"'{self._talker}', '{self._msgID}', '{self._aischan}')"
+        )
+
+    def __setattr__(self, name, value):
+        """
+        Override setattr to make object immutable after instantiation.
+
+        :param str name: attribute name
+        :param object value: attribute value
+        :raises: NMEAMessageError
+        """
+
+        if self._immutable:
+            raise nme.NMEAMessageError(
+                f"Object is immutable. Updates to {name} not permitted after initialisation."
+            )
+
+        super().__setattr__(name, value)
+
+    @property
+    def identity(self) -> str:
+        """
+        Identity getter.
+
+        :return: identity of encapsulating sentence e.g. AIVDM
+        :rtype: str
+        """
+
+        return self._talker + self._msgID
+
+    @property
+    def talker(self) -> str:
+        """
+        Talker getter.
+
+        :return: talker e.g. AI
+        :rtype: str
+        """
+
+        return self._talker
+
+    @property
+    def msgID(self) -> str:
+        """
+        Message id getter.
+
+        :return: message id e.g. VDM
+        :rtype: str
+        """
+
+        return self._msgID
+
+    @property
+    def aischan(self) -> str:
+        """
+        AIS radio channel getter.
+
+        :return: channel e.g. A
+        :rtype: str
+        """
+
+        return self._aischan
+
+    @property
+    def payload(self) -> str:
+        """
+        Payload getter.
+
+        :return: armoured 6-bit payload
+        :rtype: str
+        """
+
+        return self._payload
+
+    @property
+    def fillbits(self) -> int:
+        """
+        Fill bits getter.
+
+        :return: number of fill bits at end of payload
+        :rtype: int
+        """
+
+        return self._fillbits
+
+
+class AISAssembler:
+    """
+    AISAssembler class.
+
+    Reassembles AIS messages from their constituent VDM or VDO
+    sentences, keyed by talker, msgID, sequential message ID and
+    radio channel.
+    """
+
+    def __init__(self, maxpending: int = DEFAULT_MAXPENDING):
+        """Constructor.
+
+        :param int maxpending: maximum number of incomplete messages retained;
+            if exceeded, the oldest incomplete message is discarded (32)
+        """
+
+        self._maxpending = maxpending
+        self._pending = {}  # key: ([payloads], [raw sentences])
+
+    def add(
+        self, parsed: NMEAMessage, raw: bytes = b""
+    ) -> tuple[bytes, AISMessage] | NoneType:
+        """
+        Add parsed VDM or VDO sentence and return decoded AIS message
+        if it is complete.
+
+        :param NMEAMessage parsed: parsed VDM or VDO sentence
+        :param bytes raw: raw sentence (b"")
+        :return: tuple of (raw sentences concatenated, AISMessage), or None
+            if awaiting further sentences
+        :rtype: tuple[bytes, AISMessage] | NoneType
+        :raises: NMEAMessageError (if sentence or payload is invalid)
+        :raises: NMEAParseError (if sentence is out of sequence)
+        """
+
+        numsen, sennum = parsed.numSen, parsed.senNum
+        if not (isinstance(numsen, int) and isinstance(sennum, int)):
+            raise nme.NMEAMessageError(
+                f"Invalid {parsed.identity} sentence number {sennum} of {numsen}."
+            )
+        if numsen == 1:
+            return raw, self._message(parsed, parsed.itumsg)
+        pending = self._pending
+        key = (parsed.talker, parsed.msgID, parsed.seqid, parsed.aischan)
+        if sennum == 1:  # first sentence, discard any previous partial message
+            pending.pop(key, None)
+            if len(pending) >= self._maxpending:
+                del pending[next(iter(pending))]
+            pending[key] = ([parsed.itumsg], [raw])
+            return None
+        parts = pending.get(key)
+        if parts is None or len(parts[0]) != sennum - 1:
+            pending.pop(key, None)
+            raise nme.NMEAParseError(
+                f"{parsed.identity} sentence {sennum} of {numsen} out of sequence."
+            )
+        parts[0].append(parsed.itumsg)
+        parts[1].append(raw)
+        if sennum < numsen:
+            return None
+        del pending[key]
+        return b"".join(parts[1]), self._message(parsed, "".join(parts[0]))
+
+    def clear(self):
+        """
+        Discard all incomplete messages.
+        """
+
+        self._pending.clear()
+
+    @staticmethod
+    def _message(parsed: NMEAMessage, payload: str) -> AISMessage:
+        """
+        Create AISMessage from final sentence and complete payload.
+
+        :param NMEAMessage parsed: parsed final VDM or VDO sentence
+        :param str payload: complete armoured payload
+        :return: AIS message
+        :rtype: AISMessage
+        """
+
+        fillbits = parsed.fillbits
+        return AISMessage(
+            payload,
+            fillbits if isinstance(fillbits, int) else 0,
+            parsed.talker,
+            parsed.msgID,
+            parsed.aischan,
+        )
+
+    @property
+    def pending(self) -> int:
+        """
+        Getter for number of incomplete messages.
+
+        :return: number of incomplete messages
+        :rtype: int
+        """
+
+        return len(self._pending)
@@ -0,0 +1,254 @@
+"""
+AsyncNMEAReader class.
+
+Reads and parses individual NMEA GNSS/GPS messages from an
+asyncio.StreamReader (e.g. TCP or Unix socket connection, or
+a serial device or pty file descriptor).
+
+Returns both the raw binary data (as bytes) and the parsed
+data (as an NMEAMessage object).
+
+Implements an asynchronous iterator:
+`async for raw, parsed in AsyncNMEAReader(reader):`
+
+Message mode, validation, nmeaonly, error handling, message filter,
+parsing, lazy decoding, field projection, message class, AIS decoding
+and user-defined payload semantics are as for NMEAReader.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments, too-many-instance-attributes
+
+import asyncio
+from collections.abc import Iterable
+from types import FunctionType, NoneType
+from typing import Literal
+
+import pynmeagps.exceptions as nme
+from pynmeagps.nmeaais import AISMessage
+from pynmeagps.nmeaframer import NMEAFramer
+from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeareader import NMEA_ERRORS, NMEAHandler
+from pynmeagps.nmeatypes_core import (
+    DEFAULT_BUFSIZE,
+    ERR_LOG,
+    GET,
+    NMEA_MAXLEN,
+    VALCKSUM,
+)
+
+
+class AsyncNMEAReader(NMEAHandler):
+    """
+    AsyncNMEAReader class.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        msgmode: Literal[0, 1, 2] = GET,
+        validate: int = VALCKSUM,
+        nmeaonly: bool = False,
+        quitonerror: Literal[0, 1, 2] = ERR_LOG,
+        errorhandler: FunctionType | NoneType = None,
+        userdefined: dict | NoneType = None,
+        writer: asyncio.StreamWriter | NoneType = None,
+        bufsize: int = DEFAULT_BUFSIZE,
+        binaryhandler: FunctionType | NoneType = None,
+        maxlen: int = NMEA_MAXLEN,
+        lazy: bool = False,
+        msgfilter: Iterable[str] | NoneType = None,
+        filterraw: bool = False,
+        parsing: bool = True,
+        decodeais: bool = False,
+        msgclasses: bool = False,
+        fields: dict | NoneType = None,
+    ):
+        """Constructor.
+
+        :param asyncio.StreamReader reader: asyncio input stream
+        :param Literal[0,1,2] msgmode: 0=GET, 1=SET, 2=POLL (0)
+        :param int validate: VALNONE (0), VALCKSUM (1), VALMSGID (2),
+            (can be OR'd) (1)
+        :param bool nmeaonly: True = error on non-NMEA data, False = ignore non-NMEA data
+        :param Literal[0,1,2] quitonerror: ERR_IGNORE (0) = ignore errors,
+            ERR_LOG (1) = log continue, ERR_RAISE (2) = (re)raise (1)
+        :param FunctionType | NoneType errorhandler: error handling callback function (None)
+        :param dict | NoneType userdefined: user-defined payload definition dictionary (None)
+        :param asyncio.StreamWriter | NoneType writer: optional asyncio output stream (None)
+        :param int bufsize: maximum bytes read from stream at a time (4096)
+        :param FunctionType | NoneType binaryhandler: callback function which is
+            passed any skipped UBX or RTCM3 frame as bytes (None)
+        :param int maxlen: maximum NMEA sentence length in bytes; if exceeded, the
+            reader resynchronises at the next start byte, 0 = unbounded (1024)
+        :param bool lazy: decode message attributes on first access (False)
+        :param Iterable[str] | NoneType msgfilter: if specified, only parse sentences
+            whose header (e.g. "GNGGA") or msgID (e.g. "GGA") is in this collection (None)
+        :param bool filterraw: True = return filtered-out sentences as (raw, None),
+            False = skip filtered-out sentences (False)
+        :param bool parsing: True = parse sentences, False = return validated raw
+            sentences only, as (raw, None) (True)
+        :param bool decodeais: True = reassemble and decode AIS messages in VDM and
+            VDO sentences, returned as (raw, AISMessage) (False)
+        :param bool msgclasses: True = parse standard GET sentences of fixed length
+            using generated message classes (False)
+        :param dict | NoneType fields: if specified, dict of msgID or identity to names of the
+            only attributes to be set for that sentence type
+            e.g. {"GGA": ("time", "lat", "lon", "quality")} (None)
+        :raises: NMEAParseError (if mode is invalid)
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
+
+        super().__init__(
+            msgmode,
+            validate,
+            quitonerror,
+            errorhandler,
+            userdefined,
+            lazy,
+            msgfilter,
+            filterraw,
+            parsing,
+            decodeais,
+            msgclasses,
+            fields,
+        )
+        self._stream = reader
+        self._writer = writer
+        self._bufsize = bufsize
+        self._framer = NMEAFramer(
+            nmeaonly=nmeaonly, binaryhandler=binaryhandler, maxlen=maxlen
+        )
+
+    @classmethod
+    async def open_connection(cls, host: str, port: int, **kwargs):
+        """
+        Open TCP connection and return AsyncNMEAReader for it.
+
+        :param str host: hostname or IP address
+        :param int port: TCP port
+        :param kwargs: optional AsyncNMEAReader keyword arguments
+        :return: AsyncNMEAReader instance
+        :rtype: AsyncNMEAReader
+        """
+
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer=writer, **kwargs)
+
+    @classmethod
+    async def open_pipe(cls, fileobj: object, **kwargs):
+        """
+        Return AsyncNMEAReader for a readable file-like object,
+        such as a serial device, pty or pipe, which is serviced
+        by the event loop rather than a dedicated thread.
+
+        NB: the file object should be opened in non-blocking mode.
+
+        :param object fileobj: readable file-like object with fileno() method
+        :param kwargs: optional AsyncNMEAReader keyword arguments
+        :return: AsyncNMEAReader instance
+        :rtype: AsyncNMEAReader
+        """
+
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), fileobj
+        )
+        return cls(reader, **kwargs)
+
+    def __aiter__(self):
+        """Asynchronous iterator."""
+
+        return self
+
+    async def __anext__(
+        self,
+    ) -> tuple[bytes, NMEAMessage | AISMessage | NoneType]:
+        """
+        Return next item in asynchronous iteration.
+
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage or AISMessage)
+        :rtype: tuple[bytes, NMEAMessage | AISMessage | NoneType]
+        :raises: StopAsyncIteration
+
+        """
+
+        raw_data, parsed_data = await self.read()
+        if raw_data is None and parsed_data is None:
+            raise StopAsyncIteration
+        return (raw_data, parsed_data)
+
+    async def read(
+        self,
+    ) -> tuple[bytes | NoneType, NMEAMessage | AISMessage | NoneType]:
+        """
+        Read next NMEA message from the stream.
+
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage or AISMessage)
+        :rtype: tuple[bytes | NoneType, NMEAMessage | AISMessage | NoneType]
+        :raises: NMEAStreamError (if nmeaonly=True and stream includes non-NMEA data)
+
+        """
+
+        while True:  # loop until end of valid NMEA message or EOF
+            try:
+                result = self._handle(await self._read_frame())
+                if result is not None:
+                    return result
+            except EOFError:
+                return (None, None)
+            except NMEA_ERRORS as err:
+                if self._quitonerror:
+                    self._do_error(err)
+
+    async def _read_frame(self) -> bytes:
+        """
+        Read next NMEA sentence from the stream, discarding any non-NMEA data.
+
+        :return: raw NMEA sentence
+        :rtype: bytes
+        :raises: EOFError if stream ends
+        :raises: NMEAParseError (if nmeaonly=True and stream includes non-NMEA data)
+        """
+
+        while True:
+            raw_data = self._framer.next_frame()
+            if raw_data is not None:
+                return raw_data
+            data = await self._stream.read(self._bufsize)
+            if len(data) == 0:  # EOF
+                if self._framer.eof:
+                    raise EOFError()
+                self._framer.set_eof()  # resolve any incomplete binary frame
+                continue
+            self._framer.feed(data)
+
+    async def write(self, data: bytes):
+        """
+        Write bytes to output stream, if one has been provided.
+
+        :param bytes data: data to write
+        :raises: NMEAStreamError if no output stream
+        """
+
+        if self._writer is None:
+            raise nme.NMEAStreamError("No output stream available.")
+        self._writer.write(data)
+        await self._writer.drain()
+
+    @property
+    def datastream(self) -> asyncio.StreamReader:
+        """
+        Getter for stream.
+
+        :return: data stream
+        :rtype: asyncio.StreamReader
+        """
+
+        return self._stream
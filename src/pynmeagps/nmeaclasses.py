@@ -0,0 +1,261 @@
+"""
+Generated message classes for standard NMEA sentences.
+
+For each standard GET sentence type in NMEA_PAYLOADS_GET whose payload
+definition has a fixed number of attributes (e.g. GGA, RMC, GSA, VTG,
+GST, ZDA), a dedicated subclass of NMEAMessage can be generated on first
+use. Each generated class holds its attributes in __slots__ and has a
+specialised from_payload() constructor, which converts and assigns each
+attribute in straight-line code rather than walking the payload
+definition.
+
+Sentence types with indeterminate or attribute-dependent repeating
+groups (e.g. GSV) are not generated, and any payload which is shorter
+than the full definition, or which contains an invalid value, is
+parsed by the generic NMEAMessage class instead.
+
+Generated classes are opt-in via the `msgclasses` argument of
+NMEAReader and NMEAReader.parse().
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=invalid-name
+
+import struct
+from keyword import iskeyword
+from types import NoneType
+
+import pynmeagps.exceptions as nme
+from pynmeagps.nmeahelpers import generate_checksum
+from pynmeagps.nmeamessage import _RESERVED, NMEAMessage, _get_plan
+from pynmeagps.nmeatypes_core import (
+    DEF_STND,
+    GET,
+    NMEA_MSGIDS,
+    NMEA_TALKERS,
+    VALCKSUM,
+)
+from pynmeagps.nmeatypes_get import NMEA_PAYLOADS_GET
+
+CLASS_PREFIX = "NMEAMessage"
+"""Name prefix of generated message classes e.g. NMEAMessageGGA"""
+
+_CLASSES = {}  # msgID: generated class, or None if not generated
+
+_FROM_PAYLOAD = """
+def from_payload(cls, talker, payload, checksum=None, validate=VALCKSUM, tagblock=None):
+    if len(payload) < {length} or talker not in NMEA_TALKERS:
+        return fallback(talker, payload, checksum, validate, tagblock)
+    try:
+{convert}
+    except (
+        AttributeError,
+        OverflowError,
+        struct.error,
+        TypeError,
+        ValueError,
+        nme.NMEATypeError,
+    ):  # generic class raises NMEATypeError with attribute details
+        return fallback(talker, payload, checksum, validate, tagblock)
+{signs}
+    if checksum is None:
+        checksum = generate_checksum(talker, MSGID, payload)
+    self = new(cls)
+{assign}
+    return self
+"""
+
+
+def _fallback(msgID: str):
+    """
+    Return function to construct generic NMEAMessage from payload.
+
+    :param str msgID: message ID e.g. "GGA"
+    :return: fallback constructor
+    :rtype: FunctionType
+    """
+
+    def fallback(
+        talker: str,
+        payload: list,
+        checksum: str | NoneType,
+        validate: int,
+        tagblock: dict | NoneType,
+    ) -> NMEAMessage:
+        # pylint: disable=too-many-arguments
+        return NMEAMessage(
+            talker,
+            msgID,
+            GET,
+            payload=payload,
+            checksum=checksum,
+            validate=validate,
+            tagblock=tagblock,
+        )
+
+    return fallback
+
+
+def _fixed_length(pdict: dict) -> int | NoneType:
+    """
+    Get number of attributes in payload definition, if fixed.
+
+    :param dict pdict: dict representing payload definition
+    :return: number of attributes, or None if any repeating group
+        has an indeterminate or attribute-dependent number of repeats
+    :rtype: int | NoneType
+    """
+
+    length = 0
+    for att in pdict.values():
+        if isinstance(att, tuple):
+            numr, attd = att
+            glength = _fixed_length(attd)
+            if not isinstance(numr, int) or glength is None:
+                return None
+            length += numr * glength
+        else:
+            length += 1
+    return length
+
+
+def _generate(msgID: str) -> type | NoneType:
+    """
+    Generate message class for standard GET sentence type.
+
+    :param str msgID: message ID e.g. "GGA"
+    :return: generated class, or None if sentence type cannot be generated
+    :rtype: type | NoneType
+    """
+    # pylint: disable=too-many-locals
+
+    pdict = NMEA_PAYLOADS_GET.get(msgID)
+    if pdict is None or msgID not in NMEA_MSGIDS:
+        return None
+    length = _fixed_length(pdict)
+    if length is None:
+        return None
+    entries, _, plan, signs, _, index = _get_plan(pdict, [""] * length, msgID)
+    names = [name for name, _ in entries]
+    if len(set(names)) != len(names) or not all(
+        name.isidentifier() and not iskeyword(name) and name not in _RESERVED
+        for name in names
+    ):
+        return None
+
+    name = f"{CLASS_PREFIX}{msgID}"
+    cls = type(name, (NMEAMessage,), {"__slots__": tuple(names)})
+    cls.__module__ = __name__
+    cls.__doc__ = f"Generated NMEA {msgID} Message Class."
+    namespace = {
+        "MSGID": msgID,
+        "VALCKSUM": VALCKSUM,
+        "NMEA_TALKERS": NMEA_TALKERS,
+        "generate_checksum": generate_checksum,
+        "fallback": _fallback(msgID),
+        "new": object.__new__,
+        "nme": nme,
+        "struct": struct,
+    }
+    convert = []
+    for i, (att, conv) in enumerate(entries):
+        if conv is None:
+            convert.append(f"        v{i} = payload[{i}]  # {att}")
+        else:
+            namespace[f"c{i}"] = conv
+            convert.append(f"        v{i} = c{i}(payload[{i}])  # {att}")
+    sign = []
+    for att, (pindex, neg) in signs.items():
+        i = plan[att][1]
+        sign.append(
+            f"    if isinstance(v{i}, (int, float)):\n"
+            f"        v{i} = -abs(v{i}) if payload[{pindex}] == {neg!r} else abs(v{i})"
+        )
+    internal = {
+        "_validate": "validate",
+        "_userdefined": "None",
+        "_defsource": "DEFSOURCE",
+        "_mode": "GET",
+        "_hpnmeamode": "False",
+        "_talker": "talker",
+        "_msgID": "MSGID",
+        "_checksum": "checksum",
+        "_tagblock": "tagblock",
+        "_streaming": "True",
+        "_lazy": "False",
+        "_payload": "payload",
+        "_plan": "PLAN",
+        "_signs": "SIGNS",
+        "_index": "INDEX",
+        "_values": "None",
+    }
+    namespace.update(
+        {
+            "DEFSOURCE": DEF_STND,
+            "GET": GET,
+            "PLAN": plan,
+            "SIGNS": signs,
+            "INDEX": index,
+        }
+    )
+    # assign slots directly via their descriptors, bypassing __setattr__
+    setters = [(vars(NMEAMessage)[att], val) for att, val in internal.items()]
+    setters += [(vars(cls)[att], f"v{i}") for i, att in enumerate(names)]
+    setters.append((vars(NMEAMessage)["_immutable"], "True"))
+    assign = []
+    for i, (descriptor, val) in enumerate(setters):
+        namespace[f"s{i}"] = descriptor.__set__
+        assign.append(f"    s{i}(self, {val})  # {descriptor.__name__}")
+    src = _FROM_PAYLOAD.format(
+        length=length,
+        convert="\n".join(convert),
+        signs="\n".join(sign),
+        assign="\n".join(assign),
+    )
+    # pylint: disable=exec-used
+    exec(compile(src, f"<{name}>", "exec"), namespace)  # nosec B102
+    cls.from_payload = classmethod(namespace["from_payload"])
+    return cls
+
+
+def get_message_class(msgID: str) -> type | NoneType:
+    """
+    Get generated message class for standard GET sentence type,
+    generating it on first use.
+
+    The class is a subclass of NMEAMessage with a specialised constructor
+    `from_payload(talker, payload, checksum=None, validate=VALCKSUM, tagblock=None)`.
+
+    :param str msgID: message ID e.g. "GGA"
+    :return: generated class, or None if sentence type cannot be generated
+    :rtype: type | NoneType
+    """
+
+    try:
+        return _CLASSES[msgID]
+    except KeyError:
+        cls = _CLASSES[msgID] = _generate(msgID)
+        return cls
+
+
+def __getattr__(name: str) -> type:
+    """
+    Resolve generated message classes by name e.g. NMEAMessageGGA
+    (required to unpickle generated message instances).
+
+    :param str name: class name
+    :return: generated class
+    :rtype: type
+    :raises: AttributeError if name is not a generated class
+    """
+
+    if name.startswith(CLASS_PREFIX):
+        cls = get_message_class(name[len(CLASS_PREFIX) :])
+        if cls is not None:
+            return cls
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
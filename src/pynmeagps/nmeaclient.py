@@ -0,0 +1,390 @@
+"""
+NMEAClient class.
+
+Resilient TCP or HTTP NMEA client which owns its socket connection.
+
+Connects to a TCP NMEA source (e.g. a GNSS receiver, serial-to-IP
+converter or NMEA concentrator), optionally issuing an HTTP GET
+request and decoding any chunked and/or compressed transfer-encoding.
+If the connection fails, is closed by the remote server or times out,
+the client reconnects with exponential backoff and resumes framing
+from the next NMEA header, so that iteration continues across
+reconnections:
+
+`for raw, parsed in NMEAClient("192.168.0.20", 50010):`
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments, too-many-instance-attributes
+
+import socket
+from collections.abc import Iterator
+from logging import getLogger
+from threading import Event
+from time import perf_counter
+from types import NoneType
+
+import pynmeagps.exceptions as nme
+from pynmeagps._version import __version__
+from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeareader import NMEAReader
+from pynmeagps.nmeatypes_core import (
+    ENCODE_CHUNKED,
+    ENCODE_COMPRESS,
+    ENCODE_DEFLATE,
+    ENCODE_GZIP,
+    ENCODE_NONE,
+)
+
+DEFAULT_TIMEOUT = 10.0
+"""Default socket connect and read timeout in seconds"""
+DEFAULT_BACKOFF = 1.0
+"""Default initial reconnection delay in seconds"""
+DEFAULT_MAXBACKOFF = 60.0
+"""Default maximum reconnection delay in seconds"""
+DEFAULT_STABLE = 10.0
+"""Default minimum connection duration in seconds before backoff is reset"""
+MAX_HTTPHDR = 16384
+"""Maximum length of HTTP response header in bytes"""
+
+HTTP_ENCODINGS = {
+    "chunked": ENCODE_CHUNKED,
+    "gzip": ENCODE_GZIP,
+    "x-gzip": ENCODE_GZIP,
+    "compress": ENCODE_COMPRESS,
+    "deflate": ENCODE_DEFLATE,
+}
+"""HTTP transfer/content-encoding values"""
+
+
+class NMEAClient:
+    """
+    NMEAClient class.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        path: str | NoneType = None,
+        headers: dict | NoneType = None,
+        encoding: int | NoneType = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        keepalive: bool = True,
+        retries: int = 0,
+        backoff: float = DEFAULT_BACKOFF,
+        maxbackoff: float = DEFAULT_MAXBACKOFF,
+        stable: float = DEFAULT_STABLE,
+        **kwargs,
+    ):
+        """Constructor.
+
+        :param str host: hostname or IP address
+        :param int port: TCP port
+        :param str | NoneType path: if specified, issue an HTTP GET request for
+            this path (e.g. "/nmea") on connection (None)
+        :param dict | NoneType headers: additional HTTP request headers (None)
+        :param int | NoneType encoding: encoding for socket stream \
+            (0 = none, 1 = chunk, 2 = gzip, 4 = compress, 8 = deflate (can be OR'd)),
+            None = taken from HTTP response headers, or 0 if not HTTP (None)
+        :param float timeout: socket connect and read timeout in seconds; if no data
+            is received within this time, the client reconnects (10.0)
+        :param bool keepalive: enable TCP keep-alive (True)
+        :param int retries: maximum number of consecutive failed connection
+            attempts before iteration ends, 0 = unlimited (0)
+        :param float backoff: initial reconnection delay in seconds, doubled after
+            each consecutive failed attempt or unstable connection (1.0)
+        :param float maxbackoff: maximum reconnection delay in seconds (60.0)
+        :param float stable: minimum connection duration in seconds before backoff
+            is reset; connections lost sooner than this continue to back off (10.0)
+        :param kwargs: optional NMEAReader keyword arguments
+        """
+        # pylint: disable=too-many-arguments
+
+        self._host = host
+        self._port = port
+        self._path = path
+        self._headers = {} if headers is None else headers
+        self._encoding = encoding
+        self._timeout = timeout
+        self._keepalive = keepalive
+        self._retries = retries
+        self._backoff = backoff
+        self._maxbackoff = maxbackoff
+        self._stable = stable
+        self._attempts = 0
+        self._connecttime = 0.0
+        self._kwargs = kwargs
+        self._socket = None
+        self._reader = None
+        self._stopevent = Event()
+        self._metrics = {}
+        self._logger = getLogger(__name__)
+        self.reset_metrics()
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def __iter__(self) -> Iterator[tuple[bytes, NMEAMessage | NoneType]]:
+        """
+        Iterate over NMEA messages, reconnecting as necessary.
+        Iteration ends when close() is called or the maximum number
+        of consecutive failed connection attempts is reached.
+
+        :return: iterator of (raw_data as bytes, parsed_data as NMEAMessage)
+        :rtype: Iterator[tuple[bytes, NMEAMessage | NoneType]]
+        """
+
+        # pylint: disable=logging-fstring-interpolation
+
+        while not self._stopevent.is_set():
+            if self._reader is None and not self._reconnect():
+                return
+            start = perf_counter()
+            raw_data, parsed_data = self._reader.read()
+            if raw_data is None:  # connection closed or timed out
+                if not self._stopevent.is_set():
+                    self._metrics["disconnects"] += 1
+                    self._logger.warning(
+                        f"Connection to {self._host}:{self._port} lost"
+                    )
+                    if perf_counter() - self._connecttime < self._stable:
+                        self._attempts += 1  # unstable, keep backing off
+                    else:
+                        self._attempts = 0
+                self._disconnect()
+                continue
+            self._update_latency(perf_counter() - start)
+            yield raw_data, parsed_data
+
+    def connect(self):
+        """
+        Open connection to remote host, issuing HTTP GET request
+        if a path has been specified.
+
+        :raises: OSError if connection fails
+        :raises: NMEAStreamError if HTTP request fails
+        """
+
+        start = perf_counter()
+        sock = socket.create_connection((self._host, self._port), self._timeout)
+        try:
+            if self._keepalive:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            encoding = ENCODE_NONE
+            if self._path is not None:
+                encoding = self._http_get(sock)
+            if self._encoding is not None:
+                encoding = self._encoding
+            self._reader = NMEAReader(sock, encoding=encoding, **self._kwargs)
+        except Exception:
+            sock.close()
+            raise
+        self._socket = sock
+        self._connecttime = perf_counter()
+        self._metrics["connlatency"] = perf_counter() - start
+        self._metrics["connects"] += 1
+        if self._metrics["connects"] > 1:
+            self._metrics["reconnects"] += 1
+
+    def close(self):
+        """
+        Close connection and end any iteration in progress.
+        """
+
+        self._stopevent.set()
+        self._disconnect()
+
+    def write(self, data: bytes) -> int:
+        """
+        Write bytes to remote host, e.g. a serialized POLL or SET message.
+
+        :param bytes data: data to write
+        :return: number of bytes written
+        :rtype: int
+        :raises: NMEAStreamError if not connected
+        """
+
+        if self._socket is None:
+            raise nme.NMEAStreamError("Not connected.")
+        return self._socket.send(data)
+
+    def reset_metrics(self):
+        """
+        Reset connection metrics.
+        """
+
+        self._metrics = dict.fromkeys(
+            (
+                "connects",
+                "reconnects",
+                "failures",
+                "disconnects",
+                "messages",
+            ),
+            0,
+        )
+        self._metrics.update(
+            dict.fromkeys(("connlatency", "meanlatency", "maxlatency", "downtime"), 0.0)
+        )
+
+    def _reconnect(self) -> bool:
+        """
+        Attempt to (re)connect, with exponential backoff between
+        consecutive failed attempts or unstable connections.
+
+        :return: True if connected, False if retries exhausted or closed
+        :rtype: bool
+        """
+
+        # pylint: disable=logging-fstring-interpolation
+
+        failures = 0
+        start = perf_counter()
+        while not self._stopevent.is_set():
+            if self._attempts:
+                delay = min(self._backoff * 2 ** (self._attempts - 1), self._maxbackoff)
+                if self._stopevent.wait(delay):
+                    break
+            try:
+                self.connect()
+                if self._metrics["connects"] > 1:
+                    self._metrics["downtime"] += perf_counter() - start
+                return True
+            except (OSError, nme.NMEAStreamError) as err:
+                failures += 1
+                self._attempts += 1
+                self._metrics["failures"] += 1
+                self._logger.error(
+                    f"Connection to {self._host}:{self._port} failed: {err}"
+                )
+                if self._retries and failures >= self._retries:
+                    break
+        return False
+
+    def _disconnect(self):
+        """
+        Close socket, if open.
+        """
+
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:  # pragma: no cover
+                pass
+        self._socket = None
+        self._reader = None
+
+    def _http_get(self, sock: socket.socket) -> int:
+        """
+        Send HTTP GET request and read response header.
+
+        :param socket.socket sock: connected socket
+        :return: encoding indicated by response header
+        :rtype: int
+        :raises: NMEAStreamError if response is invalid or unsuccessful
+        """
+
+        headers = {
+            "Host": f"{self._host}:{self._port}",
+            "User-Agent": f"pynmeagps/{__version__}",
+            "Accept": "*/*",
+            "Connection": "keep-alive" if self._keepalive else "close",
+            **self._headers,
+        }
+        request = f"GET {self._path} HTTP/1.1\r\n" + "".join(
+            f"{key}: {val}\r\n" for key, val in headers.items()
+        )
+        sock.sendall(request.encode("ascii") + b"\r\n")
+
+        # read header byte-by-byte so no response body is consumed
+        response = bytearray()
+        while not response.endswith(b"\r\n\r\n"):
+            byte = sock.recv(1)
+            if not byte or len(response) > MAX_HTTPHDR:
+                raise nme.NMEAStreamError("Invalid HTTP response header.")
+            response += byte
+        lines = response.decode("ascii", errors="replace").split("\r\n")
+        status = lines[0].split(" ", 2)
+        if len(status) < 2 or status[1] != "200":
+            raise nme.NMEAStreamError(f"HTTP request failed: {lines[0]}")
+        encoding = ENCODE_NONE
+        for line in lines[1:]:
+            key, _, val = line.partition(":")
+            if key.strip().lower() in ("transfer-encoding", "content-encoding"):
+                for enc in val.split(","):
+                    encoding |= HTTP_ENCODINGS.get(enc.strip().lower(), 0)
+        return encoding
+
+    def _update_latency(self, latency: float):
+        """
+        Update message count and read latency metrics.
+
+        :param float latency: time spent waiting for message in seconds
+        """
+
+        metrics = self._metrics
+        metrics["messages"] += 1
+        mean = metrics["meanlatency"]
+        metrics["meanlatency"] = mean + (latency - mean) / metrics["messages"]
+        metrics["maxlatency"] = max(metrics["maxlatency"], latency)
+
+    @property
+    def metrics(self) -> dict:
+        """
+        Getter for connection metrics. Returns a snapshot dict with
+        the following keys:
+
+        - connects: successful connections
+        - reconnects: successful connections following the first
+        - failures: failed connection attempts
+        - disconnects: connections lost (closed by remote host or timed out)
+        - messages: messages received
+        - connlatency: time taken to establish the latest connection in seconds
+        - meanlatency: mean time spent waiting for each message in seconds
+        - maxlatency: maximum time spent waiting for a message in seconds
+        - downtime: total time spent reconnecting in seconds
+
+        :return: metrics
+        :rtype: dict
+        """
+
+        return dict(self._metrics)
+
+    @property
+    def reader(self) -> NMEAReader | NoneType:
+        """
+        Getter for NMEAReader of current connection.
+
+        :return: NMEAReader, or None if not connected
+        :rtype: NMEAReader | NoneType
+        """
+
+        return self._reader
+
+    @property
+    def connected(self) -> bool:
+        """
+        Getter for connection status.
+
+        :return: True if connected
+        :rtype: bool
+        """
+
+        return self._socket is not None
@@ -0,0 +1,315 @@
+"""
+NMEADatagramReader class.
+
+Reads and parses NMEA sentences from UDP datagrams, e.g. UDP
+broadcast or multicast feeds on marine networks. Each datagram
+may contain several CRLF-terminated sentences, each optionally
+preceded by a TAG block, and may be preceded by an IEC 61162-450
+"UdPbC" header, which is skipped.
+
+Datagrams are received via socket.recvfrom_into() into a single
+reusable buffer and sentences are sliced directly from it. If no
+LF terminator is found within 'maxlen' bytes of a NMEA header, a
+NMEALengthError is raised and the reader resynchronises at the
+next start byte.
+
+Returns the raw data (as bytes), the parsed data (as an
+NMEAMessage object) and the source address of the datagram:
+
+`for raw, parsed, addr in NMEADatagramReader.open(10110):`
+
+Message mode, validation, nmeaonly, error handling, message filter,
+parsing, lazy decoding, field projection, message class, AIS decoding
+and user-defined payload semantics are as for NMEAReader.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments, too-many-instance-attributes
+
+import socket
+import struct
+from collections.abc import Iterable, Iterator
+from types import FunctionType, NoneType
+from typing import Literal
+
+import pynmeagps.exceptions as nme
+from pynmeagps.nmeaais import AISMessage
+from pynmeagps.nmeaframer import NMEA_START, NMEA_START_BYTES, TAG_END_BYTES
+from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeareader import NMEA_ERRORS, NMEAHandler
+from pynmeagps.nmeatypes_core import (
+    ERR_LOG,
+    GET,
+    IEC61162_HDR,
+    MAX_TAGLEN,
+    NMEA_HDR,
+    NMEA_MAXLEN,
+    VALCKSUM,
+)
+
+DEFAULT_DGRAMSIZE = 65535
+"""Default datagram buffer size (maximum UDP payload)"""
+
+
+class NMEADatagramReader(NMEAHandler):
+    """
+    NMEADatagramReader class.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        msgmode: Literal[0, 1, 2] = GET,
+        validate: int = VALCKSUM,
+        quitonerror: Literal[0, 1, 2] = ERR_LOG,
+        errorhandler: FunctionType | NoneType = None,
+        userdefined: dict | NoneType = None,
+        bufsize: int = DEFAULT_DGRAMSIZE,
+        parsing: bool = True,
+        nmeaonly: bool = False,
+        maxlen: int = NMEA_MAXLEN,
+        lazy: bool = False,
+        msgfilter: Iterable[str] | NoneType = None,
+        filterraw: bool = False,
+        decodeais: bool = False,
+        msgclasses: bool = False,
+        fields: dict | NoneType = None,
+    ):
+        """Constructor.
+
+        :param socket.socket sock: bound datagram (UDP) socket
+        :param Literal[0,1,2] msgmode: 0=GET, 1=SET, 2=POLL (0)
+        :param int validate: VALNONE (0), VALCKSUM (1), VALMSGID (2),
+            (can be OR'd) (1)
+        :param Literal[0,1,2] quitonerror: ERR_IGNORE (0) = ignore errors,
+            ERR_LOG (1) = log continue, ERR_RAISE (2) = (re)raise (1)
+        :param FunctionType | NoneType errorhandler: error handling callback function (None)
+        :param dict | NoneType userdefined: user-defined payload definition dictionary (None)
+        :param int bufsize: datagram buffer size; longer datagrams are truncated (65535)
+        :param bool parsing: True = parse sentences, False = return validated raw
+            sentences only, as (raw, None, addr) (True)
+        :param bool nmeaonly: True = error on non-NMEA data, False = ignore non-NMEA data
+        :param int maxlen: maximum NMEA sentence length in bytes; if exceeded, the
+            reader resynchronises at the next start byte, 0 = unbounded (1024)
+        :param bool lazy: decode message attributes on first access (False)
+        :param Iterable[str] | NoneType msgfilter: if specified, only parse sentences
+            whose header (e.g. "GNGGA") or msgID (e.g. "GGA") is in this collection (None)
+        :param bool filterraw: True = return filtered-out sentences as (raw, None, addr),
+            False = skip filtered-out sentences (False)
+        :param bool decodeais: True = reassemble and decode AIS messages in VDM and
+            VDO sentences, returned as (raw, AISMessage, addr) (False)
+        :param bool msgclasses: True = parse standard GET sentences of fixed length
+            using generated message classes (False)
+        :param dict | NoneType fields: if specified, dict of msgID or identity to names of the
+            only attributes to be set for that sentence type
+            e.g. {"GGA": ("time", "lat", "lon", "quality")} (None)
+        :raises: NMEAParseError (if mode is invalid)
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
+
+        super().__init__(
+            msgmode,
+            validate,
+            quitonerror,
+            errorhandler,
+            userdefined,
+            lazy,
+            msgfilter,
+            filterraw,
+            parsing,
+            decodeais,
+            msgclasses,
+            fields,
+        )
+        self._socket = sock
+        self._nmea_only = nmeaonly
+        self._maxlen = maxlen
+        self._buffer = bytearray(bufsize)
+        self._view = memoryview(self._buffer)
+        self._pos = 0  # position of next sentence in current datagram
+        self._end = 0  # length of current datagram
+        self._addr = None  # source address of current datagram
+
+    @classmethod
+    def open(
+        cls,
+        port: int,
+        host: str = "",
+        group: str | NoneType = None,
+        interface: str | NoneType = None,
+        timeout: float | NoneType = None,
+        **kwargs,
+    ):
+        """
+        Open UDP socket bound to specified port, optionally joining
+        a multicast group, and return NMEADatagramReader for it.
+
+        :param int port: UDP port
+        :param str host: local address to bind to, "" = all interfaces ("")
+        :param str | NoneType group: IPv4 multicast group address to join (None)
+        :param str | NoneType interface: local interface address on which to join
+            multicast group, None = any interface (None)
+        :param float | NoneType timeout: socket timeout in seconds; iteration ends if
+            no datagram is received within this time, None = blocking (None)
+        :param kwargs: optional NMEADatagramReader keyword arguments
+        :return: NMEADatagramReader instance
+        :rtype: NMEADatagramReader
+        """
+        # pylint: disable=too-many-arguments
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((host, port))
+            if group is not None:
+                if interface is None:
+                    mreq = struct.pack(
+                        "=4sL", socket.inet_aton(group), socket.INADDR_ANY
+                    )
+                else:
+                    mreq = socket.inet_aton(group) + socket.inet_aton(interface)
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+            sock.settimeout(timeout)
+        except OSError:
+            sock.close()
+            raise
+        return cls(sock, **kwargs)
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def __iter__(
+        self,
+    ) -> Iterator[tuple[bytes, NMEAMessage | AISMessage | NoneType, tuple]]:
+        """
+        Iterate over NMEA messages until socket times out or is closed.
+
+        :return: iterator of (raw_data as bytes, parsed_data as NMEAMessage
+            or AISMessage, source address)
+        :rtype: Iterator[tuple[bytes, NMEAMessage | AISMessage | NoneType, tuple]]
+        """
+
+        while True:
+            raw_data, parsed_data, addr = self.read()
+            if raw_data is None:
+                return
+            yield raw_data, parsed_data, addr
+
+    def read(
+        self,
+    ) -> tuple[bytes | NoneType, NMEAMessage | AISMessage | NoneType, tuple | NoneType]:
+        """
+        Read next NMEA sentence, receiving a new datagram when
+        all sentences in the current datagram have been read.
+
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage or
+            AISMessage, source address), or (None, None, None) if socket
+            times out or is closed
+        :rtype: tuple[bytes | NoneType, NMEAMessage | AISMessage | NoneType,
+            tuple | NoneType]
+        """
+
+        while True:
+            try:
+                raw_data = self._next_sentence()
+                if raw_data is None:
+                    return (None, None, None)
+                result = self._handle(raw_data)
+            except NMEA_ERRORS as err:
+                if self._quitonerror:
+                    self._do_error(err)
+                continue
+            if result is not None:
+                return (result[0], result[1], self._addr)
+
+    def _next_sentence(self) -> bytes | NoneType:
+        """
+        Return next sentence (including any TAG block) in current datagram,
+        discarding any non-NMEA data. A sentence which is not CRLF-terminated
+        is terminated by the end of the datagram.
+
+        :return: raw NMEA sentence, or None if socket times out or is closed
+        :rtype: bytes | NoneType
+        :raises: NMEAHeaderError (if nmeaonly=True and datagram includes non-NMEA data)
+        :raises: NMEALengthError (if sentence exceeds maximum length)
+        """
+
+        buf = self._buffer
+        while True:
+            if self._pos >= self._end:
+                try:
+                    self._end, self._addr = self._socket.recvfrom_into(buf)
+                except (OSError, TimeoutError):
+                    return None
+                self._pos = 0
+                if self._end >= len(IEC61162_HDR) and buf.startswith(IEC61162_HDR):
+                    self._pos = len(IEC61162_HDR)
+            end = self._end
+            match = NMEA_START_BYTES.search(buf, self._pos, end)
+            if match is None:
+                self._pos = end
+                continue
+            start = hdr = match.start()
+            if buf[start] == 0x5C:  # possible TAG block
+                match = TAG_END_BYTES.search(
+                    buf, start + 1, min(start + MAX_TAGLEN, end)
+                )
+                if match is None or buf[match.start()] != 0x5C:  # not a TAG block
+                    self._pos = start + 1
+                    continue
+                hdr = match.start() + 1
+                if hdr >= end or buf[hdr] not in NMEA_START:
+                    self._pos = hdr - 1  # no sentence, resync at closing backslash
+                    continue
+            bytehdr = bytes(buf[hdr : hdr + 2])
+            if bytehdr not in NMEA_HDR:  # not NMEA, discard start byte and continue
+                self._pos = hdr + 1
+                if self._nmea_only:
+                    raise nme.NMEAHeaderError(f"Unknown protocol header {bytehdr}.")
+                continue
+            # maximum length excludes TAG block
+            limit = hdr + self._maxlen if self._maxlen else end
+            lfpos = buf.find(b"\x0a", hdr + 2, min(limit, end))
+            if lfpos == -1:
+                if limit < end:  # no terminator within maximum length
+                    self._pos = hdr + 1
+                    raise nme.NMEALengthError(
+                        f"Sentence exceeds maximum length {self._maxlen} bytes."
+                    )
+                lfpos = end - 1  # terminated by end of datagram
+            self._pos = lfpos + 1
+            return bytes(self._view[start : lfpos + 1])
+
+    def close(self):
+        """
+        Close socket.
+        """
+
+        self._socket.close()
+
+    @property
+    def datastream(self) -> socket.socket:
+        """
+        Getter for socket.
+
+        :return: datagram socket
+        :rtype: socket.socket
+        """
+
+        return self._socket
@@ -0,0 +1,185 @@
+"""
+NMEAFileReader class.
+
+Reads and parses NMEA GNSS/GPS messages from a binary log file
+via a read-only memory map, framing sentences directly over the
+mapped data rather than copying it through a stream buffer.
+
+Implements an iterator and context manager:
+
+`with NMEAFileReader("nmeadata.log") as nmr:`
+`    for raw, parsed in nmr:`
+
+If the 'copyraw' kwarg is set to 'False', the raw data is
+returned as a zero-copy memoryview slice of the mapped file,
+which remains valid until the reader is closed. Use bytes(raw)
+to retain a copy of the raw data beyond this point.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments
+
+import mmap
+from collections.abc import Iterable
+from types import FunctionType, NoneType
+from typing import Literal
+
+from pynmeagps.nmeaframer import NMEAFramer
+from pynmeagps.nmeareader import NMEAReader
+from pynmeagps.nmeatypes_core import ERR_LOG, GET, NMEA_MAXLEN, VALCKSUM
+
+
+class NMEAFileReader(NMEAReader):
+    """
+    NMEAFileReader class.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        msgmode: Literal[0, 1, 2] = GET,
+        validate: int = VALCKSUM,
+        nmeaonly: bool = False,
+        quitonerror: Literal[0, 1, 2] = ERR_LOG,
+        errorhandler: FunctionType | NoneType = None,
+        userdefined: dict | NoneType = None,
+        copyraw: bool = True,
+        lazy: bool = False,
+        msgfilter: Iterable[str] | NoneType = None,
+        filterraw: bool = False,
+        parsing: bool = True,
+        binaryhandler: FunctionType | NoneType = None,
+        maxlen: int = NMEA_MAXLEN,
+        decodeais: bool = False,
+        msgclasses: bool = False,
+        fields: dict | NoneType = None,
+    ):
+        """Constructor.
+
+        :param str filename: path to binary NMEA log file
+        :param Literal[0,1,2] msgmode: 0=GET, 1=SET, 2=POLL (0)
+        :param int validate: VALNONE (0), VALCKSUM (1), VALMSGID (2),
+            (can be OR'd) (1)
+        :param bool nmeaonly: True = error on non-NMEA data, False = ignore non-NMEA data
+        :param Literal[0,1,2] quitonerror: ERR_IGNORE (0) = ignore errors,
+            ERR_LOG (1) = log continue, ERR_RAISE (2) = (re)raise (1)
+        :param FunctionType | NoneType errorhandler: error handling callback function (None)
+        :param dict | NoneType userdefined: user-defined payload definition dictionary (None)
+        :param bool copyraw: True = return raw data as bytes, False = return raw data
+            as memoryview of mapped file (True)
+        :param bool lazy: decode message attributes on first access (False)
+        :param Iterable[str] | NoneType msgfilter: if specified, only parse sentences
+            whose header (e.g. "GNGGA") or msgID (e.g. "GGA") is in this collection (None)
+        :param bool filterraw: True = return filtered-out sentences as (raw, None),
+            False = skip filtered-out sentences (False)
+        :param bool parsing: True = parse sentences, False = return validated raw
+            sentences only, as (raw, None) (True)
+        :param FunctionType | NoneType binaryhandler: callback function which is
+            passed any skipped UBX or RTCM3 frame as bytes (None)
+        :param int maxlen: maximum NMEA sentence length in bytes; if exceeded, the
+            reader resynchronises at the next start byte, 0 = unbounded (1024)
+        :param bool decodeais: True = reassemble and decode AIS messages in VDM and
+            VDO sentences, returned as (raw, AISMessage), where raw comprises all
+            sentences of the message (False)
+        :param bool msgclasses: True = parse standard GET sentences of fixed length
+            using generated message classes (False)
+        :param dict | NoneType fields: if specified, dict of msgID or identity to names of the
+            only attributes to be set for that sentence type
+            e.g. {"GGA": ("time", "lat", "lon", "quality")} (None)
+        :raises: NMEAParseError (if mode is invalid)
+        """
+        # pylint: disable=too-many-arguments, too-many-locals, consider-using-with
+
+        stream = open(filename, "rb")
+        super().__init__(
+            stream,
+            msgmode=msgmode,
+            validate=validate,
+            nmeaonly=nmeaonly,
+            quitonerror=quitonerror,
+            errorhandler=errorhandler,
+            userdefined=userdefined,
+            lazy=lazy,
+            msgfilter=msgfilter,
+            filterraw=filterraw,
+            parsing=parsing,
+            binaryhandler=binaryhandler,
+            maxlen=maxlen,
+            decodeais=decodeais,
+            msgclasses=msgclasses,
+            fields=fields,
+        )
+        self._copyraw = copyraw
+        try:
+            self._mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file cannot be mapped
+            self._mmap = None
+            self._view = None
+            return
+        if hasattr(self._mmap, "madvise"):  # not available on all platforms
+            self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+        self._view = memoryview(self._mmap)
+        self._framer = NMEAFramer(
+            nmeaonly=nmeaonly,
+            buffer=self._mmap,
+            binaryhandler=binaryhandler,
+            maxlen=maxlen,
+        )
+        self._framer.set_eof()  # entire file is already mapped
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def close(self):
+        """
+        Release memory map and close underlying file.
+
+        NB: if any memoryview slices of raw data are still
+        referenced, the memory map will remain open until they
+        are released.
+        """
+
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            try:
+                self._mmap.close()
+            except BufferError:  # exported raw data slices still in use
+                pass
+        self._stream.close()
+
+    def _read_frame(self) -> bytes | memoryview:
+        """
+        Frame next NMEA sentence directly from memory-mapped file,
+        discarding any non-NMEA data.
+
+        :return: raw NMEA sentence
+        :rtype: bytes | memoryview
+        :raises: EOFError if end of file reached
+        :raises: NMEAParseError (if nmeaonly=True and file includes non-NMEA data)
+        """
+
+        if self._view is None:
+            raise EOFError()
+        span = self._framer.next_span()
+        if span is None:  # end of file (or truncated final sentence)
+            raise EOFError()
+        if self._copyraw:
+            return self._mmap[span[0] : span[1]]
+        return self._view[span[0] : span[1]]
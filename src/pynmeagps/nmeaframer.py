@@ -0,0 +1,349 @@
+"""
+NMEAFramer class.
+
+Frames raw NMEA sentences from an internal buffer which is
+populated by the caller via the feed() method. Performs no I/O
+and no parsing, other than optional checksum validation.
+
+Any data preceding a valid NMEA header is discarded. If the
+'nmeaonly' kwarg is set to 'True', the framer will raise a
+NMEAParseError if it encounters an invalid NMEA header.
+Otherwise, any UBX or RTCM3 binary frames with valid checksums
+are skipped in their entirety using their declared payload
+length, and optionally passed to a 'binaryhandler' callback.
+
+Any IEC 61162-450 / NMEA 4.x TAG block immediately preceding a NMEA
+sentence (e.g. b"\\s:GP0001*5F\\$GPGGA,...") is returned as part of
+the sentence.
+
+If no LF terminator is found within 'maxlen' bytes of a NMEA
+header, the framer raises a NMEAStreamError and resynchronises
+at the next start byte, bounding both latency and buffer growth.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-instance-attributes
+
+import re
+from types import FunctionType, NoneType
+
+import pynmeagps.exceptions as nme
+from pynmeagps.nmeahelpers import calc_crc24q, calc_ubx_checksum, verify_checksum
+from pynmeagps.nmeatypes_core import (
+    MAX_TAGLEN,
+    NMEA_HDR,
+    NMEA_MAXLEN,
+    RTCM3_HDR,
+    UBX_HDR,
+    VALCKSUM,
+    VALNONE,
+)
+
+# start byte of NMEA sentence, TAG block, UBX frame or RTCM3 frame
+START_BYTES = re.compile(rb"[\x24\x21\x5c\xb5\xd3]")
+# start byte of NMEA sentence or TAG block
+NMEA_START_BYTES = re.compile(rb"[\x24\x21\x5c]")
+# byte terminating TAG block, or indicating it is not a TAG block
+TAG_END_BYTES = re.compile(rb"[\x5c\x24\x21\x0a]")
+# start byte of NMEA parametric ($) or encapsulation (!) sentence
+NMEA_START = (0x24, 0x21)
+
+
+class NMEAFramer:
+    """
+    NMEAFramer class.
+    """
+
+    def __init__(
+        self,
+        nmeaonly: bool = False,
+        buffer: object = None,
+        binaryhandler: FunctionType | NoneType = None,
+        maxlen: int = NMEA_MAXLEN,
+    ):
+        """Constructor.
+
+        :param bool nmeaonly: True = error on non-NMEA data, False = ignore non-NMEA data
+        :param object buffer: optional initial buffer - any object supporting
+            find() and slicing e.g. bytearray or mmap (None)
+        :param FunctionType | NoneType binaryhandler: callback function which is
+            passed any skipped UBX or RTCM3 frame as bytes (None)
+        :param int maxlen: maximum NMEA sentence length in bytes, 0 = unbounded (1024)
+        """
+
+        self._nmea_only = nmeaonly
+        self._buffer = bytearray() if buffer is None else buffer
+        self._binaryhandler = binaryhandler
+        self._maxlen = maxlen
+        self._pos = 0  # current framing position in buffer
+        self._discarded = 0  # number of non-NMEA bytes discarded
+        self._badheaders = 0  # number of non-NMEA headers seen
+        self._binframes = 0  # number of binary frames skipped
+        self._eof = False  # no further data will be fed
+
+    def feed(self, data: bytes):
+        """
+        Append data to buffer, discarding any data already framed.
+
+        :param bytes data: data (which may include partial sentences)
+        """
+
+        if self._pos:
+            del self._buffer[: self._pos]
+            self._pos = 0
+        self._buffer += data
+        self._eof = False
+
+    def set_eof(self):
+        """
+        Indicate that no further data will be fed (until the next call
+        to feed()), so that any incomplete binary frame in the buffer is
+        treated as invalid and framing resumes from the following byte.
+        """
+
+        self._eof = True
+
+    def next_frame(self, validate: int = VALNONE) -> bytes | NoneType:
+        """
+        Return next complete NMEA sentence from buffer.
+
+        If validate includes VALCKSUM and the sentence checksum is invalid,
+        the sentence is discarded and an NMEAParseError raised.
+
+        :param int validate: VALNONE (0), VALCKSUM (1) (0)
+        :return: raw NMEA sentence, or None if no complete sentence in buffer
+        :rtype: bytes | NoneType
+        :raises: NMEAParseError (if nmeaonly=True and buffer includes non-NMEA data,
+            or checksum is invalid)
+        :raises: NMEALengthError (if sentence exceeds maximum length)
+        """
+
+        span = self.next_span()
+        if span is None:
+            return None
+        raw_data = bytes(self._buffer[span[0] : span[1]])
+        if validate & VALCKSUM:
+            verify_checksum(raw_data)
+        return raw_data
+
+    def next_span(self) -> tuple[int, int] | NoneType:
+        """
+        Return buffer offsets of next complete NMEA sentence. Offsets
+        remain valid until the next call to feed().
+
+        :return: tuple of (start, end) offsets, or None if no complete
+            sentence in buffer
+        :rtype: tuple[int, int] | NoneType
+        :raises: NMEAHeaderError (if nmeaonly=True and buffer includes non-NMEA data)
+        :raises: NMEALengthError (if sentence exceeds maximum length)
+        """
+
+        buf = self._buffer
+        while True:
+            match = (NMEA_START_BYTES if self._nmea_only else START_BYTES).search(
+                buf, self._pos
+            )
+            start = -1 if match is None else match.start()
+            if start == -1:  # no start byte, discard buffer contents
+                self._discarded += len(buf) - self._pos
+                self._pos = len(buf)
+                return None
+            self._discarded += start - self._pos
+            self._pos = start
+            hdr = start
+            if buf[start] == 0x5C:  # possible TAG block
+                hdr = self._skip_tagblock(start)
+                if hdr is None:  # incomplete TAG block
+                    return None
+                if hdr == -1:  # not a TAG block
+                    continue
+            elif buf[start] not in NMEA_START:  # possible UBX or RTCM3 frame
+                if self._skip_binary(start) is None:  # incomplete frame
+                    return None
+                continue
+            if hdr + 1 >= len(buf):  # need 2nd byte to confirm protocol
+                return None
+            bytehdr = bytes(buf[hdr : hdr + 2])
+            if bytehdr not in NMEA_HDR:  # not NMEA, discard start byte and continue
+                self._discarded += hdr + 1 - start
+                self._pos = hdr + 1
+                self._badheaders += 1
+                if self._nmea_only:  # raise error and quit
+                    raise nme.NMEAHeaderError(f"Unknown protocol header {bytehdr}.")
+                continue
+            # NMEA protocol is CRLF terminated, maximum length excludes TAG block
+            limit = hdr + self._maxlen if self._maxlen else len(buf)
+            end = buf.find(b"\x0a", hdr + 2, limit)
+            if end == -1:
+                if not self._maxlen or limit > len(buf):  # incomplete sentence
+                    return None
+                # no terminator within maximum length, resync at next start byte
+                self._pos = hdr + 1
+                self._discarded += hdr + 1 - start
+                raise nme.NMEALengthError(
+                    f"Sentence exceeds maximum length {self._maxlen} bytes."
+                )
+            self._pos = end + 1
+            return (start, end + 1)
+
+    def _skip_tagblock(self, start: int) -> int | NoneType:
+        """
+        Locate end of possible TAG block (e.g. b"\\s:GP0001*5F\\") at start
+        of buffer. If the data is not a TAG block, the start byte is
+        discarded. If no sentence follows, the data up to the closing
+        backslash is discarded, as it may itself start a TAG block.
+
+        :param int start: buffer offset of initial backslash
+        :return: buffer offset of following NMEA header, None if TAG block
+            is incomplete, or -1 if not a TAG block
+        :rtype: int | NoneType
+        """
+
+        buf = self._buffer
+        limit = min(start + MAX_TAGLEN, len(buf))
+        match = TAG_END_BYTES.search(buf, start + 1, limit)
+        if match is None and len(buf) < start + MAX_TAGLEN:
+            return None
+        if match is None or buf[match.start()] != 0x5C:
+            self._pos = start + 1
+            self._discarded += 1
+            return -1
+        hdr = match.start() + 1
+        if hdr >= len(buf):  # need next byte to confirm sentence follows
+            return None
+        if buf[hdr] not in NMEA_START:  # no sentence, resync at last backslash
+            self._pos = hdr - 1
+            self._discarded += hdr - 1 - start
+            return -1
+        return hdr
+
+    def _skip_binary(self, start: int) -> bool | NoneType:
+        """
+        Skip UBX or RTCM3 frame starting at buffer offset, if it
+        is complete and its checksum is valid. Otherwise discard
+        the start byte.
+
+        :param int start: buffer offset of start byte
+        :return: True if frame skipped, False if start byte discarded,
+            None if frame is incomplete
+        :rtype: bool | NoneType
+        """
+
+        buf = self._buffer
+        hdrlen = 6 if buf[start] == UBX_HDR[0] else 3
+        length = self.binary_length(bytes(buf[start : start + hdrlen]))
+        if start + (hdrlen if length is None else length) > len(buf):
+            if not self._eof:  # wait for rest of frame
+                return None
+        elif length is not None:
+            frame = bytes(buf[start : start + length])
+            if self.binary_valid(frame):
+                self._pos = start + length
+                self._discarded += length
+                self._binframes += 1
+                if self._binaryhandler is not None:
+                    self._binaryhandler(frame)
+                return True
+        self._pos = start + 1
+        self._discarded += 1
+        return False
+
+    @staticmethod
+    def binary_length(hdr: bytes) -> int | NoneType:
+        """
+        Get total length of UBX or RTCM3 frame from its header.
+
+        :param bytes hdr: frame header (6 bytes for UBX, 3 bytes for RTCM3)
+        :return: frame length including header and checksum, or None if
+            header is not a valid UBX or RTCM3 header
+        :rtype: int | NoneType
+        """
+
+        if hdr[0:2] == UBX_HDR and len(hdr) >= 6:
+            return 8 + int.from_bytes(hdr[4:6], "little")
+        if hdr[0:1] == RTCM3_HDR and len(hdr) >= 3 and not hdr[1] & 0xFC:
+            return 6 + ((hdr[1] & 0x03) << 8 | hdr[2])
+        return None
+
+    @staticmethod
+    def binary_valid(frame: bytes) -> bool:
+        """
+        Validate checksum of complete UBX or RTCM3 frame.
+
+        :param bytes frame: complete frame
+        :return: True if checksum is valid, False if not
+        :rtype: bool
+        """
+
+        if frame[0:2] == UBX_HDR:
+            return calc_ubx_checksum(frame[2:-2]) == frame[-2:]
+        return calc_crc24q(frame) == 0
+
+    def reset_counts(self):
+        """
+        Reset discarded byte, non-NMEA header and binary frame counts to zero.
+        """
+
+        self._discarded = 0
+        self._badheaders = 0
+        self._binframes = 0
+
+    @property
+    def discarded(self) -> int:
+        """
+        Getter for number of non-NMEA bytes discarded.
+
+        :return: number of bytes
+        :rtype: int
+        """
+
+        return self._discarded
+
+    @property
+    def badheaders(self) -> int:
+        """
+        Getter for number of non-NMEA headers seen.
+
+        :return: number of headers
+        :rtype: int
+        """
+
+        return self._badheaders
+
+    @property
+    def binframes(self) -> int:
+        """
+        Getter for number of UBX or RTCM3 frames skipped.
+
+        :return: number of frames
+        :rtype: int
+        """
+
+        return self._binframes
+
+    @property
+    def eof(self) -> bool:
+        """
+        Getter for end of data indicator.
+
+        :return: True if set_eof() has been called since last feed()
+        :rtype: bool
+        """
+
+        return self._eof
+
+    @property
+    def in_waiting(self) -> int:
+        """
+        Getter for number of unframed bytes in buffer.
+
+        :return: number of bytes
+        :rtype: int
+        """
+
+        return len(self._buffer) - self._pos
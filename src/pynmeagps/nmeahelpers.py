@@ -9,10 +9,12 @@ Created on 04 Mar 2021
 :license: BSD 3-Clause
 """
 
-# pylint: disable=invalid-name
+# pylint: disable=invalid-name, too-many-lines
 
 import re
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from itertools import accumulate
 from math import acos, asin, atan2, cos, floor, pi, sin, sqrt
 from types import NoneType
 from typing import Literal
@@ -35,11 +37,14 @@ from pynmeagps.nmeatypes_core import (
     LN,
     NMEA_MSGIDS,
     NMEA_MSGIDS_PROP,
+    TAG_INTS,
     WGS84,
     WGS84_FLATTENING,
     WGS84_SMAJ_AXIS,
 )
 
+TIMECACHE_SIZE = 256
+"""Maximum number of NMEA time and date strings cached by time2utc and date2utc"""
 KNOTSCONV = {"MS": 0.5144447324, "FS": 1.68781084, "MPH": 1.15078, "KMPH": 1.852001}
 LEAPS0 = datetime(1900, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
 LEAPSECONDS = [
@@ -79,6 +84,29 @@ File expires on: 28 December 2026
 """
 
 
+def _crc24q_table() -> list:
+    """
+    Generate CRC24Q lookup table.
+
+    :return: list of 256 CRC values
+    :rtype: list
+    """
+
+    table = []
+    for i in range(256):
+        crc = i << 16
+        for _ in range(8):
+            crc <<= 1
+            if crc & 0x1000000:
+                crc ^= 0x1864CFB  # CRC24Q polynomial
+        table.append(crc & 0xFFFFFF)
+    return table
+
+
+CRC24Q_TABLE = _crc24q_table()
+"""CRC24Q lookup table"""
+
+
 def area(
     lat1: float,
     lon1: float,
@@ -138,6 +166,39 @@ def calc_checksum(content: str) -> str:
     return f"{cksum:02X}"
 
 
+def calc_crc24q(message: bytes) -> int:
+    """
+    Perform CRC24Q cyclic redundancy check on RTCM3 message.
+
+    If the message includes the appended CRC bytes, the
+    function will return 0 if the message is valid.
+
+    :param bytes message: message
+    :return: CRC or 0
+    :rtype: int
+    """
+
+    crc = 0
+    table = CRC24Q_TABLE
+    for byte in message:
+        crc = ((crc << 8) & 0xFFFFFF) ^ table[(crc >> 16) ^ byte]
+    return crc
+
+
+def calc_ubx_checksum(content: bytes) -> bytes:
+    """
+    Calculate 8-bit Fletcher checksum for UBX message.
+
+    :param bytes content: message content, excluding header and checksum bytes
+    :return: checksum as 2 bytes
+    :rtype: bytes
+    """
+
+    cka = sum(content) & 0xFF
+    ckb = sum(accumulate(content)) & 0xFF
+    return bytes((cka, ckb))
+
+
 def date2str(dat: datetime.date, form: Literal["DT", "DTL", "DM"] = DT) -> str:
     """
     Convert datetime.date to NMEA formatted string.
@@ -165,6 +226,10 @@ def date2utc(dates: str, form: Literal["DT", "DTL", "DM"] = DT) -> datetime.date
     """
     Convert NMEA Date to UTC datetime.
 
+    Fixed-width dates are parsed digit by digit, with results for the
+    most recent TIMECACHE_SIZE dates cached; any other format is parsed
+    via strptime.
+
     :param str dates: NMEA date
     :param Literal["DT","DTL","DM"] form: date format DT = ddmmyy, DTL = ddmmyyyy,
         DM = mmddyy (DT)
@@ -173,15 +238,41 @@ def date2utc(dates: str, form: Literal["DT", "DTL", "DM"] = DT) -> datetime.date
     """
 
     try:
-        if form == "DM":
+        return _date2utc(dates, form)
+    except TypeError:  # unhashable
+        return ""
+
+
+@lru_cache(maxsize=TIMECACHE_SIZE)
+def _date2utc(dates: str, form: str) -> date | str:
+    """
+    Convert NMEA Date to UTC date (cached).
+
+    :param str dates: NMEA date
+    :param str form: date format DT = ddmmyy, DTL = ddmmyyyy, DM = mmddyy
+    :return: UTC date or "" if invalid
+    :rtype: datetime.date | str
+    """
+
+    try:
+        if len(dates) == (8 if form == DTL else 6) and dates.isascii():
+            if dates.isdecimal():
+                if form == DTL:
+                    return date(int(dates[4:8]), int(dates[2:4]), int(dates[0:2]))
+                year = int(dates[4:6])
+                year += 1900 if year >= 69 else 2000  # as strptime %y
+                if form == DM:
+                    return date(year, int(dates[0:2]), int(dates[2:4]))
+                return date(year, int(dates[2:4]), int(dates[0:2]))
+        if form == DM:
             dform = "%m%d%y"
-        elif form == "DTL":
+        elif form == DTL:
             dform = "%d%m%Y"
         else:
             dform = "%d%m%y"
         utc = datetime.strptime(dates, dform)
         return utc.date()
-    except (TypeError, ValueError):
+    except (AttributeError, TypeError, ValueError):
         return ""
 
 
@@ -427,16 +518,16 @@ def get_parts(message: object) -> tuple:
     """
     Get content, talker, msgid, payload and checksum of raw NMEA message.
 
-    :param object message: entire message as bytes or string
+    :param object message: entire message as bytes, bytes-like object or string
     :return: tuple of (content, talker, msgID, payload as list, checksum)
     :rtype: tuple
     :raises: NMEAMessageError (if message is badly formed)
     """
 
     try:
-        if isinstance(message, bytes):
-            message = message.decode("utf-8")
-        content, cksum = message.strip("$\r\n").split("*", 1)
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            message = str(message, "utf-8")
+        content, cksum = message.strip("$!\r\n").split("*", 1)
         hdr, *payload = content.split(",")
         s = 1 if hdr[:1] == "P" else 2
         talker, msgid = hdr[:s], hdr[s:]
@@ -445,6 +536,39 @@ def get_parts(message: object) -> tuple:
         raise nme.NMEAMessageError(f"Badly formed message {message}") from err
 
 
+def get_tagblock(message: object, validate: bool = True) -> tuple:
+    """
+    Split leading IEC 61162-450 / NMEA 4.x TAG block from raw NMEA message,
+    e.g. b"\\s:GP0001,c:1577836800*2B\\$GPGGA,...". Source time (c), line
+    count (n) and relative time (r) parameters are returned as integers,
+    all others as strings.
+
+    :param object message: entire message as bytes or bytes-like object
+    :param bool validate: verify TAG block checksum (True)
+    :return: tuple of (TAG block parameters as dict, remaining message as bytes)
+    :rtype: tuple
+    :raises: NMEAMessageError (if TAG block is badly formed)
+    :raises: NMEAChecksumError (if TAG block checksum is invalid)
+    """
+
+    message = bytes(message)
+    end = message.find(b"\x5c", 1)
+    if message[:1] != b"\x5c" or end == -1:
+        raise nme.NMEAMessageError(f"Badly formed TAG block {message}")
+    content, _, cksum = str(message[1:end], "utf-8", "replace").partition("*")
+    if validate:
+        ccksum = calc_checksum(content)
+        if cksum.upper() != ccksum:
+            raise nme.NMEAChecksumError(
+                f"TAG block invalid checksum {cksum} - should be {ccksum}."
+            )
+    tagblock = {}
+    for param in content.split(","):
+        key, _, val = param.partition(":")
+        tagblock[key] = int(val) if key in TAG_INTS and val.isdecimal() else val
+    return tagblock, message[end + 1 :]
+
+
 def groupsize(**kwargs) -> int:
     """
     Get number of grouped items in generated payload arguments.
@@ -698,6 +822,22 @@ def planar(
     return dist
 
 
+def tagblock2str(tagblock: dict) -> str:
+    """
+    Convert dict of TAG block parameters to IEC 61162-450 / NMEA 4.x
+    TAG block string, including checksum and delimiters.
+
+    :param dict tagblock: TAG block parameters e.g. {"s": "GP0001", "c": 1577836800}
+    :return: TAG block e.g. "\\s:GP0001,c:1577836800*2B\\", or "" if empty
+    :rtype: str
+    """
+
+    if not tagblock:
+        return ""
+    content = ",".join(f"{key}:{val}" for key, val in tagblock.items())
+    return f"\\{content}*{calc_checksum(content)}\\"
+
+
 def time2str(tim: datetime) -> str:
     """
     Convert datetime.time to NMEA formatted string.
@@ -717,17 +857,46 @@ def time2utc(times: str) -> datetime | str:
     """
     Convert NMEA Time to UTC datetime.
 
+    Fixed-width times are parsed digit by digit, with results for the
+    most recent TIMECACHE_SIZE times cached; any other format is parsed
+    via strptime.
+
     :param str times: NMEA time hhmmss.ss
     :return: UTC time hh:mm:ss.ss or "" if invalid
     :rtype: datetime.time | str
     """
 
     try:
+        return _time2utc(times)
+    except TypeError:  # unhashable
+        return ""
+
+
+@lru_cache(maxsize=TIMECACHE_SIZE)
+def _time2utc(times: str) -> time | str:
+    """
+    Convert NMEA Time to UTC time (cached).
+
+    :param str times: NMEA time hhmmss.ss
+    :return: UTC time or "" if invalid
+    :rtype: datetime.time | str
+    """
+
+    try:
+        hms, _, frac = times.partition(".")
+        if len(hms) == 6 and len(frac) <= 6 and times.isascii() and hms.isdecimal():
+            if frac.isdecimal() or len(times) == 6:  # decimal seconds may be omitted
+                return time(
+                    int(hms[0:2]),
+                    int(hms[2:4]),
+                    int(hms[4:6]),
+                    int(frac.ljust(6, "0")) if frac else 0,
+                )
         if len(times) == 6:  # decimal seconds is omitted
             times = times + ".00"
         utc = datetime.strptime(times, "%H%M%S.%f")
         return utc.time()
-    except (TypeError, ValueError):
+    except (AttributeError, TypeError, ValueError):
         return ""
 
 
@@ -780,6 +949,36 @@ def utc2wnotow(
     return wnom if modwno else wno, tow, ls
 
 
+def verify_checksum(message: bytes):
+    """
+    Verify checksum of raw NMEA sentence in bytes, without decoding
+    or otherwise parsing the sentence.
+
+    :param bytes message: entire message as bytes or bytes-like object, which
+        may include a leading TAG block
+    :raises: NMEAChecksumError (if checksum is missing or invalid)
+    """
+
+    message = bytes(message)
+    if message[:1] == b"\x5c":  # verify and strip TAG block
+        try:
+            _, message = get_tagblock(message)
+        except nme.NMEAMessageError as err:
+            raise nme.NMEAParseError(err) from err
+    star = message.rfind(b"*")
+    cksum = 0
+    for byte in message[1:star]:
+        cksum ^= byte
+    ccksum = f"{cksum:02X}"
+    checksum = message[star + 1 : star + 3]
+    if star == -1 or checksum.upper() != ccksum.encode():
+        hdr = str(message[1:].split(b",", 1)[0], "utf-8", "replace")
+        raise nme.NMEAChecksumError(
+            f"Message {hdr} invalid checksum {str(checksum, 'utf-8', 'replace')}"
+            f" - should be {ccksum}."
+        )
+
+
 def wnotow2utc(
     wno: int,
     tow: int,
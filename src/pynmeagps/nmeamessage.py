@@ -9,11 +9,13 @@ Created on 04 Mar 2021
 """
 
 # pylint: disable=invalid-name, too-many-instance-attributes, too-many-positional-arguments
+# pylint: disable=too-many-lines, no-member
 
 import struct
+from collections.abc import Iterable
 from datetime import datetime, timezone
-from logging import getLogger
-from types import NoneType
+from functools import partial
+from types import FunctionType, NoneType
 from typing import Any, Literal
 
 import pynmeagps.exceptions as nme
@@ -31,14 +33,327 @@ from pynmeagps.nmeahelpers import (
     dmm2ddd,
     generate_checksum,
     groupsize,
+    tagblock2str,
     time2str,
     time2utc,
 )
 
+PLAN_CACHE_SIZE = 1024
+"""Maximum number of compiled payload plans retained"""
+
+_PLANS = {}  # (id(pdict), len(payload)): (pdict, plan)
+
+SCHEMA_CACHE_SIZE = 1024
+"""Maximum number of resolved sentence headers retained"""
+
+_SCHEMAS = {}  # (msgmode, talker, msgID[, msgId]): (talker valid, defsource, pdict)
+
+_ATTRIBUTES = set()  # names of payload attributes with NMEAMessage descriptors
+
+_UNDECODED = object()  # placeholder for lazily-decoded attribute value
+
+
+def _payload_attribute(name: str) -> property:
+    """
+    Create descriptor for named payload attribute, which retrieves the
+    value from the message's values sequence via its field-index map.
+
+    :param str name: attribute name e.g. "lat" or "svid_03"
+    :return: attribute descriptor
+    :rtype: property
+    """
+
+    def fget(self) -> Any:
+        # pylint: disable=protected-access
+        try:
+            val = self._values[self._index[name]]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+        if val is _UNDECODED:
+            val = self._decode(name)
+        return val
+
+    return property(fget, doc=f"Payload attribute {name}.")
+
+
+def _add_attributes(names: Iterable[str]):
+    """
+    Add descriptors to NMEAMessage class for any new payload attribute names.
+
+    :param Iterable[str] names: attribute names
+    :raises: NMEAMessageError if name clashes with NMEAMessage attribute
+    """
+
+    for name in names:
+        if name in _ATTRIBUTES:
+            continue
+        if name in _RESERVED:
+            raise nme.NMEAMessageError(f"Invalid payload attribute name {name}.")
+        setattr(NMEAMessage, name, _payload_attribute(name))
+        _ATTRIBUTES.add(name)
+
+
+def _schema_key(
+    talker: str, msgID: str, msgmode: int, payload: list
+) -> tuple | NoneType:
+    """
+    Get key under which the resolved payload definition for a streamed
+    sentence header is cached, or None if the definition depends on
+    more than the header (e.g. Quectel PQTM and PSTMDRSENMSG variants,
+    PASHR).
+
+    :param str talker: message talker e.g. "GP" or "P"
+    :param str msgID: message ID e.g. "GGA"
+    :param int msgmode: mode (0=GET, 1=SET, 2=POLL)
+    :param list payload: payload as list of strings
+    :return: cache key, or None if not cacheable
+    :rtype: tuple | NoneType
+    """
+
+    if msgID in nmt.NMEA_PREFIX_PROP:  # proprietary, first element is msgId
+        if msgID == "ASHR" or not payload or not isinstance(payload[0], str):
+            return None
+        return (msgmode, talker, msgID, payload[0])
+    if msgID[:3] == "QTM" or msgID == "STMDRSENMSG":
+        return None
+    return (msgmode, talker, msgID)
+
+
+def _str2de(vals: str) -> float | str:
+    """Convert NMEA decimal string, leaving empty values unchanged."""
+
+    return float(vals) if vals != "" else vals
+
+
+def _str2in(vals: str) -> int | str:
+    """Convert NMEA integer string, leaving empty values unchanged."""
+
+    return int(vals) if vals != "" else vals
+
+
+_STR2VAL = {
+    nmt.CH: None,
+    nmt.ST: None,
+    nmt.LAD: None,
+    nmt.LND: None,
+    nmt.QS: None,
+    nmt.HX: None,
+    nmt.DE: _str2de,
+    nmt.DT: partial(date2utc, form=nmt.DT),
+    nmt.DTL: partial(date2utc, form=nmt.DTL),
+    nmt.DM: partial(date2utc, form=nmt.DM),
+    nmt.IN: _str2in,
+    nmt.LA: dmm2ddd,
+    nmt.LN: dmm2ddd,
+    nmt.TM: time2utc,
+}  # string to typed value converter by attribute type, None = unchanged
+
+
+def _unknown_type(att: str) -> FunctionType:
+    """
+    Return converter for unknown attribute type, which raises
+    NMEATypeError if and when a value of that type is converted.
+
+    :param str att: attribute type
+    :return: converter function
+    :rtype: FunctionType
+    """
+
+    def convert(vals: str):
+        raise nme.NMEATypeError(f"Unknown attribute type {att}.")
+
+    return convert
+
+
+def _named_repeats(
+    numr: str, payload: list, msgid: str, entries: list, topkey: str
+) -> int:
+    """
+    Get number of repeats of group from value of named attribute.
+
+    :param str numr: name of attribute containing number of repeats
+    :param list payload: payload as list of strings
+    :param str msgid: message ID, for error reporting
+    :param list entries: entries expanded so far
+    :param str topkey: top-level attribute key of group, for error reporting
+    :return: number of repeats
+    :rtype: int
+    :raises: NMEATypeError if named attribute is missing or invalid
+    """
+    # pylint: disable=too-many-arguments
+
+    erm = "Incorrect type for attribute {} in msgID {}."
+    names = [entry[0] for entry in entries]
+    if numr not in names or names.index(numr) >= len(payload):
+        raise nme.NMEATypeError(erm.format(topkey, msgid))
+    idx = names.index(numr)
+    try:
+        rng = NMEAMessage.str2val(payload[idx], entries[idx][1])
+    except (TypeError, ValueError) as err:
+        raise nme.NMEATypeError(erm.format(entries[idx][2], msgid)) from err
+    if not isinstance(rng, int):
+        raise nme.NMEATypeError(erm.format(topkey, msgid))
+    return rng
+
+
+def _expand_plan(
+    pdict: dict, payload: list, msgid: str, entries: list, gindex: list, top: str = ""
+) -> bool:
+    """
+    Recursive routine to expand payload definition into flat list of
+    (attribute name, attribute type, top-level attribute key, attribute
+    key), with repeating groups expanded according to their repeat count.
+
+    :param dict pdict: dict representing payload definition
+    :param list payload: payload as list of strings
+    :param str msgid: message ID, for error reporting
+    :param list entries: expanded entries (updated in place)
+    :param list gindex: repeating group index array
+    :param str top: top-level attribute key ("")
+    :return: True if expansion depends only on payload length
+    :rtype: bool
+    :raises: NMEATypeError if named repeat count is invalid
+    """
+    # pylint: disable=too-many-arguments
+
+    cacheable = True
+    for key, att in pdict.items():
+        topkey = top or key
+        if isinstance(att, tuple):  # repeating group of attributes
+            numr, attd = att
+            if isinstance(numr, int):  # fixed number of repeats
+                rng = numr
+            elif numr == "None":  # indeterminate number of repeats
+                rng = int((len(payload) - len(entries)) / len(attd))
+            else:  # number of repeats is defined in named attribute
+                cacheable = False
+                rng = _named_repeats(numr, payload, msgid, entries, topkey)
+            gindex.append(0)
+            for i in range(rng):
+                gindex[-1] = i + 1
+                cacheable &= _expand_plan(attd, payload, msgid, entries, gindex, topkey)
+            gindex.pop()
+            continue
+        keyr = key
+        for i in gindex:  # one index for each nested level
+            if i > 0:
+                keyr += f"_{i:02d}"
+        entries.append((keyr, att, topkey, key))
+
+    return cacheable
+
+
+def _get_plan(
+    pdict: dict, payload: list, msgid: str, fields: frozenset | NoneType = None
+) -> tuple:
+    """
+    Get compiled parse plan for payload definition and payload length.
+
+    Each payload definition is expanded and compiled once for each
+    payload length (and field projection) encountered, and the resulting
+    plan cached, unless it contains a repeating group whose count is
+    defined in a named attribute, in which case it is compiled for each
+    payload.
+
+    If 'fields' is specified, the plan only includes attributes whose name
+    (e.g. "lat") or, for repeating groups, unsuffixed name (e.g. "svid"
+    for "svid_01", "svid_02" etc.) is in 'fields'. Any proprietary 'msgId'
+    attribute is always included, as it forms part of the message identity.
+
+    The plan is a tuple of:
+
+    - entries: tuple of (attribute name, converter function or None)
+      for each payload field present (and projected)
+    - keys: dict of attribute name to top-level attribute key for each
+      payload field present, for error reporting
+    - lazyplan: dict of attribute name to (attribute type, payload index)
+    - signs: dict of lat/lon attribute name to (payload index of NS/EW
+      indicator, negative indicator value)
+    - checks: tuple of (attribute name, converter function, payload index)
+      for each entry whose converter raises on an invalid value (e.g. "IN",
+      "DE"), used to validate lazily-decoded payloads
+    - index: dict of attribute name to payload index, shared as the
+      field-index map of each message parsed using the plan
+
+    :param dict pdict: dict representing payload definition
+    :param list payload: payload as list of strings
+    :param str msgid: message ID, for error reporting
+    :param frozenset | NoneType fields: names of attributes to include,
+        or None for all attributes (None)
+    :return: compiled plan
+    :rtype: tuple
+    :raises: NMEATypeError if named repeat count is invalid
+    """
+    # pylint: disable=too-many-locals
+
+    ckey = (id(pdict), len(payload), fields)
+    cached = _PLANS.get(ckey)
+    if cached is not None:
+        return cached[1]
+
+    expanded = []
+    cacheable = _expand_plan(pdict, payload, msgid, expanded, [])
+    del expanded[len(payload) :]  # older device missing NMEA <=4.10 attributes
+    entries = []
+    keys = {}
+    lazyplan = {}
+    signs = {}
+    checks = []
+    index = {}
+    for pindex, (keyr, att, topkey, key) in enumerate(expanded):
+        keys[keyr] = topkey
+        # sign of lat/lon is overridden by subsequent NS and EW values
+        if att == nmt.LND and "lon" in lazyplan:
+            signs["lon"] = (pindex, "W")
+        elif att == nmt.LAD and "lat" in lazyplan:
+            signs["lat"] = (pindex, "S")
+        if fields is not None and keyr not in fields and key not in fields:
+            if key != "msgId":  # proprietary msgId is always set, for identity
+                continue  # not projected, value remains in payload only
+        conv = _STR2VAL[att] if att in _STR2VAL else _unknown_type(att)
+        entries.append((keyr, conv))
+        lazyplan[keyr] = (att, pindex)
+        index[keyr] = pindex
+        if att in (nmt.DE, nmt.IN) or att not in _STR2VAL:
+            checks.append((keyr, conv, pindex))
+    _add_attributes(index)
+    plan = (tuple(entries), keys, lazyplan, signs, tuple(checks), index)
+
+    if cacheable:
+        if len(_PLANS) >= PLAN_CACHE_SIZE:
+            del _PLANS[next(iter(_PLANS))]  # discard oldest
+        _PLANS[ckey] = (pdict, plan)  # retain pdict so its id is not reused
+    return plan
+
 
 class NMEAMessage:
     """NMEA GNSS/GPS Message Class."""
 
+    # payload attribute values are held in the _values sequence and
+    # accessed via class-level descriptors using the _index map of
+    # attribute name to position, which is shared by streamed messages
+    __slots__ = (
+        "_immutable",
+        "_validate",
+        "_userdefined",
+        "_defsource",
+        "_mode",
+        "_hpnmeamode",
+        "_talker",
+        "_msgID",
+        "_checksum",
+        "_tagblock",
+        "_streaming",
+        "_lazy",
+        "_payload",
+        "_plan",
+        "_signs",
+        "_index",
+        "_values",
+    )
+
     def __init__(
         self,
         talker: str,
@@ -48,6 +363,9 @@ class NMEAMessage:
         validate: int = nmt.VALCKSUM,
         userdefined: dict | NoneType = None,
         checksum: str | NoneType = None,
+        lazy: bool = False,
+        tagblock: dict | NoneType = None,
+        fields: Iterable[str] | NoneType = None,
         **kwargs,
     ):
         """Constructor.
@@ -55,6 +373,14 @@ class NMEAMessage:
         If 'payload' is passed as a keyword arg, this is taken to contain the entire
         message content as a list of string values; any other keyword args are ignored.
 
+        If 'lazy' is True and 'payload' is passed, individual attributes are only
+        converted to their typed values when first accessed (and then cached).
+
+        If 'fields' is specified and 'payload' is passed, only the named attributes
+        are converted and set; all other values remain in 'payload' as strings.
+        Attributes within repeating groups can be named with or without their
+        group index suffix e.g. "svid_01" or "svid".
+
         Otherwise, any individual attributes passed as keyword args will be set to the
         value provided, all others will be assigned a nominal value according to type.
 
@@ -67,52 +393,87 @@ class NMEAMessage:
         :param dict userdefined: user-defined payload definition dictionary (None)
         :param str | NoneType checksum: checksum from incoming message or
             None if creating new message (None)
+        :param bool lazy: decode payload attributes on first access (False)
+        :param dict | NoneType tagblock: IEC 61162-450 / NMEA 4.x TAG block
+            parameters e.g. {"s": "GP0001", "c": 1577836800, "n": 12} (None)
+        :param Iterable[str] | NoneType fields: names of payload attributes to
+            set from 'payload' e.g. ("time", "lat", "lon"), None = all (None)
         :param kwargs: keyword arg(s) representing all or some payload attributes
         :raises: NMEAMessageError
         """
+        # pylint: disable=too-many-locals
 
         # object is mutable during initialisation only
-        super().__setattr__("_immutable", False)
-        self._logger = getLogger(__name__)
-        self._validate = validate
-        self._userdefined = {} if userdefined is None else userdefined
+        init = object.__setattr__  # bypass immutability check
+        init(self, "_immutable", False)
+        init(self, "_validate", validate)
+        init(self, "_userdefined", userdefined)
 
         if msgmode not in (0, 1, 2):
             raise nme.NMEAMessageError(
                 f"Invalid msgmode {msgmode} - must be 0, 1 or 2."
             )
-        if talker not in nmt.NMEA_TALKERS:
-            if self._validate & nmt.VALMSGID:
-                raise nme.NMEAMessageError(f"Unknown talker {talker}.")
-        if msgID in nmt.NMEA_MSGIDS:
-            self._defsource = nmt.DEF_STND  # standard
-        elif msgID in nmt.NMEA_MSGIDS_PROP or msgID in nmt.NMEA_PREFIX_PROP:
-            self._defsource = nmt.DEF_PROP  # proprietary
-        elif msgID in self._userdefined:
-            self._defsource = nmt.DEF_USER  # user-defined
+        # flag to show message is being streamed rather than generated
+        streaming = "payload" in kwargs
+        # previously resolved header of streamed message
+        hkey = schema = None
+        if streaming:
+            hkey = _schema_key(talker, msgID, msgmode, kwargs["payload"])
+            schema = _SCHEMAS.get(hkey)
+        if schema is not None:
+            talkerok, defsource, _ = schema
         else:
-            self._defsource = nmt.DEF_UNKN  # unrecognised
-            if self._validate & nmt.VALMSGID:
+            talkerok = talker in nmt.NMEA_TALKERS
+            if msgID in nmt.NMEA_MSGIDS:
+                defsource = nmt.DEF_STND  # standard
+            elif msgID in nmt.NMEA_MSGIDS_PROP or msgID in nmt.NMEA_PREFIX_PROP:
+                defsource = nmt.DEF_PROP  # proprietary
+            elif userdefined is not None and msgID in userdefined:
+                defsource = nmt.DEF_USER  # user-defined
+            else:
+                defsource = nmt.DEF_UNKN  # unrecognised
+        if validate & nmt.VALMSGID:
+            if not talkerok:
+                raise nme.NMEAMessageError(f"Unknown talker {talker}.")
+            if defsource == nmt.DEF_UNKN:
                 raise nme.NMEAMessageError(
                     f"Unknown msgID {talker}{msgID}, msgmode {('GET','SET','POLL')[msgmode]}."
                 )
 
-        self._mode = msgmode
+        init(self, "_defsource", defsource)
+        init(self, "_mode", msgmode)
         # high precision NMEA mode returns NMEA lat/lon to 7dp rather than 5dp
-        self._hpnmeamode = hpnmeamode
-        self._talker = talker
-        self._msgID = msgID
-        self._checksum = checksum
-        # flag to show message is being streamed rather than generated
-        self._streaming = "payload" in kwargs
-        self._do_attributes(**kwargs)
-        self._immutable = True  # once initialised, object is immutable
-
-    def _do_attributes(self, **kwargs):
+        init(self, "_hpnmeamode", hpnmeamode)
+        init(self, "_talker", talker)
+        init(self, "_msgID", msgID)
+        init(self, "_checksum", checksum)
+        init(self, "_tagblock", tagblock)
+        init(self, "_streaming", streaming)
+        init(self, "_lazy", lazy and streaming)
+        # shared map of attribute names to (type, payload index)
+        init(self, "_plan", None)
+        if fields is not None and not isinstance(fields, frozenset):
+            fields = frozenset(fields)
+        self._do_attributes(schema, hkey, fields, **kwargs)
+        init(self, "_immutable", True)  # once initialised, object is immutable
+
+    def _do_attributes(
+        self,
+        schema: tuple | NoneType,
+        hkey: tuple | NoneType,
+        fields: frozenset | NoneType,
+        **kwargs,
+    ):
         """
         Populate NMEAMessage from named attribute keywords.
         Where a named attribute is absent, set to a nominal value (zeros or blanks).
 
+        :param tuple | NoneType schema: cached (talker valid, defsource, payload
+            definition) for message header, or None if not yet resolved
+        :param tuple | NoneType hkey: cache key for message header,
+            or None if not cacheable
+        :param frozenset | NoneType fields: names of streamed attributes to set,
+            or None for all attributes
         :param kwargs: optional content key/value pairs
         :raises: UBXTypeError
         """
@@ -122,21 +483,35 @@ class NMEAMessage:
         key = ""
 
         try:
-            self._payload = kwargs.get("payload", [])
-            # self._checksum = kwargs.get("checksum", None)
-            pdict = self._get_dict(**kwargs)  # get payload definition dict
+            object.__setattr__(self, "_payload", kwargs.get("payload", []))
+            if schema is None:
+                pdict = self._get_dict(**kwargs)  # get payload definition dict
+                if hkey is not None and pdict is not None:
+                    self._set_schema(hkey, pdict)
+            else:
+                pdict = schema[2]
+            if pdict is None or not self._streaming:
+                object.__setattr__(self, "_index", {})
+                object.__setattr__(self, "_values", [])
             if pdict is None:  # definition not yet implemented
                 if "payload" in kwargs:
                     self._set_attribute_nominal(kwargs["payload"])
                 return
-            for key in pdict.keys():  # process each attribute in dict
-                pindex, gindex = self._set_attribute(
-                    pindex, pdict, key, gindex, **kwargs
-                )
+            if self._streaming:  # all attribute values have been provided
+                self._set_attributes_plan(pdict, fields)
+                if self._lazy:  # attributes will be decoded on first access
+                    return
+            else:
+                for key in pdict.keys():  # process each attribute in dict
+                    pindex, gindex = self._set_attribute(
+                        pindex, pdict, key, gindex, **kwargs
+                    )
             # generate checksum for newly-created message
             if self._checksum is None:
-                self._checksum = generate_checksum(
-                    self._talker, self._msgID, self._payload
+                object.__setattr__(
+                    self,
+                    "_checksum",
+                    generate_checksum(self._talker, self._msgID, self._payload),
                 )
 
         except (
@@ -150,6 +525,21 @@ class NMEAMessage:
                 f"Incorrect type for attribute {key} in msgID {self._msgID}."
             ) from err
 
+    def _set_schema(self, hkey: tuple, pdict: dict):
+        """
+        Cache resolved payload definition for standard or proprietary
+        message header.
+
+        :param tuple hkey: cache key for message header
+        :param dict pdict: dict representing payload definition
+        """
+
+        if self._defsource not in (nmt.DEF_STND, nmt.DEF_PROP):
+            return  # unknown or user-defined
+        if len(_SCHEMAS) >= SCHEMA_CACHE_SIZE:
+            del _SCHEMAS[next(iter(_SCHEMAS))]  # discard oldest
+        _SCHEMAS[hkey] = (self._talker in nmt.NMEA_TALKERS, self._defsource, pdict)
+
     def _set_attribute(
         self, pindex: int, pdict: dict, key: str, gindex: list, **kwargs
     ) -> tuple:
@@ -194,11 +584,7 @@ class NMEAMessage:
         if isinstance(numr, int):  # fixed number of repeats
             rng = numr
         elif numr == "None":  # indeterminate number of repeats
-            pindexend = 0  # may need tweaking
-            if self._streaming:
-                rng = self._calc_num_repeats(attd, self._payload, pindex, pindexend)
-            else:
-                rng = groupsize(**kwargs)
+            rng = groupsize(**kwargs)
         else:  # number of repeats is defined in named attribute
             rng = getattr(self, numr)
         # recursively process each group attribute,
@@ -228,7 +614,6 @@ class NMEAMessage:
         :return: pindex
         :rtype: int
         """
-        # pylint: disable=no-member, access-member-before-definition, attribute-defined-outside-init
 
         # if attribute is part of a (nested) repeating group, suffix name with group index
         keyr = key
@@ -236,52 +621,131 @@ class NMEAMessage:
             if i > 0:
                 keyr += f"_{i:02d}"
 
-        try:
-            # all attribute values have been provided
-            if self._streaming:
-                # remove group delimiters in proprietary PSSNSNC message
-                if self.identity == "PSSNSNC":
-                    self._payload[pindex] = (
-                        self._payload[pindex].replace("[", "").replace("]", "")
-                    )
-                val = self._payload[pindex]
-                val = self.str2val(val, att)
-            # some attribute values have been provided,
-            # the rest will be set to a nominal value
-            else:
-                if att == nmt.LND and hasattr(self, "lon"):
-                    if isinstance(self.lon, (int, float)):
-                        val = "W" if self.lon < 0 else "E"
-                    else:  # pragma: no cover
-                        val = "E"
-                elif att == nmt.LAD and hasattr(self, "lat"):
-                    if isinstance(self.lat, (int, float)):
-                        val = "S" if self.lat < 0 else "N"
-                    else:  # pragma: no cover
-                        val = "N"
-                else:
-                    val = kwargs.get(keyr, self.nomval(att, self.msgmode))
-                vals = self.val2str(val, att, self._hpnmeamode)
-                self._payload.append(vals)
+        # some attribute values have been provided,
+        # the rest will be set to a nominal value
+        if att == nmt.LND and hasattr(self, "lon"):
+            if isinstance(self.lon, (int, float)):
+                val = "W" if self.lon < 0 else "E"
+            else:  # pragma: no cover
+                val = "E"
+        elif att == nmt.LAD and hasattr(self, "lat"):
+            if isinstance(self.lat, (int, float)):
+                val = "S" if self.lat < 0 else "N"
+            else:  # pragma: no cover
+                val = "N"
+        else:
+            val = kwargs.get(keyr, self.nomval(att, self.msgmode))
+        vals = self.val2str(val, att, self._hpnmeamode)
+        self._payload.append(vals)
 
-        except (
-            IndexError
-        ):  # probably just an older device missing NMEA <=4.10 dict attributes
-            return pindex
-
-        setattr(self, keyr, val)  # add attribute to NMEAMessage object
-        if self._streaming:
-            # override sign of lat/lon according to NS and EW values
-            if att == nmt.LND and hasattr(self, "lon"):
-                if isinstance(self.lon, (int, float)):
-                    self.lon = -abs(self.lon) if val == "W" else abs(self.lon)
-            elif att == nmt.LAD and hasattr(self, "lat"):
-                if isinstance(self.lat, (int, float)):
-                    self.lat = -abs(self.lat) if val == "S" else abs(self.lat)
+        self._set_value(keyr, val)  # add attribute to NMEAMessage object
         pindex += 1  # move on to next attribute in payload definition
 
         return pindex
 
+    def _set_attributes_plan(self, pdict: dict, fields: frozenset | NoneType = None):
+        """
+        Set attribute values from payload using compiled parse plan
+        for payload definition. If lazy, map each attribute name to its
+        type and payload index instead, deferring conversion of values
+        until each attribute is first accessed (numeric values are still
+        validated, so that invalid payloads are rejected as if not lazy).
+
+        :param dict pdict: dict representing payload definition
+        :param frozenset | NoneType fields: names of attributes to set,
+            or None for all attributes (None)
+        :raises: NMEATypeError
+        """
+        # pylint: disable=too-many-locals
+
+        payload = self._payload
+        entries, keys, plan, signs, checks, index = _get_plan(
+            pdict, payload, self._msgID, fields
+        )
+        # remove group delimiters in proprietary PSSNSNC message
+        if self._talker + self._msgID == "PSSN" and payload[:1] == ["SNC"]:
+            for i in range(1, len(keys)):
+                payload[i] = payload[i].replace("[", "").replace("]", "")
+        init = object.__setattr__  # bypass immutability check
+        init(self, "_plan", plan)
+        # payload index of NS/EW indicators for lat/lon
+        init(self, "_signs", signs)
+        init(self, "_index", index)
+
+        name = ""
+        try:
+            if self._lazy:  # only validate values which may be invalid
+                for name, conv, pindex in checks:
+                    conv(payload[pindex])
+                init(self, "_values", [_UNDECODED] * len(payload))
+                return
+            if fields is None:
+                values = []
+                for (name, conv), vals in zip(entries, payload):
+                    values.append(vals if conv is None else conv(vals))
+            else:  # projected attributes only, others remain as strings
+                values = list(payload)
+                for name, conv in entries:
+                    if conv is not None:
+                        pindex = index[name]
+                        values[pindex] = conv(values[pindex])
+        except (
+            AttributeError,
+            OverflowError,
+            struct.error,
+            TypeError,
+            ValueError,
+        ) as err:
+            raise nme.NMEATypeError(
+                f"Incorrect type for attribute {keys[name]} in msgID {self._msgID}."
+            ) from err
+        # override sign of lat/lon according to NS and EW values
+        for name, (pindex, neg) in signs.items():
+            i = index.get(name)
+            if i is not None and isinstance(values[i], (int, float)):
+                val = values[i]
+                values[i] = -abs(val) if payload[pindex] == neg else abs(val)
+        init(self, "_values", tuple(values))
+
+    def _set_value(self, name: str, value: Any):
+        """
+        Set payload attribute value during initialisation.
+
+        :param str name: attribute name
+        :param Any value: attribute value
+        """
+
+        _add_attributes((name,))
+        pindex = self._index.get(name)
+        if pindex is None:
+            self._index[name] = len(self._values)
+            self._values.append(value)
+        else:
+            self._values[pindex] = value
+
+    def _decode(self, name: str) -> Any:
+        """
+        Decode and cache lazily-decoded attribute on first access.
+
+        :param str name: attribute name
+        :return: attribute value
+        :rtype: Any
+        :raises: NMEATypeError if attribute value is invalid for its type
+        """
+
+        att, pindex = self._plan[name]
+        try:
+            val = self.str2val(self._payload[pindex], att)
+        except (OverflowError, TypeError, ValueError) as err:
+            raise nme.NMEATypeError(
+                f"Incorrect type for attribute {name} in msgID {self._msgID}."
+            ) from err
+        sign = self._signs.get(name)
+        if sign is not None and isinstance(val, (int, float)):
+            val = -abs(val) if self._payload[sign[0]] == sign[1] else abs(val)
+        self._values[pindex] = val  # cache decoded value
+        return val
+
     def _set_attribute_nominal(self, payload: list):
         """
         Set nominal attributes for unrecognised NMEA sentence types.
@@ -290,60 +754,62 @@ class NMEAMessage:
         """
 
         for i, fld in enumerate(payload):
-            setattr(self, f"field_{i+1:02d}", fld)
+            self._set_value(f"field_{i+1:02d}", fld)
 
     def _get_dict(self, **kwargs) -> dict | NoneType:
         """
         Get payload dictionary.
 
-        :return: dictionary representing payload definition
+        :return: dictionary representing payload definition, or None if unknown
         :rtype: dict | NoneType
+        :raises: NMEAMessageError (if msgID is unknown and VALMSGID is set)
         """
 
-        dic = None
         key = self.msgID
+        if self._defsource == nmt.DEF_UNKN:  # no definition
+            return None
 
-        try:
-            if key in nmt.NMEA_PREFIX_PROP:  # proprietary, first element is msgId
-                if self._streaming:
-                    if key == "ASHR" and self._payload[0][1].isdigit():
-                        pass  # exception for PASHR pitch and roll sentence without msgId
-                    else:
-                        key += self._payload[0]
-                elif "msgId" in kwargs:
-                    key += kwargs["msgId"]
-                else:
-                    raise nme.NMEAMessageError(
-                        f"P{key} message definitions must "
-                        "include payload or msgId keyword arguments."
-                    )
-            key = key.upper()
-
-            if self._defsource == nmt.DEF_PROP:  # proprietary
-                dic = self._get_dict_prop(key, **kwargs)
-            elif self._defsource == nmt.DEF_USER:  # user defined
-                dic = self._userdefined[key]
-            else:  # standard
-                if self._mode == nmt.POLL:
-                    dic = nmp.NMEA_PAYLOADS_POLL[key]
-                elif self._mode == nmt.SET:  # pragma: no cover
-                    dic = nms.NMEA_PAYLOADS_SET[key]
+        if key in nmt.NMEA_PREFIX_PROP:  # proprietary, first element is msgId
+            if self._streaming:
+                msgid = self._payload[0] if self._payload else ""
+                if key == "ASHR" and msgid[1:2].isdigit():
+                    pass  # exception for PASHR pitch and roll sentence without msgId
                 else:
-                    dic = nmg.NMEA_PAYLOADS_GET[key]
-        except KeyError as err:  # unknown msgid
-            erm = f"Unknown msgID {key} msgmode {('GET', 'SET', 'POLL')[self._mode]}."
-            if self._validate & nmt.VALMSGID:
-                raise nme.NMEAMessageError(erm) from err
+                    key += msgid
+            elif "msgId" in kwargs:
+                key += kwargs["msgId"]
+            else:
+                raise nme.NMEAMessageError(
+                    f"P{key} message definitions must "
+                    "include payload or msgId keyword arguments."
+                )
+        key = key.upper()
+
+        if self._defsource == nmt.DEF_PROP:  # proprietary
+            dic = self._get_dict_prop(key, **kwargs)
+        elif self._defsource == nmt.DEF_USER:  # user defined
+            dic = self._userdefined.get(key)
+        else:  # standard
+            if self._mode == nmt.POLL:
+                dic = nmp.NMEA_PAYLOADS_POLL.get(key)
+            elif self._mode == nmt.SET:  # pragma: no cover
+                dic = nms.NMEA_PAYLOADS_SET.get(key)
+            else:
+                dic = nmg.NMEA_PAYLOADS_GET.get(key)
+        if dic is None and self._validate & nmt.VALMSGID:  # unknown msgid
+            raise nme.NMEAMessageError(
+                f"Unknown msgID {key} msgmode {('GET', 'SET', 'POLL')[self._mode]}."
+            )
 
         return dic
 
-    def _get_dict_prop(self, key: str, **kwargs) -> dict:
+    def _get_dict_prop(self, key: str, **kwargs) -> dict | NoneType:
         """
         Get payload dictionary for proprietary message types.
 
         :param str key: msgid
-        :return: dictionary representing payload definition
-        :rtype: dict
+        :return: dictionary representing payload definition, or None if unknown
+        :rtype: dict | NoneType
         """
 
         if key == "QTMCFGGEOFENCE":
@@ -364,10 +830,10 @@ class NMEAMessage:
             key = self._get_dict_qtmacknak(key, self._mode)
 
         if self._mode == nmt.POLL:
-            return nmpp.NMEA_PAYLOADS_POLL_PROP[key]
+            return nmpp.NMEA_PAYLOADS_POLL_PROP.get(key)
         if self._mode == nmt.SET:
-            return nmsp.NMEA_PAYLOADS_SET_PROP[key]
-        return nmgp.NMEA_PAYLOADS_GET_PROP[key]
+            return nmsp.NMEA_PAYLOADS_SET_PROP.get(key)
+        return nmgp.NMEA_PAYLOADS_GET_PROP.get(key)
 
     def _get_dict_qtmcfguart(self, key: str, mode: int, **kwargs) -> str:
         """
@@ -509,7 +975,7 @@ class NMEAMessage:
 
         py = self._streaming
         if mode == nmt.GET:
-            if py and kwargs["payload"][0].isnumeric():
+            if py and kwargs["payload"][:1] and kwargs["payload"][0].isnumeric():
                 key += "_ALT"
         return key
 
@@ -528,7 +994,7 @@ class NMEAMessage:
         py = self._streaming
         mt = "msgtype" in kwargs
         msgtype = ""
-        if py:
+        if py and self._payload:
             msgtype = self._payload[0]
         elif not py and mt:
             msgtype = kwargs["msgtype"]
@@ -554,24 +1020,6 @@ class NMEAMessage:
                 key = "QTMNAK"
         return key
 
-    def _calc_num_repeats(
-        self, attd: dict, payload: list, pindex: int, pindexend: int = 0
-    ) -> int:
-        """
-        Deduce number of items in repeating group.
-
-        :param dict attd: grouped attribute dictionary
-        :param list payload : content as list
-        :param int pindex: number of payload attributes before group
-        :param int pindexend: number of payload attributes after group
-        :return: number of repeats
-        :rtype: int
-        """
-
-        lenpayload = len(payload) - pindex - pindexend
-        lengroup = len(attd)
-        return int(lenpayload / lengroup)
-
     def __str__(self) -> str:
         """
         Human readable representation.
@@ -583,9 +1031,8 @@ class NMEAMessage:
         stg = f"<NMEA({self.identity}"
         if self._defsource == nmt.DEF_UNKN:
             stg += ", NOMINAL"
-        for att, val in self.__dict__.items():
-            if att[0] != "_":  # only show public attributes
-                stg += f", {att}={val}"
+        for att in self._index:  # payload attributes in payload order
+            stg += f", {att}={getattr(self, att)}"
         stg += ")>"
 
         return stg
@@ -621,6 +1068,47 @@ class NMEAMessage:
 
         super().__setattr__(name, value)
 
+    def __getstate__(self) -> dict:
+        """
+        Get state of object for pickling or copying. Any lazily-decoded
+        attributes are decoded first.
+
+        :return: dict of slotted attributes
+        :rtype: dict
+        """
+
+        if self._lazy:
+            for name in self._index:
+                getattr(self, name)
+        state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: dict):
+        """
+        Restore state of unpickled or copied object, bypassing immutability check.
+
+        :param dict state: dict of slotted attributes
+        """
+
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def __dict__(self) -> dict:
+        """
+        Payload attributes getter, as returned by vars(). Any lazily-decoded
+        attributes are decoded.
+
+        :return: dict of payload attribute names and values, in payload order
+        :rtype: dict
+        """
+
+        return {name: getattr(self, name) for name in self._index}
+
     def serialize(self) -> bytes:
         """
         Serialize message.
@@ -629,7 +1117,9 @@ class NMEAMessage:
         :rtype: bytes
         """
 
-        output = f"${self._talker}{self._msgID}"
+        output = tagblock2str(self._tagblock or {})
+        output += "!" if self._msgID in nmt.NMEA_ENCAPSULATED else "$"
+        output += f"{self._talker}{self._msgID}"
         for att in self._payload:
             output += "," + att
         output += f"*{self._checksum}\r\n"
@@ -709,6 +1199,18 @@ class NMEAMessage:
 
         return self._checksum
 
+    @property
+    def tagblock(self) -> dict | NoneType:
+        """
+        TAG block getter. Parameters include source identifier ("s"),
+        source time in Unix seconds ("c") and line count ("n").
+
+        :return: TAG block parameters as dict, or None if no TAG block
+        :rtype: dict | NoneType
+        """
+
+        return self._tagblock
+
     @staticmethod
     def str2val(vals: str, att: str) -> Any:
         """
@@ -722,26 +1224,11 @@ class NMEAMessage:
         :raises: MMEATypeError
         """
 
-        val = vals
-        if att in (nmt.CH, nmt.ST, nmt.LAD, nmt.LND, nmt.QS):
-            pass
-        elif att == nmt.HX:
-            val = vals
-        elif att == nmt.DE:  # decimal
-            if vals != "":
-                val = float(vals)
-        elif att in (nmt.DT, nmt.DM):  # date
-            val = date2utc(vals, att)
-        elif att == nmt.IN:  # integer
-            if vals != "":
-                val = int(vals)
-        elif att in (nmt.LA, nmt.LN):  # lat/lon (d)ddmm.mmmmm(mm)
-            val = dmm2ddd(vals)
-        elif att == nmt.TM:  # time hhmmss.ss
-            val = time2utc(vals)
-        else:
-            raise nme.NMEATypeError(f"Unknown attribute type {att}.")
-        return val
+        try:
+            conv = _STR2VAL[att]
+        except KeyError as err:
+            raise nme.NMEATypeError(f"Unknown attribute type {att}.") from err
+        return vals if conv is None else conv(vals)
 
     @staticmethod
     def val2str(val, att: str, hpmode: bool = False) -> str:
@@ -836,3 +1323,6 @@ class NMEAMessage:
         else:
             raise nme.NMEATypeError(f"Unknown attribute type {att}.")
         return val
+
+
+_RESERVED = frozenset(dir(NMEAMessage))  # names not available to payload attributes
@@ -0,0 +1,224 @@
+"""
+Multi-process parallel parser for large NMEA log files.
+
+Splits a log file into byte ranges aligned on NMEA sentence
+boundaries and parses each range in a separate worker process,
+yielding the parsed messages either in their original file order
+or in order of completion.
+
+`for raw, parsed in parse_file_parallel("nmeadata.log", workers=4):`
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments
+
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from types import NoneType
+from typing import Literal
+
+import pynmeagps.exceptions as nme
+from pynmeagps.nmeaais import AISMessage
+from pynmeagps.nmeaframer import NMEAFramer
+from pynmeagps.nmeahelpers import verify_checksum
+from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeastreamparser import NMEAStreamParser
+from pynmeagps.nmeatypes_core import ERR_LOG, GET, VALCKSUM
+
+DEFAULT_RANGESIZE = 2**24
+"""Default byte range size for parallel parsing (16 MiB)"""
+ALIGN_WINDOW = 2**17
+"""Bytes scanned for range boundary (greater than maximum UBX frame length)"""
+
+
+def get_ranges(filename: str, rangesize: int = DEFAULT_RANGESIZE) -> list:
+    """
+    Split file into contiguous byte ranges of approximately
+    rangesize bytes, with each range ending at the start of a NMEA
+    sentence or TAG block (or at end of file).
+
+    :param str filename: path to file
+    :param int rangesize: approximate range size in bytes
+    :return: list of (start, end) byte offsets
+    :rtype: list
+    """
+
+    filesize = os.path.getsize(filename)
+    ranges = []
+    start = 0
+    with open(filename, "rb") as stream:
+        while start < filesize:
+            end = start + rangesize
+            end = filesize if end >= filesize else _align(stream, end, filesize)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _align(stream: object, offset: int, filesize: int) -> int:
+    """
+    Find range boundary at or after specified file offset.
+
+    The data is framed from the offset using the same rules as the
+    readers, so that UBX and RTCM3 frames are skipped in their
+    entirety. The boundary is placed at the start of the sentence
+    following the first sentence with a valid checksum, by which
+    point framing is synchronised, so it cannot fall inside a binary
+    frame or between a TAG block and its sentence. If no boundary is
+    found within ALIGN_WINDOW bytes, the end of the window is used.
+
+    :param object stream: file opened in binary mode
+    :param int offset: file offset from which to search
+    :param int filesize: file size
+    :return: file offset of range boundary
+    :rtype: int
+    """
+
+    stream.seek(offset)
+    window = stream.read(ALIGN_WINDOW)
+    framer = NMEAFramer(buffer=window)
+    framer.set_eof()
+    synced = False
+    while True:
+        try:
+            span = framer.next_span()
+        except nme.NMEAStreamError:  # overlong sentence
+            synced = False
+            continue
+        if span is None:
+            return min(offset + len(window), filesize)
+        if synced:
+            return offset + span[0]
+        try:
+            verify_checksum(window[span[0] : span[1]])
+            synced = True
+        except nme.NMEAParseError:
+            pass
+
+
+def _parse_range(filename: str, start: int, end: int, kwargs: dict) -> list:
+    """
+    Parse all NMEA messages in specified byte range of file
+    (worker process routine).
+
+    :param str filename: path to file
+    :param int start: start offset
+    :param int end: end offset
+    :param dict kwargs: NMEAStreamParser keyword arguments
+    :return: list of (raw, parsed) tuples
+    :rtype: list
+    """
+
+    with open(filename, "rb") as stream:
+        stream.seek(start)
+        data = stream.read(end - start)
+    parser = NMEAStreamParser(**kwargs)
+    parser.feed(data)
+    # no further data in range, so any incomplete binary frame is invalid
+    return list(parser.events(eof=True))
+
+
+def parse_file_parallel(
+    filename: str,
+    workers: int | NoneType = None,
+    ordered: bool = True,
+    rangesize: int = DEFAULT_RANGESIZE,
+    msgmode: Literal[0, 1, 2] = GET,
+    validate: int = VALCKSUM,
+    nmeaonly: bool = False,
+    quitonerror: Literal[0, 1, 2] = ERR_LOG,
+    userdefined: dict | NoneType = None,
+    lazy: bool = False,
+    msgfilter: Iterable[str] | NoneType = None,
+    filterraw: bool = False,
+    parsing: bool = True,
+    decodeais: bool = False,
+    msgclasses: bool = False,
+    fields: dict | NoneType = None,
+) -> Iterator[tuple[bytes, NMEAMessage | AISMessage | NoneType]]:
+    """
+    Parse NMEA log file using a pool of worker processes.
+
+    The number of ranges in progress at any one time is limited
+    to twice the number of workers, so memory usage is bounded
+    regardless of file size.
+
+    NB: if quitonerror = ERR_LOG, errors are logged by the worker
+    processes. If quitonerror = ERR_RAISE, the first error is
+    re-raised in the calling process. If decodeais = True, any
+    multi-sentence AIS message which straddles a range boundary is
+    not reassembled.
+
+    :param str filename: path to NMEA log file
+    :param int | NoneType workers: number of worker processes (None = number of CPUs)
+    :param bool ordered: True = yield messages in file order,
+        False = yield messages as each range completes (True)
+    :param int rangesize: approximate byte range size per task (16 MiB)
+    :param Literal[0,1,2] msgmode: 0=GET, 1=SET, 2=POLL (0)
+    :param int validate: VALNONE (0), VALCKSUM (1), VALMSGID (2),
+        (can be OR'd) (1)
+    :param bool nmeaonly: True = error on non-NMEA data, False = ignore non-NMEA data
+    :param Literal[0,1,2] quitonerror: ERR_IGNORE (0) = ignore errors,
+        ERR_LOG (1) = log continue, ERR_RAISE (2) = (re)raise (1)
+    :param dict | NoneType userdefined: user-defined payload definition dictionary (None)
+    :param bool lazy: decode message attributes on first access (False)
+    :param Iterable[str] | NoneType msgfilter: if specified, only parse sentences
+        whose header (e.g. "GNGGA") or msgID (e.g. "GGA") is in this collection (None)
+    :param bool filterraw: True = return filtered-out sentences as (raw, None),
+        False = skip filtered-out sentences (False)
+    :param bool parsing: True = parse sentences, False = return validated raw
+        sentences only, as (raw, None) (True)
+    :param bool decodeais: True = reassemble and decode AIS messages in VDM and
+        VDO sentences, returned as (raw, AISMessage) (False)
+    :param bool msgclasses: True = parse standard GET sentences of fixed length
+        using generated message classes (False)
+    :param dict | NoneType fields: if specified, dict of msgID or identity to names of the
+        only attributes to be set for that sentence type
+        e.g. {"GGA": ("time", "lat", "lon", "quality")} (None)
+    :return: iterator of (raw_data as bytes, parsed_data as NMEAMessage or AISMessage)
+    :rtype: Iterator[tuple[bytes, NMEAMessage | AISMessage | NoneType]]
+    :raises: NMEAParseError (if mode is invalid or quitonerror = ERR_RAISE)
+    """
+    # pylint: disable=too-many-arguments, too-many-locals
+
+    kwargs = {
+        "msgmode": msgmode,
+        "validate": validate,
+        "nmeaonly": nmeaonly,
+        "quitonerror": quitonerror,
+        "userdefined": userdefined,
+        "lazy": lazy,
+        "msgfilter": None if msgfilter is None else tuple(msgfilter),
+        "filterraw": filterraw,
+        "parsing": parsing,
+        "decodeais": decodeais,
+        "msgclasses": msgclasses,
+        "fields": fields,
+    }
+    NMEAStreamParser(**kwargs)  # validate arguments before starting workers
+    workers = workers or os.cpu_count() or 1
+    ranges = deque(get_ranges(filename, rangesize))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        maxpending = workers * 2
+        pending = deque() if ordered else set()
+        while ranges or pending:
+            while ranges and len(pending) < maxpending:
+                start, end = ranges.popleft()
+                future = executor.submit(_parse_range, filename, start, end, kwargs)
+                if ordered:
+                    pending.append(future)
+                else:
+                    pending.add(future)
+            if ordered:
+                yield from pending.popleft().result()
+            else:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
@@ -11,10 +11,29 @@ data (as an NMEAMessage object).
 
 Implements an iterator: `for raw, parsed in NMEAReader(stream):`
 
+If the 'blocksize' kwarg is greater than 0, the reader will read
+the stream in blocks of that size into an internal buffer and frame
+NMEA sentences from the buffer, rather than reading the stream
+one byte at a time.
+
+If the 'msgfilter' kwarg is specified, only sentences whose header
+or msgID is in the filter are parsed; the check is performed on the
+raw header bytes, so other sentences incur no parsing overhead.
+
+If the 'parsing' kwarg is set to 'False', the reader will return
+raw sentences only, as (raw, None), validating the checksum (if
+VALCKSUM is set) but performing no further parsing.
+
+If the 'decodeais' kwarg is set to 'True', multi-sentence AIS
+messages in !AIVDM or !AIVDO sentences are reassembled and decoded,
+and returned as (raw, AISMessage) once complete.
+
 If the 'nmeaonly' kwarg is set to 'True', the reader
 will raise a NMEAParseError if it encounters any non-NMEA
 data. Otherwise, it will ignore the non-NMEA data and attempt
-to carry on.
+to carry on. UBX and RTCM3 binary frames are skipped in their
+entirety using their declared payload length (and optionally
+passed to a 'binaryhandler' callback).
 
 Created on 4 Mar 2021
 
@@ -23,30 +42,244 @@ Created on 4 Mar 2021
 :license: BSD 3-Clause
 """
 
-# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-positional-arguments, too-many-lines
 
+from collections.abc import Iterable, Iterator
 from logging import getLogger
 from socket import socket
 from types import FunctionType, NoneType
 from typing import Literal
 
 import pynmeagps.exceptions as nme
-from pynmeagps.nmeahelpers import calc_checksum, get_parts
+from pynmeagps.nmeaais import AISAssembler, AISMessage
+from pynmeagps.nmeaclasses import get_message_class
+from pynmeagps.nmeaframer import NMEA_START_BYTES, NMEAFramer
+from pynmeagps.nmeahelpers import (
+    calc_checksum,
+    get_parts,
+    get_tagblock,
+    verify_checksum,
+)
 from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeatypes_ais import AIS_SENTENCES
 from pynmeagps.nmeatypes_core import (
+    BINARY_START,
     DEFAULT_BUFSIZE,
+    DEF_UNKN,
     ENCODE_NONE,
+    ERR_IGNORE,
     ERR_LOG,
     ERR_RAISE,
     GET,
+    MAX_HDRLEN,
+    MAX_TAGLEN,
     NMEA_HDR,
+    NMEA_MAXLEN,
+    NMEA_MSGIDS,
+    NMEA_MSGIDS_PROP,
+    NMEA_PREFIX_PROP,
+    NMEA_TALKERS,
+    PARSE_BADCKSUM,
+    PARSE_BADTYPE,
+    PARSE_MALFORMED,
+    PARSE_OK,
+    PARSE_UNKNOWN,
+    UBX_HDR,
     VALCKSUM,
     VALMSGID,
 )
 from pynmeagps.socketwrapper import SocketWrapper
 
+NMEA_ERRORS = (
+    nme.NMEAMessageError,
+    nme.NMEATypeError,
+    nme.NMEAParseError,
+    nme.NMEAStreamError,
+)
+"""Errors handled by readers according to quitonerror setting"""
+
+
+def _fieldsets(fields: dict | NoneType) -> dict | NoneType:
+    """
+    Convert field projection to dict of msgID or identity to frozenset
+    of attribute names.
+
+    :param dict | NoneType fields: dict of msgID or identity to iterable
+        of attribute names
+    :return: dict of msgID or identity to frozenset of attribute names, or None
+    :rtype: dict | NoneType
+    """
+
+    if fields is None:
+        return None
+    return {key: frozenset(names) for key, names in fields.items()}
 
-class NMEAReader:
+
+def _projection(
+    fields: dict | NoneType, talker: str, msgid: str, payload: list
+) -> frozenset | NoneType:
+    """
+    Get field projection for sentence, looked up by message identity
+    (e.g. "GNGGA", "PUBX00") and then by msgID (e.g. "GGA", "UBX").
+
+    :param dict | NoneType fields: dict of msgID or identity to frozenset
+        of attribute names
+    :param str talker: talker e.g. "GN" or "P"
+    :param str msgid: msgID e.g. "GGA" or "UBX"
+    :param list payload: payload as list of strings
+    :return: names of attributes to set, or None for all attributes
+    :rtype: frozenset | NoneType
+    """
+
+    if fields is None:
+        return None
+    identity = talker + msgid
+    if msgid in NMEA_PREFIX_PROP and payload:  # proprietary, first element is msgId
+        identity += payload[0]
+    projection = fields.get(identity)
+    return fields.get(msgid) if projection is None else projection
+
+
+class NMEAHandler:
+    """
+    Mixin providing the sentence filtering, parsing and error handling
+    options shared by NMEAReader and the other NMEA readers and parsers.
+    """
+
+    # pylint: disable=too-many-instance-attributes, too-few-public-methods
+
+    def __init__(
+        self,
+        msgmode: Literal[0, 1, 2],
+        validate: int,
+        quitonerror: Literal[0, 1, 2],
+        errorhandler: FunctionType | NoneType,
+        userdefined: dict | NoneType,
+        lazy: bool,
+        msgfilter: Iterable[str] | NoneType,
+        filterraw: bool,
+        parsing: bool,
+        decodeais: bool,
+        msgclasses: bool,
+        fields: dict | NoneType,
+    ):
+        """
+        Constructor. Options are as described for NMEAReader.
+
+        :raises: NMEAParseError (if mode is invalid)
+        """
+        # pylint: disable=too-many-arguments
+
+        self._check_msgmode(msgmode, "stream")
+        self._quitonerror = quitonerror
+        self._errorhandler = errorhandler
+        self._validate = validate
+        self._mode = msgmode
+        self._userdefined = userdefined
+        self._lazy = lazy
+        self._msgclasses = msgclasses
+        self._fields = _fieldsets(fields)
+        self._msgfilter = (
+            None if msgfilter is None else frozenset(m.encode() for m in msgfilter)
+        )
+        self._filterraw = filterraw
+        self._parsing = parsing
+        self._aisassembler = AISAssembler() if decodeais else None
+        self._logger = getLogger(__name__)
+
+    def _handle(
+        self, raw_data: bytes
+    ) -> tuple[bytes, NMEAMessage | AISMessage | NoneType] | NoneType:
+        """
+        Filter, validate and parse framed NMEA sentence.
+
+        :param bytes raw_data: raw NMEA sentence
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage or
+            AISMessage), or None if sentence is filtered out or awaiting
+            further AIS sentences
+        :rtype: tuple[bytes, NMEAMessage | AISMessage | NoneType] | NoneType
+        :raises: NMEAParseError (if sentence is invalid)
+        """
+
+        if self._msgfilter is not None and not self._filter(raw_data):
+            return (raw_data, None) if self._filterraw else None
+        if not self._parsing:  # framing and checksum validation only
+            if self._validate & VALCKSUM:
+                verify_checksum(raw_data)
+            return (raw_data, None)
+        parsed_data = NMEAReader.parse(
+            raw_data,
+            msgmode=self._mode,
+            validate=self._validate,
+            userdefined=self._userdefined,
+            lazy=self._lazy,
+            msgclasses=self._msgclasses,
+            fields=self._fields,
+        )
+        if (
+            self._aisassembler is not None
+            and parsed_data is not None
+            and parsed_data.msgID in AIS_SENTENCES
+        ):
+            return self._aisassembler.add(parsed_data, raw_data)
+        return (raw_data, parsed_data)
+
+    def _filter(self, raw_data: bytes) -> bool:
+        """
+        Check sentence header against message filter without parsing the
+        sentence, e.g. b"$GNGGA,..." matches "GNGGA" or "GGA".
+
+        :param bytes raw_data: raw NMEA sentence
+        :return: True if sentence passes filter, False if not
+        :rtype: bool
+        """
+
+        start = 1
+        if raw_data[:1] == b"\x5c":  # skip TAG block
+            start = bytes(raw_data[:MAX_TAGLEN]).find(b"\x5c", 1) + 2
+        hdr = (
+            bytes(raw_data[start : start + MAX_HDRLEN])
+            .split(b",", 1)[0]
+            .split(b"*", 1)[0]
+        )
+        if hdr in self._msgfilter:
+            return True
+        return hdr[1 if hdr[:1] == b"P" else 2 :] in self._msgfilter
+
+    def _do_error(self, err: Exception):
+        """
+        Handle error.
+
+        :param Exception err: error message
+        :raises: Exception if quitonerror = 2
+        """
+
+        if self._quitonerror == ERR_RAISE:
+            raise err from err
+        if self._quitonerror == ERR_LOG:
+            # pass to error handler if there is one
+            if self._errorhandler is None:
+                self._logger.error(err)
+            else:
+                self._errorhandler(err)
+
+    @staticmethod
+    def _check_msgmode(msgmode: int, source: str):
+        """
+        Check message mode is valid.
+
+        :param int msgmode: message mode
+        :param str source: "stream" or "parse"
+        :raises: NMEAParseError (if mode is invalid)
+        """
+
+        if msgmode not in (0, 1, 2):
+            raise nme.NMEAParseError(
+                f"Invalid {source} mode {msgmode} - must be 0, 1 or 2."
+            )
+
+
+class NMEAReader(NMEAHandler):
     """
     NMEAReader class.
     """
@@ -62,6 +295,16 @@ class NMEAReader:
         errorhandler: FunctionType | NoneType = None,
         userdefined: dict | NoneType = None,
         encoding: int = ENCODE_NONE,
+        blocksize: int = 0,
+        lazy: bool = False,
+        msgfilter: Iterable[str] | NoneType = None,
+        filterraw: bool = False,
+        parsing: bool = True,
+        binaryhandler: FunctionType | NoneType = None,
+        maxlen: int = NMEA_MAXLEN,
+        decodeais: bool = False,
+        msgclasses: bool = False,
+        fields: dict | NoneType = None,
     ):
         """Constructor.
 
@@ -77,37 +320,78 @@ class NMEAReader:
         :param dict | NoneType userdefined: user-defined payload definition dictionary (None)
         :param int encoding: encoding for socket stream \
             (0 = none, 1 = chunk, 2 = gzip, 4 = compress, 8 = deflate (can be OR'd)) (0)
+        :param int blocksize: if > 0, read stream in blocks of this many bytes and
+            frame sentences from an internal buffer, otherwise read byte-by-byte (0)
+        :param bool lazy: decode message attributes on first access (False)
+        :param Iterable[str] | NoneType msgfilter: if specified, only parse sentences
+            whose header (e.g. "GNGGA", "PUBX") or msgID (e.g. "GGA") is in this
+            collection, checked before any parsing takes place (None)
+        :param bool filterraw: True = return filtered-out sentences as (raw, None),
+            False = skip filtered-out sentences (False)
+        :param bool parsing: True = parse sentences, False = return validated raw
+            sentences only, as (raw, None) (True)
+        :param FunctionType | NoneType binaryhandler: callback function which is
+            passed any skipped UBX or RTCM3 frame as bytes (None)
+        :param int maxlen: maximum NMEA sentence length in bytes; if exceeded, the
+            reader resynchronises at the next start byte, 0 = unbounded (1024)
+        :param bool decodeais: True = reassemble and decode AIS messages in VDM and
+            VDO sentences, returned as (raw, AISMessage), where raw comprises all
+            sentences of the message (False)
+        :param bool msgclasses: True = parse standard GET sentences of fixed length
+            using generated message classes (False)
+        :param dict | NoneType fields: if specified, dict of msgID or identity to names of the
+            only attributes to be set for that sentence type
+            e.g. {"GGA": ("time", "lat", "lon", "quality")}, other values remain
+            in payload as strings (None)
         :raises: NMEAParseError (if mode is invalid)
         """
-        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-arguments, too-many-locals
 
         if isinstance(stream, socket):
             self._stream = SocketWrapper(stream, encoding=encoding, bufsize=bufsize)
         else:
             self._stream = stream
-        if msgmode not in (0, 1, 2):
-            raise nme.NMEAParseError(
-                f"Invalid stream mode {msgmode} - must be 0, 1 or 2."
-            )
-        self._quitonerror = quitonerror
-        self._errorhandler = errorhandler
+        super().__init__(
+            msgmode,
+            validate,
+            quitonerror,
+            errorhandler,
+            userdefined,
+            lazy,
+            msgfilter,
+            filterraw,
+            parsing,
+            decodeais,
+            msgclasses,
+            fields,
+        )
         self._nmea_only = nmeaonly
-        self._validate = validate
-        self._mode = msgmode
-        self._userdefined = userdefined
-        self._logger = getLogger(__name__)
+        self._blocksize = blocksize
+        self._binaryhandler = binaryhandler
+        self._maxlen = maxlen
+        self._sizedreadline = True  # stream readline() accepts size argument
+        self._pushback = b""  # data pushed back for reframing
+        self._pbpos = 0
+        self._framer = (
+            NMEAFramer(nmeaonly=nmeaonly, binaryhandler=binaryhandler, maxlen=maxlen)
+            if blocksize
+            else None
+        )
+        self._stats = {}
+        self._identities = {}
+        self.reset_stats()
 
     def __iter__(self):
         """Iterator."""
 
         return self
 
-    def __next__(self) -> tuple[bytes | NoneType, NMEAMessage | NoneType]:
+    def __next__(self) -> tuple[bytes | NoneType, NMEAMessage | AISMessage | NoneType]:
         """
         Return next item in iteration.
 
-        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage)
-        :rtype: tuple[bytes | NoneType, NMEAMessage | NoneType]
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage or AISMessage)
+        :rtype: tuple[bytes | NoneType, NMEAMessage | AISMessage | NoneType]
         :raises: StopIteration
 
         """
@@ -117,55 +401,240 @@ class NMEAReader:
             raise StopIteration
         return (raw_data, parsed_data)
 
-    def read(self) -> tuple[bytes | NoneType, NMEAMessage | NoneType]:
+    def read(self) -> tuple[bytes | NoneType, NMEAMessage | AISMessage | NoneType]:
         """
         Read the binary data from the stream buffer.
 
-        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage)
-        :rtype: tuple[bytes | NoneType, NMEAMessage | NoneType]
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage or AISMessage)
+        :rtype: tuple[bytes | NoneType, NMEAMessage | AISMessage | NoneType]
         :raises: NMEAStreamError (if nmeaonly=True and stream includes non-NMEA data)
 
         """
+        # pylint: disable=too-many-branches, too-many-statements
 
         parsing = True
         raw_data = None
         parsed_data = None
+        stats = self._stats
 
         while parsing:  # loop until end of valid NMEA message or EOF
             try:
-                byte1 = self._read_bytes(1)  # read 1st byte
-                if byte1 != b"\x24":  # not NMEA, discard and continue
+                if self._blocksize:
+                    raw_data = self._read_block_frame()
+                else:
+                    raw_data = self._read_frame()
+                stats["framed"] += 1
+                stats["bytes"] += len(raw_data)
+                if self._msgfilter is not None and not self._filter(raw_data):
+                    if self._filterraw:
+                        return (raw_data, None)
                     continue
-                byte2 = self._read_bytes(1)  # read 2nd byte to confirm protocol
-                bytehdr = byte1 + byte2
-                if bytehdr in NMEA_HDR:  # it's a NMEA message
-                    byten = self._read_line()  # NMEA protocol is CRLF terminated
-                    raw_data = bytehdr + byten
-                    parsed_data = self.parse(
+                if not self._parsing:  # framing and checksum validation only
+                    if self._validate & VALCKSUM:
+                        verify_checksum(raw_data)
+                    return (raw_data, None)
+                if self._quitonerror == ERR_IGNORE:  # result codes, no exceptions
+                    code, parsed_data = self._try_parse(
+                        raw_data,
+                        self._mode,
+                        self._validate,
+                        self._userdefined,
+                        self._lazy,
+                        self._msgclasses,
+                        self._fields,
+                    )
+                    if code == PARSE_BADCKSUM:
+                        stats["checksum"] += 1
+                        continue
+                    if code == PARSE_BADTYPE:
+                        stats["typeerrors"] += 1
+                        continue
+                    if parsed_data is None and self._validate & VALMSGID:
+                        stats["unknown"] += 1  # unknown or badly formed
+                        continue
+                else:
+                    parsed_data = self._parse(
                         raw_data,
                         msgmode=self._mode,
                         validate=self._validate,
                         userdefined=self._userdefined,
+                        lazy=self._lazy,
+                        msgclasses=self._msgclasses,
+                        fields=self._fields,
                     )
-                    parsing = False
-                else:  # it's not a NMEA message (UBX or something else)
-                    if self._nmea_only:  # raise error and quit
-                        raise nme.NMEAParseError(f"Unknown protocol header {bytehdr}.")
+                if parsed_data is None:
+                    stats["unknown"] += 1
+                else:
+                    # pylint: disable=protected-access
+                    if parsed_data._defsource == DEF_UNKN:
+                        stats["unknown"] += 1
+                    identity = parsed_data.identity
+                    identities = self._identities
+                    identities[identity] = identities.get(identity, 0) + 1
+                    if (
+                        self._aisassembler is not None
+                        and parsed_data.msgID in AIS_SENTENCES
+                    ):
+                        ais = self._aisassembler.add(parsed_data, raw_data)
+                        if ais is None:  # awaiting further sentences
+                            continue
+                        raw_data, parsed_data = ais
+                parsing = False
 
             except EOFError:
                 return (None, None)
-            except (
-                nme.NMEAMessageError,
-                nme.NMEATypeError,
-                nme.NMEAParseError,
-                nme.NMEAStreamError,
-            ) as err:
+            except NMEA_ERRORS as err:
+                self._count_error(err)
                 if self._quitonerror:
                     self._do_error(err)
                 continue
 
         return (raw_data, parsed_data)
 
+    def iter_batches(
+        self, n: int
+    ) -> Iterator[list[tuple[bytes, NMEAMessage | NoneType]]]:
+        """
+        Generator yielding lists of up to n consecutive (raw, parsed)
+        message tuples, until the stream is exhausted.
+
+        :param int n: maximum number of messages per batch
+        :return: iterator of lists of (raw_data as bytes, parsed_data as NMEAMessage)
+        :rtype: Iterator[list[tuple[bytes, NMEAMessage | NoneType]]]
+        :raises: NMEAStreamError (if nmeaonly=True and stream includes non-NMEA data)
+        """
+
+        if n < 1:
+            raise ValueError(f"Invalid batch size {n} - must be >= 1.")
+        read = self.read
+        batch = []
+        while True:
+            raw_data, parsed_data = read()
+            if raw_data is None and parsed_data is None:
+                break
+            batch.append((raw_data, parsed_data))
+            if len(batch) == n:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _read_frame(self) -> bytes:
+        """
+        Read next NMEA sentence from stream one byte at a time,
+        discarding any non-NMEA data.
+
+        :return: raw NMEA sentence
+        :rtype: bytes
+        :raises: EOFError if stream ends prematurely
+        :raises: NMEAHeaderError (if nmeaonly=True and stream includes non-NMEA data)
+        """
+
+        stats = self._stats
+        while True:
+            byte1 = self._read_bytes(1)  # read 1st byte
+            tagblock = b""
+            if byte1 == b"\x5c":  # possible TAG block
+                tagblock = self._read_tagblock()
+                if tagblock is None:  # not a TAG block
+                    continue
+                byte1 = self._read_bytes(1)
+                if byte1 not in (b"\x24", b"\x21"):  # resync at last backslash
+                    stats["discarded"] += len(tagblock) - 1
+                    self._unread(b"\x5c" + byte1)
+                    continue
+            if byte1 not in (b"\x24", b"\x21"):  # not NMEA, skip or discard
+                if self._nmea_only or byte1 not in BINARY_START:
+                    stats["discarded"] += 1
+                else:  # possible UBX or RTCM3 frame
+                    self._read_binary(byte1)
+                continue
+            byte2 = self._read_bytes(1)  # read 2nd byte to confirm protocol
+            bytehdr = byte1 + byte2
+            if bytehdr in NMEA_HDR:  # it's a NMEA message
+                try:
+                    byten = self._read_line()  # NMEA protocol is CRLF terminated
+                except nme.NMEALengthError:
+                    stats["discarded"] += len(tagblock)
+                    raise
+                return tagblock + bytehdr + byten
+            # it's not a NMEA message (UBX or something else)
+            stats["discarded"] += len(tagblock) + 2
+            stats["badheaders"] += 1
+            if self._nmea_only:  # raise error and quit
+                raise nme.NMEAHeaderError(f"Unknown protocol header {bytehdr}.")
+
+    def _read_tagblock(self) -> bytes | NoneType:
+        """
+        Read remainder of possible TAG block (e.g. b"\\s:GP0001*5F\\")
+        following initial backslash. If the data is not a TAG block, the
+        backslash is discarded and the remaining data pushed back for reframing.
+
+        :return: TAG block including delimiters, or None if not a TAG block
+        :rtype: bytes | NoneType
+        :raises: EOFError if stream ends prematurely
+        """
+
+        tagblock = b"\x5c"
+        while len(tagblock) < MAX_TAGLEN:
+            byte = self._read_bytes(1)
+            tagblock += byte
+            if byte == b"\x5c":
+                return tagblock
+            if byte in (b"\x24", b"\x21", b"\x0a"):  # not a TAG block
+                break
+        self._stats["discarded"] += 1
+        self._unread(tagblock[1:])
+        return None
+
+    def _read_binary(self, byte1: bytes):
+        """
+        Read and skip UBX or RTCM3 frame using its declared payload length,
+        passing it to the binary handler if there is one. If the frame is
+        incomplete or its checksum is invalid, only the start byte is
+        discarded and the remaining bytes are pushed back for reframing.
+
+        :param bytes byte1: start byte of frame
+        """
+
+        hdr = byte1 + self._read_raw(5 if byte1 == UBX_HDR[0:1] else 2)
+        length = NMEAFramer.binary_length(hdr)
+        frame = hdr
+        if length is not None:
+            frame += self._read_raw(length - len(hdr))
+            if len(frame) == length and NMEAFramer.binary_valid(frame):
+                self._stats["discarded"] += length
+                self._stats["binary"] += 1
+                if self._binaryhandler is not None:
+                    self._binaryhandler(frame)
+                return
+        self._stats["discarded"] += 1
+        self._unread(frame[1:])
+
+    def _read_block_frame(self) -> bytes:
+        """
+        Frame next NMEA sentence from internal buffer, topping
+        the buffer up from the stream in blocks as required and
+        discarding any non-NMEA data.
+
+        :return: raw NMEA sentence
+        :rtype: bytes
+        :raises: EOFError if stream ends prematurely
+        :raises: NMEAHeaderError (if nmeaonly=True and stream includes non-NMEA data)
+        """
+
+        while True:
+            raw_data = self._framer.next_frame()
+            if raw_data is not None:
+                return raw_data
+            data = self._stream.read(self._blocksize)
+            if len(data) == 0:  # EOF
+                if self._framer.eof:
+                    raise EOFError()
+                self._framer.set_eof()  # resolve any incomplete binary frame
+                continue
+            self._framer.feed(data)
+
     def _read_bytes(self, size: int) -> bytes:
         """
         Read a specified number of bytes from stream.
@@ -176,7 +645,10 @@ class NMEAReader:
         :raises: EOFError if stream ends prematurely
         """
 
-        data = self._stream.read(size)
+        if self._pushback:
+            data = self._read_raw(size)
+        else:
+            data = self._stream.read(size)
         if len(data) == 0:  # EOF
             raise EOFError()  # pragma: no cover
         if 0 < len(data) < size:  # truncated stream
@@ -186,41 +658,179 @@ class NMEAReader:
             )
         return data
 
+    def _read_raw(self, size: int) -> bytes:
+        """
+        Read up to specified number of bytes, from any pushed back
+        data first and then from stream.
+
+        :param int size: number of bytes to read
+        :return: bytes (fewer than size if stream ends prematurely)
+        :rtype: bytes
+        """
+
+        pos = self._pbpos
+        data = self._pushback[pos : pos + size]
+        self._pbpos = pos + len(data)
+        if self._pbpos == len(self._pushback):
+            self._pushback = b""
+            self._pbpos = 0
+        if len(data) < size:
+            data += self._stream.read(size - len(data))
+        return data
+
     def _read_line(self) -> bytes:
         """
-        Read bytes until LF (0x0a) terminator.
+        Read bytes until LF (0x0a) terminator, up to the maximum
+        sentence length (less the 2 header bytes already read).
 
         :return: bytes
         :rtype: bytes
         :raises: EOFError if stream ends prematurely
+        :raises: NMEALengthError if sentence exceeds maximum length
         """
 
-        data = self._stream.readline()  # NMEA protocol is CRLF-terminated
+        size = self._maxlen - 2 if self._maxlen else None
+        if self._pushback:  # read any pushed back data first
+            pos = self._pbpos
+            limit = len(self._pushback) if size is None else pos + size
+            end = self._pushback.find(b"\x0a", pos, limit) + 1
+            data = self._pushback[pos : end if end else limit]
+            self._pbpos = pos + len(data)
+            if self._pbpos >= len(self._pushback):
+                self._pushback = b""
+                self._pbpos = 0
+                if not end and (size is None or len(data) < size):
+                    data += self._readline(None if size is None else size - len(data))
+        else:
+            data = self._readline(size)  # NMEA protocol is CRLF-terminated
         if len(data) == 0:  # EOF
             raise EOFError()  # pragma: no cover
-        if data[-1:] != b"\x0a":  # truncated stream
+        if data[-1:] != b"\x0a":
+            if len(data) == size:  # no terminator within maximum length
+                # resync at next start byte
+                match = NMEA_START_BYTES.search(data)
+                if match is None:
+                    self._stats["discarded"] += len(data) + 2
+                else:
+                    self._stats["discarded"] += match.start() + 2
+                    self._unread(data[match.start() :])
+                raise nme.NMEALengthError(
+                    f"Sentence exceeds maximum length {self._maxlen} bytes."
+                )
             raise nme.NMEAStreamError(  # pragma: no cover
                 "Serial stream terminated unexpectedly. "
                 f"Line requested, {len(data)} bytes returned."
             )
         return data
 
-    def _do_error(self, err: Exception):
+    def _readline(self, size: int | NoneType) -> bytes:
         """
-        Handle error.
+        Read line from stream, limited to specified number of bytes.
+        If the stream's readline() does not accept a size argument, the
+        line is read in full and any bytes beyond the limit pushed back.
 
-        :param Exception err: error message
-        :raises: Exception if quitonerror = 2
+        :param int | NoneType size: maximum number of bytes, or None if unbounded
+        :return: bytes
+        :rtype: bytes
         """
 
-        if self._quitonerror == ERR_RAISE:
-            raise err from err
-        if self._quitonerror == ERR_LOG:
-            # pass to error handler if there is one
-            if self._errorhandler is None:
-                self._logger.error(err)
-            else:
-                self._errorhandler(err)
+        if size is None:
+            return self._stream.readline()
+        if self._sizedreadline:
+            try:
+                return self._stream.readline(size)
+            except TypeError:  # e.g. readline(self) with no size argument
+                self._sizedreadline = False
+        data = self._stream.readline()
+        if len(data) > size:
+            self._unread(data[size:])
+            data = data[:size]
+        return data
+
+    def _unread(self, data: bytes):
+        """
+        Push data back for reframing.
+
+        :param bytes data: data
+        """
+
+        self._pushback = data + self._pushback[self._pbpos :]
+        self._pbpos = 0
+
+    def _count_error(self, err: Exception):
+        """
+        Update error statistics.
+
+        :param Exception err: error
+        """
+
+        stats = self._stats
+        if isinstance(err, nme.NMEATypeError):
+            stats["typeerrors"] += 1
+        elif isinstance(err, nme.NMEAChecksumError):
+            stats["checksum"] += 1
+        elif isinstance(err, nme.NMEAHeaderError):
+            pass  # already counted in badheaders
+        elif isinstance(err, nme.NMEALengthError):
+            stats["overlong"] += 1
+        elif isinstance(err, nme.NMEAParseError) and isinstance(
+            err.args[0] if err.args else None, nme.NMEAMessageError
+        ):
+            stats["unknown"] += 1  # unknown talker or msgID with VALMSGID
+        else:
+            stats["errors"] += 1
+
+    def reset_stats(self):
+        """
+        Reset reader statistics to zero.
+        """
+
+        for key in (
+            "bytes",
+            "discarded",
+            "framed",
+            "checksum",
+            "unknown",
+            "typeerrors",
+            "badheaders",
+            "binary",
+            "overlong",
+            "errors",
+        ):
+            self._stats[key] = 0
+        self._identities.clear()
+        if self._framer is not None:
+            self._framer.reset_counts()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for snapshot of reader statistics.
+
+        - bytes: bytes consumed (framed sentences plus discarded data)
+        - discarded: non-NMEA bytes discarded
+        - framed: NMEA sentences framed
+        - identities: dict of parsed message counts by identity
+        - checksum: checksum failures
+        - unknown: unknown talkers or msgIDs
+        - typeerrors: NMEATypeErrors
+        - badheaders: non-NMEA headers (e.g. b"$&") seen
+        - binary: UBX or RTCM3 frames skipped (included in discarded bytes)
+        - overlong: sentences exceeding maximum length (included in discarded bytes)
+        - errors: other parsing errors
+
+        :return: dict of statistics
+        :rtype: dict
+        """
+
+        stats = dict(self._stats)
+        if self._framer is not None:
+            stats["discarded"] += self._framer.discarded
+            stats["badheaders"] += self._framer.badheaders
+            stats["binary"] += self._framer.binframes
+        stats["bytes"] += stats["discarded"]
+        stats["identities"] = dict(self._identities)
+        return stats
 
     @property
     def datastream(self) -> object:
@@ -239,6 +849,9 @@ class NMEAReader:
         msgmode: Literal[0, 1, 2] = GET,
         validate: int = VALCKSUM,
         userdefined: dict | NoneType = None,
+        lazy: bool = False,
+        msgclasses: bool = False,
+        fields: dict | NoneType = None,
     ) -> NMEAMessage | NoneType:
         """
         Parse NMEA byte stream to NMEAMessage object.
@@ -248,26 +861,154 @@ class NMEAReader:
         :param int validate: VALNONE (0), VALCKSUM (1), VALMSGID (2),
             (can be OR'd) (1)
         :param dict | NoneType userdefined: user-defined payload definition dictionary (None)
+        :param bool lazy: decode message attributes on first access (False)
+        :param bool msgclasses: True = parse standard GET sentences of fixed length
+            using generated message classes (False)
+        :param dict | NoneType fields: if specified, dict of msgID or identity to names of the
+            only attributes to be set for that sentence type
+            e.g. {"GGA": ("time", "lat", "lon", "quality")} (None)
         :return: NMEAMessage object (or None if unknown message and VALMSGID is not set)
         :rtype: NMEAMessage | NoneType
         :raises: NMEAParseError (if data stream contains invalid data or unknown message type)
 
         """
+        # pylint: disable=too-many-arguments
 
-        if msgmode not in (0, 1, 2):
-            raise nme.NMEAParseError(
-                f"Invalid parse mode {msgmode} - must be 0, 1 or 2."
-            )
+        NMEAReader._check_msgmode(msgmode, "parse")
+        return NMEAReader._parse(
+            message, msgmode, validate, userdefined, lazy, msgclasses, fields
+        )
+
+    @staticmethod
+    def try_parse(
+        message: bytes,
+        msgmode: Literal[0, 1, 2] = GET,
+        validate: int = VALCKSUM,
+        userdefined: dict | NoneType = None,
+        lazy: bool = False,
+        msgclasses: bool = False,
+        fields: dict | NoneType = None,
+    ) -> tuple[int, NMEAMessage | NoneType]:
+        """
+        Parse NMEA byte stream to NMEAMessage object, returning a result code
+        rather than raising an exception if the sentence is unknown, has an
+        invalid checksum or is badly formed.
+
+        Result codes are PARSE_OK (0), PARSE_UNKNOWN (1), PARSE_BADCKSUM (2),
+        PARSE_MALFORMED (3) or PARSE_BADTYPE (4). If the sentence is unknown
+        and VALMSGID is not set, the nominal NMEAMessage object is returned
+        with PARSE_UNKNOWN.
+
+        :param bytes message: bytes message to parse
+        :param Literal[0, 1, 2] msgmode: 0=GET, 1=SET, 2=POLL (0)
+        :param int validate: VALNONE (0), VALCKSUM (1), VALMSGID (2),
+            (can be OR'd) (1)
+        :param dict | NoneType userdefined: user-defined payload definition dictionary (None)
+        :param bool lazy: decode message attributes on first access (False)
+        :param bool msgclasses: True = parse standard GET sentences of fixed length
+            using generated message classes (False)
+        :param dict | NoneType fields: if specified, dict of msgID or identity to names of the
+            only attributes to be set for that sentence type
+            e.g. {"GGA": ("time", "lat", "lon", "quality")} (None)
+        :return: tuple of (result code, NMEAMessage object or None)
+        :rtype: tuple[int, NMEAMessage | NoneType]
+        :raises: NMEAParseError (if mode is invalid)
+        """
+        # pylint: disable=too-many-arguments
+
+        NMEAReader._check_msgmode(msgmode, "parse")
+        return NMEAReader._try_parse(
+            message, msgmode, validate, userdefined, lazy, msgclasses, fields
+        )
+
+    @staticmethod
+    def parse_many(
+        messages: Iterable,
+        msgmode: Literal[0, 1, 2] = GET,
+        validate: int = VALCKSUM,
+        userdefined: dict | NoneType = None,
+        lazy: bool = False,
+        msgclasses: bool = False,
+        fields: dict | NoneType = None,
+    ) -> list[NMEAMessage | NoneType]:
+        """
+        Parse an iterable of NMEA messages to a list of NMEAMessage objects.
+        Arguments are validated once per batch rather than once per message.
+
+        :param Iterable messages: iterable of bytes or string messages to parse
+        :param Literal[0, 1, 2] msgmode: 0=GET, 1=SET, 2=POLL (0)
+        :param int validate: VALNONE (0), VALCKSUM (1), VALMSGID (2),
+            (can be OR'd) (1)
+        :param dict | NoneType userdefined: user-defined payload definition dictionary (None)
+        :param bool lazy: decode message attributes on first access (False)
+        :param bool msgclasses: True = parse standard GET sentences of fixed length
+            using generated message classes (False)
+        :param dict | NoneType fields: if specified, dict of msgID or identity to names of the
+            only attributes to be set for that sentence type
+            e.g. {"GGA": ("time", "lat", "lon", "quality")} (None)
+        :return: list of NMEAMessage objects (or None if unknown message
+            and VALMSGID is not set), in the same order as the input
+        :rtype: list[NMEAMessage | NoneType]
+        :raises: NMEAParseError (if any message contains invalid data or unknown message type)
+        """
+        # pylint: disable=too-many-arguments
+
+        NMEAReader._check_msgmode(msgmode, "parse")
+        parse = NMEAReader._parse
+        fields = _fieldsets(fields)
+        return [
+            parse(msg, msgmode, validate, userdefined, lazy, msgclasses, fields)
+            for msg in messages
+        ]
+
+    @staticmethod
+    def _parse(
+        message: bytes,
+        msgmode: Literal[0, 1, 2],
+        validate: int,
+        userdefined: dict | NoneType,
+        lazy: bool = False,
+        msgclasses: bool = False,
+        fields: dict | NoneType = None,
+    ) -> NMEAMessage | NoneType:
+        """
+        Parse NMEA byte stream to NMEAMessage object, without validating
+        arguments (see parse() for details).
+
+        :param bytes message: bytes message to parse
+        :param Literal[0, 1, 2] msgmode: 0=GET, 1=SET, 2=POLL
+        :param int validate: VALNONE (0), VALCKSUM (1), VALMSGID (2), (can be OR'd)
+        :param dict | NoneType userdefined: user-defined payload definition dictionary
+        :param bool lazy: decode message attributes on first access (False)
+        :param bool msgclasses: parse standard GET sentences of fixed length
+            using generated message classes (False)
+        :param dict | NoneType fields: dict of msgID or identity to names of the only
+            attributes to be set for that sentence type (None)
+        :return: NMEAMessage object (or None if unknown message and VALMSGID is not set)
+        :rtype: NMEAMessage | NoneType
+        :raises: NMEAParseError (if data stream contains invalid data or unknown message type)
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
 
         try:
+            tagblock = None
+            if message[:1] == b"\x5c":  # leading TAG block
+                tagblock, message = get_tagblock(message, validate & VALCKSUM)
             content, talker, msgid, payload, checksum = get_parts(message)
             if validate & VALCKSUM:
                 ccksum = calc_checksum(content)
                 if checksum.upper() != ccksum:
-                    raise nme.NMEAParseError(
+                    raise nme.NMEAChecksumError(
                         f"Message {talker}{msgid} invalid checksum {checksum}"
                         f" - should be {ccksum}."
                     )
+            projection = _projection(fields, talker, msgid, payload)
+            if msgclasses and msgmode == GET and not lazy and projection is None:
+                msgclass = get_message_class(msgid)
+                if msgclass is not None:
+                    return msgclass.from_payload(
+                        talker, payload, checksum, validate, tagblock
+                    )
             return NMEAMessage(
                 talker,
                 msgid,
@@ -276,9 +1017,99 @@ class NMEAReader:
                 checksum=checksum,
                 validate=validate,
                 userdefined=userdefined,
+                lazy=lazy,
+                tagblock=tagblock,
+                fields=projection,
             )
 
         except nme.NMEAMessageError as err:
             if validate & VALMSGID:
                 raise nme.NMEAParseError(err)
             return None
+
+    @staticmethod
+    def _try_parse(
+        message: bytes,
+        msgmode: Literal[0, 1, 2],
+        validate: int,
+        userdefined: dict | NoneType,
+        lazy: bool = False,
+        msgclasses: bool = False,
+        fields: dict | NoneType = None,
+    ) -> tuple[int, NMEAMessage | NoneType]:
+        """
+        Parse NMEA byte stream to NMEAMessage object with result code, without
+        validating arguments (see try_parse() for details).
+
+        Unknown talkers and msgIDs, invalid checksums and badly formed sentences
+        are detected before any message object is constructed.
+
+        :param bytes message: bytes message to parse
+        :param Literal[0, 1, 2] msgmode: 0=GET, 1=SET, 2=POLL
+        :param int validate: VALNONE (0), VALCKSUM (1), VALMSGID (2), (can be OR'd)
+        :param dict | NoneType userdefined: user-defined payload definition dictionary
+        :param bool lazy: decode message attributes on first access (False)
+        :param bool msgclasses: parse standard GET sentences of fixed length
+            using generated message classes (False)
+        :param dict | NoneType fields: dict of msgID or identity to names of the only
+            attributes to be set for that sentence type (None)
+        :return: tuple of (result code, NMEAMessage object or None)
+        :rtype: tuple[int, NMEAMessage | NoneType]
+        """
+        # pylint: disable=too-many-return-statements, protected-access
+        # pylint: disable=too-many-arguments, too-many-locals
+
+        tagblock = None
+        try:
+            if message[:1] == b"\x5c":  # leading TAG block
+                tagblock, message = get_tagblock(message, validate & VALCKSUM)
+            if not isinstance(message, str):
+                message = str(message, "utf-8")
+        except nme.NMEAParseError:
+            return (PARSE_BADCKSUM, None)
+        except (nme.NMEAMessageError, UnicodeDecodeError):
+            return (PARSE_MALFORMED, None)
+        if "*" not in message:
+            return (PARSE_MALFORMED, None)
+        content, talker, msgid, payload, checksum = get_parts(message)
+        if validate & VALCKSUM and checksum.upper() != calc_checksum(content):
+            return (PARSE_BADCKSUM, None)
+        if validate & VALMSGID and (
+            talker not in NMEA_TALKERS
+            or not (
+                msgid in NMEA_MSGIDS
+                or msgid in NMEA_MSGIDS_PROP
+                or msgid in NMEA_PREFIX_PROP
+                or (userdefined is not None and msgid in userdefined)
+            )
+        ):
+            return (PARSE_UNKNOWN, None)
+
+        try:
+            projection = _projection(fields, talker, msgid, payload)
+            if msgclasses and msgmode == GET and not lazy and projection is None:
+                msgclass = get_message_class(msgid)
+                if msgclass is not None:
+                    msg = msgclass.from_payload(
+                        talker, payload, checksum, validate, tagblock
+                    )
+                    return (PARSE_OK, msg)
+            msg = NMEAMessage(
+                talker,
+                msgid,
+                msgmode,
+                payload=payload,
+                checksum=checksum,
+                validate=validate,
+                userdefined=userdefined,
+                lazy=lazy,
+                tagblock=tagblock,
+                fields=projection,
+            )
+        except nme.NMEATypeError:
+            return (PARSE_BADTYPE, None)
+        except nme.NMEAMessageError:  # unknown proprietary msgId with VALMSGID
+            return (PARSE_UNKNOWN, None)
+        if msg._plan is None:  # no payload definition, nominal attributes only
+            return (PARSE_UNKNOWN, msg)
+        return (PARSE_OK, msg)
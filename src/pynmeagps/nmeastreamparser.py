@@ -0,0 +1,199 @@
+"""
+NMEAStreamParser class.
+
+Sans-IO incremental NMEA parser. The caller feeds arbitrary
+chunks of data (which may include partial sentences) via the
+feed() method and retrieves any completed (raw, parsed) pairs
+via the events() method:
+
+`parser = NMEAStreamParser()`
+`parser.feed(data)`
+`for raw, parsed in parser.events():`
+
+Message mode, validation, nmeaonly, error handling, message filter,
+parsing, lazy decoding, field projection, message class, AIS decoding
+and user-defined payload semantics are as for NMEAReader.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments
+
+from collections.abc import Iterable, Iterator
+from types import FunctionType, NoneType
+from typing import Literal
+
+from pynmeagps.nmeaais import AISMessage
+from pynmeagps.nmeaframer import NMEAFramer
+from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeareader import NMEA_ERRORS, NMEAHandler
+from pynmeagps.nmeatypes_core import ERR_LOG, GET, NMEA_MAXLEN, VALCKSUM
+
+
+class NMEAStreamParser(NMEAHandler):
+    """
+    NMEAStreamParser class.
+    """
+
+    def __init__(
+        self,
+        msgmode: Literal[0, 1, 2] = GET,
+        validate: int = VALCKSUM,
+        nmeaonly: bool = False,
+        quitonerror: Literal[0, 1, 2] = ERR_LOG,
+        errorhandler: FunctionType | NoneType = None,
+        userdefined: dict | NoneType = None,
+        parsing: bool = True,
+        binaryhandler: FunctionType | NoneType = None,
+        maxlen: int = NMEA_MAXLEN,
+        decodeais: bool = False,
+        lazy: bool = False,
+        msgfilter: Iterable[str] | NoneType = None,
+        filterraw: bool = False,
+        msgclasses: bool = False,
+        fields: dict | NoneType = None,
+    ):
+        """Constructor.
+
+        :param Literal[0,1,2] msgmode: 0=GET, 1=SET, 2=POLL (0)
+        :param int validate: VALNONE (0), VALCKSUM (1), VALMSGID (2),
+            (can be OR'd) (1)
+        :param bool nmeaonly: True = error on non-NMEA data, False = ignore non-NMEA data
+        :param Literal[0,1,2] quitonerror: ERR_IGNORE (0) = ignore errors,
+            ERR_LOG (1) = log continue, ERR_RAISE (2) = (re)raise (1)
+        :param FunctionType | NoneType errorhandler: error handling callback function (None)
+        :param dict | NoneType userdefined: user-defined payload definition dictionary (None)
+        :param bool parsing: True = parse sentences, False = return validated raw
+            sentences only, as (raw, None) (True)
+        :param FunctionType | NoneType binaryhandler: callback function which is
+            passed any skipped UBX or RTCM3 frame as bytes (None)
+        :param int maxlen: maximum NMEA sentence length in bytes; if exceeded, the
+            reader resynchronises at the next start byte, 0 = unbounded (1024)
+        :param bool decodeais: True = reassemble and decode AIS messages in VDM and
+            VDO sentences, returned as (raw, AISMessage) (False)
+        :param bool lazy: decode message attributes on first access (False)
+        :param Iterable[str] | NoneType msgfilter: if specified, only parse sentences
+            whose header (e.g. "GNGGA") or msgID (e.g. "GGA") is in this collection (None)
+        :param bool filterraw: True = return filtered-out sentences as (raw, None),
+            False = skip filtered-out sentences (False)
+        :param bool msgclasses: True = parse standard GET sentences of fixed length
+            using generated message classes (False)
+        :param dict | NoneType fields: if specified, dict of msgID or identity to names of the
+            only attributes to be set for that sentence type
+            e.g. {"GGA": ("time", "lat", "lon", "quality")} (None)
+        :raises: NMEAParseError (if mode is invalid)
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
+
+        super().__init__(
+            msgmode,
+            validate,
+            quitonerror,
+            errorhandler,
+            userdefined,
+            lazy,
+            msgfilter,
+            filterraw,
+            parsing,
+            decodeais,
+            msgclasses,
+            fields,
+        )
+        self._framer = NMEAFramer(
+            nmeaonly=nmeaonly, binaryhandler=binaryhandler, maxlen=maxlen
+        )
+
+    def feed(self, data: bytes):
+        """
+        Append data to parser buffer.
+
+        :param bytes data: data (which may include partial sentences)
+        """
+
+        self._framer.feed(data)
+
+    def events(
+        self, eof: bool = False
+    ) -> Iterator[tuple[bytes, NMEAMessage | AISMessage | NoneType]]:
+        """
+        Generator yielding each complete NMEA message in the buffer.
+        Stops when the buffer contains no further complete sentences.
+
+        :param bool eof: True = no further data will be fed (until the next
+            call to feed()), so any incomplete binary frame in the buffer is
+            treated as invalid and framing resumes from the following byte (False)
+        :return: iterator of (raw_data as bytes, parsed_data as NMEAMessage
+            or AISMessage)
+        :rtype: Iterator[tuple[bytes, NMEAMessage | AISMessage | NoneType]]
+        :raises: NMEAParseError (if nmeaonly=True and data includes non-NMEA data)
+        """
+
+        if eof:
+            self._framer.set_eof()
+        while True:
+            try:
+                raw_data = self._framer.next_frame()
+                if raw_data is None:
+                    return
+                result = self._handle(raw_data)
+            except NMEA_ERRORS as err:
+                if self._quitonerror:
+                    self._do_error(err)
+                continue
+            if result is not None:
+                yield result
+
+    def reset_counts(self):
+        """
+        Reset discarded byte, non-NMEA header and binary frame counts to zero.
+        """
+
+        self._framer.reset_counts()
+
+    @property
+    def discarded(self) -> int:
+        """
+        Getter for number of non-NMEA bytes discarded.
+
+        :return: number of bytes
+        :rtype: int
+        """
+
+        return self._framer.discarded
+
+    @property
+    def badheaders(self) -> int:
+        """
+        Getter for number of non-NMEA headers seen.
+
+        :return: number of headers
+        :rtype: int
+        """
+
+        return self._framer.badheaders
+
+    @property
+    def binframes(self) -> int:
+        """
+        Getter for number of UBX or RTCM3 frames skipped.
+
+        :return: number of frames
+        :rtype: int
+        """
+
+        return self._framer.binframes
+
+    @property
+    def in_waiting(self) -> int:
+        """
+        Getter for number of unframed bytes in buffer.
+
+        :return: number of bytes
+        :rtype: int
+        """
+
+        return self._framer.in_waiting
@@ -0,0 +1,210 @@
+"""
+AIS (ITU-R M.1371) message payload definitions
+
+THESE ARE THE BIT FIELD DEFINITIONS FOR AIS MESSAGES ENCAPSULATED
+IN !AIVDM / !AIVDO SENTENCES.
+
+Each field is defined as a tuple thus
+    (name, bits, type, scale)
+    where
+    - 'type' is one of AIS_UINT, AIS_INT, AIS_BOOL or AIS_TEXT
+    - 'scale' is a divisor to be applied to numeric values,
+      or 0 if the value is not scaled
+
+Message types 24A and 24B are the two parts of a type 24 (Static
+Data Report) message, distinguished by the 'partno' field.
+
+Created on 17 Oct 2026
+
+While ITU-R M.1371 is a published standard, the information here
+has been collated from public domain sources.
+
+:author: semuadmin (Steve Smith)
+"""
+
+AIS_SENTENCES = ("VDM", "VDO")
+"""NMEA sentences encapsulating AIS messages"""
+
+AIS_UINT = "U"  # Unsigned Integer
+AIS_INT = "I"  # Signed (two's complement) Integer
+AIS_BOOL = "B"  # Boolean
+AIS_TEXT = "T"  # 6-bit ASCII text
+
+AIS_SIXBIT = "@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_ !\"#$%&'()*+,-./0123456789:;<=>?"
+"""AIS 6-bit ASCII character set, indexed by 6-bit value"""
+
+AIS_OCTAL = {
+    code: f"{code - 48 if code < 88 else code - 56:02o}"
+    for code in (*range(48, 88), *range(96, 120))
+}
+"""
+AIS payload armouring table, mapping each armoured payload character
+to its 6-bit value as a 2-digit octal string, for use with str.translate()
+"""
+
+AIS_LATLON = 600000
+"""Scale of AIS latitude and longitude (1/10000 minute)"""
+
+AIS_MSGTYPES = {
+    1: "Position Report Class A",
+    2: "Position Report Class A (Assigned schedule)",
+    3: "Position Report Class A (Response to interrogation)",
+    4: "Base Station Report",
+    5: "Static and Voyage Related Data",
+    18: "Standard Class B CS Position Report",
+    19: "Extended Class B Equipment Position Report",
+    21: "Aid-to-Navigation Report",
+    24: "Static Data Report",
+}
+"""Decoded AIS message types"""
+
+AIS_HEADER = (
+    ("msgtype", 6, AIS_UINT, 0),
+    ("repeat", 2, AIS_UINT, 0),
+    ("mmsi", 30, AIS_UINT, 0),
+)
+"""Common AIS message header"""
+
+AIS_POSITION_A = AIS_HEADER + (
+    ("status", 4, AIS_UINT, 0),
+    ("turn", 8, AIS_INT, 0),
+    ("speed", 10, AIS_UINT, 10),
+    ("accuracy", 1, AIS_BOOL, 0),
+    ("lon", 28, AIS_INT, AIS_LATLON),
+    ("lat", 27, AIS_INT, AIS_LATLON),
+    ("course", 12, AIS_UINT, 10),
+    ("heading", 9, AIS_UINT, 0),
+    ("second", 6, AIS_UINT, 0),
+    ("maneuver", 2, AIS_UINT, 0),
+    ("spare", 3, AIS_UINT, 0),
+    ("raim", 1, AIS_BOOL, 0),
+    ("radio", 19, AIS_UINT, 0),
+)
+
+AIS_DIMENSIONS = (
+    ("to_bow", 9, AIS_UINT, 0),
+    ("to_stern", 9, AIS_UINT, 0),
+    ("to_port", 6, AIS_UINT, 0),
+    ("to_starboard", 6, AIS_UINT, 0),
+)
+
+AIS_PAYLOADS = {
+    "1": AIS_POSITION_A,
+    "2": AIS_POSITION_A,
+    "3": AIS_POSITION_A,
+    "4": AIS_HEADER
+    + (
+        ("year", 14, AIS_UINT, 0),
+        ("month", 4, AIS_UINT, 0),
+        ("day", 5, AIS_UINT, 0),
+        ("hour", 5, AIS_UINT, 0),
+        ("minute", 6, AIS_UINT, 0),
+        ("second", 6, AIS_UINT, 0),
+        ("accuracy", 1, AIS_BOOL, 0),
+        ("lon", 28, AIS_INT, AIS_LATLON),
+        ("lat", 27, AIS_INT, AIS_LATLON),
+        ("epfd", 4, AIS_UINT, 0),
+        ("spare", 10, AIS_UINT, 0),
+        ("raim", 1, AIS_BOOL, 0),
+        ("radio", 19, AIS_UINT, 0),
+    ),
+    "5": AIS_HEADER
+    + (
+        ("ais_version", 2, AIS_UINT, 0),
+        ("imo", 30, AIS_UINT, 0),
+        ("callsign", 42, AIS_TEXT, 0),
+        ("shipname", 120, AIS_TEXT, 0),
+        ("shiptype", 8, AIS_UINT, 0),
+    )
+    + AIS_DIMENSIONS
+    + (
+        ("epfd", 4, AIS_UINT, 0),
+        ("month", 4, AIS_UINT, 0),
+        ("day", 5, AIS_UINT, 0),
+        ("hour", 5, AIS_UINT, 0),
+        ("minute", 6, AIS_UINT, 0),
+        ("draught", 8, AIS_UINT, 10),
+        ("destination", 120, AIS_TEXT, 0),
+        ("dte", 1, AIS_BOOL, 0),
+        ("spare", 1, AIS_UINT, 0),
+    ),
+    "18": AIS_HEADER
+    + (
+        ("reserved", 8, AIS_UINT, 0),
+        ("speed", 10, AIS_UINT, 10),
+        ("accuracy", 1, AIS_BOOL, 0),
+        ("lon", 28, AIS_INT, AIS_LATLON),
+        ("lat", 27, AIS_INT, AIS_LATLON),
+        ("course", 12, AIS_UINT, 10),
+        ("heading", 9, AIS_UINT, 0),
+        ("second", 6, AIS_UINT, 0),
+        ("reserved2", 2, AIS_UINT, 0),
+        ("cs", 1, AIS_BOOL, 0),
+        ("display", 1, AIS_BOOL, 0),
+        ("dsc", 1, AIS_BOOL, 0),
+        ("band", 1, AIS_BOOL, 0),
+        ("msg22", 1, AIS_BOOL, 0),
+        ("assigned", 1, AIS_BOOL, 0),
+        ("raim", 1, AIS_BOOL, 0),
+        ("radio", 20, AIS_UINT, 0),
+    ),
+    "19": AIS_HEADER
+    + (
+        ("reserved", 8, AIS_UINT, 0),
+        ("speed", 10, AIS_UINT, 10),
+        ("accuracy", 1, AIS_BOOL, 0),
+        ("lon", 28, AIS_INT, AIS_LATLON),
+        ("lat", 27, AIS_INT, AIS_LATLON),
+        ("course", 12, AIS_UINT, 10),
+        ("heading", 9, AIS_UINT, 0),
+        ("second", 6, AIS_UINT, 0),
+        ("reserved2", 4, AIS_UINT, 0),
+        ("shipname", 120, AIS_TEXT, 0),
+        ("shiptype", 8, AIS_UINT, 0),
+    )
+    + AIS_DIMENSIONS
+    + (
+        ("epfd", 4, AIS_UINT, 0),
+        ("raim", 1, AIS_BOOL, 0),
+        ("dte", 1, AIS_BOOL, 0),
+        ("assigned", 1, AIS_BOOL, 0),
+        ("spare", 4, AIS_UINT, 0),
+    ),
+    "21": AIS_HEADER
+    + (
+        ("aid_type", 5, AIS_UINT, 0),
+        ("name", 120, AIS_TEXT, 0),
+        ("accuracy", 1, AIS_BOOL, 0),
+        ("lon", 28, AIS_INT, AIS_LATLON),
+        ("lat", 27, AIS_INT, AIS_LATLON),
+    )
+    + AIS_DIMENSIONS
+    + (
+        ("epfd", 4, AIS_UINT, 0),
+        ("second", 6, AIS_UINT, 0),
+        ("off_position", 1, AIS_BOOL, 0),
+        ("regional", 8, AIS_UINT, 0),
+        ("raim", 1, AIS_BOOL, 0),
+        ("virtual_aid", 1, AIS_BOOL, 0),
+        ("assigned", 1, AIS_BOOL, 0),
+        ("spare", 1, AIS_UINT, 0),
+        ("name_ext", 88, AIS_TEXT, 0),  # variable length, 0-88 bits
+    ),
+    "24A": AIS_HEADER
+    + (
+        ("partno", 2, AIS_UINT, 0),
+        ("shipname", 120, AIS_TEXT, 0),
+    ),
+    "24B": AIS_HEADER
+    + (
+        ("partno", 2, AIS_UINT, 0),
+        ("shiptype", 8, AIS_UINT, 0),
+        ("vendorid", 18, AIS_TEXT, 0),
+        ("model", 4, AIS_UINT, 0),
+        ("serial", 20, AIS_UINT, 0),
+        ("callsign", 42, AIS_TEXT, 0),
+    )
+    + AIS_DIMENSIONS
+    + (("spare", 6, AIS_UINT, 0),),
+}
+"""AIS message payload definitions, keyed by message type"""
@@ -44,6 +44,16 @@ ERR_LOG = 1
 """Log errors"""
 ERR_IGNORE = 0
 """Ignore errors"""
+PARSE_OK = 0
+"""Sentence parsed successfully"""
+PARSE_UNKNOWN = 1
+"""Unknown talker or msgID"""
+PARSE_BADCKSUM = 2
+"""Invalid sentence or TAG block checksum"""
+PARSE_MALFORMED = 3
+"""Badly formed sentence"""
+PARSE_BADTYPE = 4
+"""Invalid attribute value for type"""
 DEF_STND = 0
 """Standard message definition"""
 DEF_PROP = 1
@@ -54,6 +64,14 @@ DEF_UNKN = 3
 """Unknown (not public domain) message definition"""
 DEFAULT_BUFSIZE = 4096
 """Default socket buffer size"""
+MAX_HDRLEN = 32
+"""Maximum number of bytes inspected for NMEA sentence header (talker + msgID)"""
+NMEA_MAXLEN = 1024
+"""Default maximum NMEA sentence length in bytes (0 = unbounded)"""
+MAX_TAGLEN = 80
+"""Maximum length of NMEA TAG block in bytes, including delimiters"""
+TAG_INTS = ("c", "n", "r")
+"""TAG block parameters with integer values (source time, line count, relative time)"""
 ENCODE_NONE = 0
 """No socket encoding"""
 ENCODE_CHUNKED = 1
@@ -231,7 +249,20 @@ NMEA_TALKERS = {
 """Recognised NMEA Talkers."""
 
 # format list of permissible NMEA 2-byte header sequences
-NMEA_HDR = {b"\x24" + i[0:1].encode("utf-8") for i in NMEA_TALKERS}
+# ('$' for parametric sentences, '!' for encapsulation sentences)
+NMEA_HDR = {
+    start + i[0:1].encode("utf-8") for i in NMEA_TALKERS for start in (b"\x24", b"\x21")
+}
+
+# binary protocol headers which may be interleaved with NMEA
+UBX_HDR = b"\xb5\x62"
+"""UBX protocol header"""
+RTCM3_HDR = b"\xd3"
+"""RTCM3 protocol header"""
+BINARY_START = {UBX_HDR[0:1], RTCM3_HDR}
+"""Start bytes of binary protocol frames"""
+IEC61162_HDR = b"UdPbC\x00"
+"""IEC 61162-450 sentence datagram header"""
 
 # ****************************************************************************
 # THESE ARE THE NMEA PROTOCOL CORE MESSAGE IDENTITIES
@@ -761,3 +792,11 @@ therefore a combination of `prefix` + `msgId`.
 
 NB: There are some exceptions which require special handling e.g. `PASHR`.
 """
+
+NMEA_ENCAPSULATED = ("ABM", "BBM", "VDM", "VDO")
+"""
+Encapsulation sentences, which are prefixed with '!' rather than '$'.
+
+The final payload field of each is an armoured 6-bit binary
+payload, e.g. an AIS (ITU-R M.1371) message.
+"""
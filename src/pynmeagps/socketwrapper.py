@@ -12,10 +12,11 @@ Created on 12 Feb 2023
 :license: BSD 3-Clause
 """
 
+# pylint: disable=too-many-instance-attributes
+
 import socket
-from io import BytesIO
 from logging import getLogger
-from zlib import MAX_WBITS, decompress
+from zlib import MAX_WBITS, decompressobj
 from zlib import error as zlibError
 
 from pynmeagps.nmeatypes_core import (
@@ -27,12 +28,24 @@ from pynmeagps.nmeatypes_core import (
     ENCODE_NONE,
 )
 
+# chunked transfer-encoding parser states
+CHUNK_SIZE = 0  # reading chunk size line
+CHUNK_DATA = 1  # reading chunk data
+CHUNK_END = 2  # reading CRLF following chunk data
+CHUNK_DONE = 3  # final (zero length) chunk received
+
 
 class SocketWrapper:
     """
     Socket stream wrapper providing read(n) and readline() methods.
 
-    Supports chunked transfer-encoded datastreams.
+    Supports chunked and/or compressed transfer-encoded datastreams.
+    Compressed data is decoded as a continuous stream, so compressed
+    blocks may span any number of chunks.
+
+    Data is received via socket.recv_into() into a preallocated
+    buffer, which is consumed using read and write offsets, so
+    neither reads nor line scans copy the unread remainder.
     """
 
     def __init__(
@@ -44,7 +57,7 @@ class SocketWrapper:
         :param socket.socket sock: socket object
         :param int encoding: transfer-encoding values \
             (0 = none, 1 = chunk, 2 = gzip, 4 = compress, 8 = deflate (can be OR'd) (0)
-        :param int bufsize: internal buffer size
+        :param int bufsize: maximum bytes received from socket at a time
         """
 
         # configure logger with name "pygnssutils" in calling module
@@ -52,10 +65,46 @@ class SocketWrapper:
         self._socket = sock
         self._bufsize = bufsize
         self._encoding = encoding
-        self._buffer = bytearray()
-        self._partial = b""  # partial chunk
+        self._buffer = bytearray(bufsize)
+        self._rpos = 0  # read offset
+        self._wpos = 0  # write offset
+        self._scratch = bytearray(bufsize) if encoding else None  # encoded data
+        self._chunkstate = CHUNK_SIZE
+        self._chunkremaining = 0  # bytes remaining in current chunk
+        self._sizeline = bytearray()  # partial chunk size line
+        # one streaming decompressor per compression type, in order of application
+        self._wbits = [
+            wbits
+            for enc, wbits in (
+                (ENCODE_GZIP, MAX_WBITS | 16),
+                (ENCODE_COMPRESS, MAX_WBITS),
+                (ENCODE_DEFLATE, -MAX_WBITS),
+            )
+            if encoding & enc
+        ]
+        self._decompressors = [decompressobj(wbits=wbits) for wbits in self._wbits]
         self._recv()  # populate initial buffer
 
+    def _reserve(self, size: int):
+        """
+        Ensure there is space for the specified number of bytes
+        at the write offset, compacting or enlarging the buffer
+        as necessary.
+
+        :param int size: number of bytes
+        """
+
+        buf = self._buffer
+        if len(buf) - self._wpos >= size:
+            return
+        unread = self._wpos - self._rpos
+        if self._rpos:  # move unread data to start of buffer
+            buf[:unread] = buf[self._rpos : self._wpos]
+            self._rpos = 0
+            self._wpos = unread
+        if len(buf) - unread < size:
+            buf.extend(bytes(max(size, len(buf))))
+
     def _recv(self) -> bool:
         """
         Read bytes from socket into internal buffer.
@@ -65,15 +114,27 @@ class SocketWrapper:
         """
 
         try:
-            data = self._socket.recv(self._bufsize)
-            if len(data) == 0:
-                return False
-            if self._encoding & ENCODE_CHUNKED:
-                data = self._partial + data
-                chunks, self._partial = self.dechunk(data)
-                self._buffer += chunks
+            if self._encoding:
+                num = self._socket.recv_into(self._scratch, self._bufsize)
+                if num == 0:
+                    return False
+                data = self._scratch[:num]
+                if self._encoding & ENCODE_CHUNKED:
+                    data, _ = self.dechunk(data)
+                else:
+                    data = self._decompress(data)
+                self._reserve(len(data))
+                self._buffer[self._wpos : self._wpos + len(data)] = data
+                self._wpos += len(data)
             else:
-                self._buffer += data
+                self._reserve(self._bufsize)
+                with memoryview(self._buffer) as view:
+                    num = self._socket.recv_into(
+                        view[self._wpos : self._wpos + self._bufsize]
+                    )
+                if num == 0:
+                    return False
+                self._wpos += num
         except (OSError, TimeoutError):
             return False
         return True
@@ -89,33 +150,53 @@ class SocketWrapper:
         """
 
         # if at end of internal buffer, top it up from socket
-        while len(self._buffer) < num:
+        while self._wpos - self._rpos < num:
             if not self._recv():
                 return b""
-        data = self._buffer[:num]
-        self._buffer = self._buffer[num:]
-        return bytes(data)
+        return self._consume(self._rpos + num)
 
-    def readline(self) -> bytes:
+    def readline(self, size: int = -1) -> bytes:
         """
-        Read bytes from buffer until CRLF reached.
+        Read bytes from buffer until CRLF reached, or until
+        specified maximum number of bytes have been read.
         NB: always check that return data terminator is CRLF.
 
+        :param int size: maximum number of bytes to read, -1 = unbounded (-1)
         :returns: bytes
         :rtype: bytes
         """
 
-        line = b""
+        scanned = 0  # bytes already scanned for terminator
         while True:
-            data = self.read(1)
-            if len(data) == 1:
-                line += data
-                if line[-2:] == b"\r\n":
-                    break
-            else:
-                break
+            rpos = self._rpos
+            end = self._buffer.find(b"\r\n", rpos + scanned, self._wpos) + 2
+            if end > 1:
+                if size < 0 or end - rpos <= size:
+                    return self._consume(end)
+                return self._consume(rpos + size)
+            if 0 <= size <= self._wpos - rpos:
+                return self._consume(rpos + size)
+            scanned = max(self._wpos - rpos - 1, 0)  # CR may be last byte
+            if not self._recv():
+                return self._consume(self._wpos)
+
+    def _consume(self, end: int) -> bytes:
+        """
+        Return data from read offset up to specified offset and
+        advance read offset.
+
+        :param int end: end offset
+        :returns: bytes
+        :rtype: bytes
+        """
 
-        return line
+        with memoryview(self._buffer) as view:
+            data = bytes(view[self._rpos : end])
+        if end == self._wpos:  # buffer fully consumed
+            self._rpos = self._wpos = 0
+        else:
+            self._rpos = end
+        return data
 
     def write(self, data: bytes, **kwargs):
         """
@@ -131,73 +212,101 @@ class SocketWrapper:
         """
         Return number of bytes in buffer.
 
-        :returns: length of buffer
+        :returns: number of unread bytes in buffer
         :rtype: int
         """
 
-        return len(self._buffer)
+        return self._wpos - self._rpos
 
     def dechunk(self, segment: bytes) -> tuple:
         """
         Parse segment of chunked transfer-encoded byte stream.
 
-        Returns complete chunks in this segment and any partial
-        chunk, which should be prepended to next segment read.
+        Returns the (decompressed) content of this segment. Any
+        partial chunk is retained internally and completed by the
+        next segment, so segments may be split at any point and the
+        returned partial is always empty (retained for backwards
+        compatibility; prepending it to the next segment is a no-op).
 
         :param segment: segment of byte stream
         :returns: tuple of (chunks, partial)
         :rtype: tuple
         """
 
-        # pylint: disable=logging-fstring-interpolation
-
-        instream = BytesIO(segment)
-        chunks = b""
-        partial = b""
-
-        while True:
-            length_bytes = instream.readline()
-            if length_bytes[-2:] != b"\r\n":
-                # premature end of length bytes
-                partial = length_bytes
-                break
-            try:
-                chunk_length = int(length_bytes.strip(), 16)
-            except ValueError:
-                # residual bytes at beginning of stream
-                break
-            if chunk_length != 0:
-                chunk = instream.read(chunk_length)
-                if len(chunk) != chunk_length:
-                    # premature end of chunk bytes
-                    partial = length_bytes + chunk
+        content = bytearray()
+        pos = 0
+        end = len(segment)
+        while pos < end:
+            if self._chunkstate == CHUNK_SIZE:
+                idx = segment.find(b"\n", pos)
+                if idx == -1:  # premature end of length bytes
+                    self._sizeline += segment[pos:]
                     break
-                try:  # pragma: no cover
-                    if self._encoding & ENCODE_GZIP:
-                        chunk = decompress(chunk, wbits=MAX_WBITS | 16)
-                    if self._encoding & ENCODE_COMPRESS:
-                        chunk = decompress(chunk, wbits=MAX_WBITS)
-                    if self._encoding & ENCODE_DEFLATE:
-                        chunk = decompress(chunk, wbits=-MAX_WBITS)
-                except zlibError as err:  # pragma: no cover
-                    self.logger.error(f"Error decompressing data: {err}")
-                    # parser will discard data
-                chunks += chunk
-
-            instream.readline()
-            if chunk_length == 0:
-                # final chunk
+                self._sizeline += segment[pos:idx]
+                pos = idx + 1
+                try:  # ignore any chunk extensions
+                    length = int(self._sizeline.split(b";")[0].strip(), 16)
+                except ValueError:
+                    # residual bytes at beginning of stream
+                    self._sizeline.clear()
+                    continue
+                self._sizeline.clear()
+                self._chunkremaining = length
+                self._chunkstate = CHUNK_DATA if length else CHUNK_DONE
+            elif self._chunkstate == CHUNK_DATA:
+                num = min(self._chunkremaining, end - pos)
+                with memoryview(segment) as view:
+                    content += self._decompress(view[pos : pos + num])
+                pos += num
+                self._chunkremaining -= num
+                if not self._chunkremaining:
+                    self._chunkstate = CHUNK_END
+            elif self._chunkstate == CHUNK_END:
+                idx = segment.find(b"\n", pos)
+                if idx == -1:
+                    break
+                pos = idx + 1
+                self._chunkstate = CHUNK_SIZE
+            else:  # final chunk, ignore any trailers
                 break
 
-        return chunks, partial
+        return content, b""
+
+    def _decompress(self, data: bytes) -> bytes:
+        """
+        Decompress data using streaming decompressors, which retain
+        any incomplete compressed block until the next call.
+
+        :param bytes data: compressed data
+        :returns: decompressed data
+        :rtype: bytes
+        """
+
+        # pylint: disable=logging-fstring-interpolation
+
+        try:
+            for i, wbits in enumerate(self._wbits):
+                dcp = self._decompressors[i]
+                output = dcp.decompress(data)
+                while dcp.eof and dcp.unused_data:  # next compressed member
+                    data = dcp.unused_data
+                    dcp = self._decompressors[i] = decompressobj(wbits=wbits)
+                    output += dcp.decompress(data)
+                data = output
+        except zlibError as err:
+            self.logger.error(f"Error decompressing data: {err}")
+            # restart decompression and discard undecodable data
+            self._decompressors = [decompressobj(wbits=wbits) for wbits in self._wbits]
+            return b""
+        return data
 
     @property
     def buffer(self) -> bytearray:
         """
         Getter for buffer.
 
-        :return: buffer
+        :return: copy of unread data in buffer
         :rtype: bytearray
         """
 
-        return self._buffer
+        return self._buffer[self._rpos : self._wpos]
@@ -0,0 +1,218 @@
+"""
+AIS decoding tests for pynmeagps
+
+Created on 17 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin (Steve Smith)
+"""
+
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+from pynmeagps import (
+    AISAssembler,
+    AISMessage,
+    ERR_RAISE,
+    NMEAMessage,
+    NMEAFileReader,
+    NMEAMessageError,
+    NMEAParseError,
+    NMEAReader,
+    NMEAStreamParser,
+    decode_ais,
+)
+
+VDM1 = b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5C\r\n"
+VDM5A = b"!AIVDM,2,1,1,A,55?MbV02;H;s<HtKR20EHE:0@T4@Dn2222222216L961O5Gf0NSQEp6ClRp8,0*1C\r\n"
+VDM5B = b"!AIVDM,2,2,1,A,88888888880,2*25\r\n"
+VDO18 = b"!AIVDO,1,1,,A,B6CdCm0t3`tba35f@V9faHi7kP06,0*5A\r\n"
+VDM21A = b"!AIVDM,2,1,5,B,E1mg=5J1T4W0h97aRh6ba84<h2d;W:Te=eLvH50```q,0*46\r\n"
+VDM21B = b"!AIVDM,2,2,5,B,:D44QDlp0C1DU00,2*36\r\n"
+VDM24A = b"!AIVDM,1,1,,A,H42O55i18tMET00000000000000,2*6D\r\n"
+VDM24B = b"!AIVDM,1,1,,B,H42O55lti4hhhilD3nink000?050,0*43\r\n"
+GLL = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+
+
+class AISTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def ident(self, parsed) -> object:
+        return parsed.msgtype if isinstance(parsed, AISMessage) else parsed.identity
+
+    def testDecodeType1(self):
+        msg = AISMessage("15M67FC000G?ufbE`FepT@3n00Sa", 0, "AI", "VDM", "B")
+        self.assertEqual(
+            str(msg),
+            "<AIS(AIVDM, msgtype=1, repeat=0, mmsi=366053209, status=3, turn=0, speed=0.0, accuracy=False, lon=-122.34161833333333, lat=37.80211833333333, course=219.3, heading=1, second=59, maneuver=0, spare=0, raim=False, radio=2281)>",
+        )
+        self.assertEqual(
+            repr(msg), "AISMessage('15M67FC000G?ufbE`FepT@3n00Sa', 0, 'AI', 'VDM', 'B')"
+        )
+        self.assertEqual(str(eval(repr(msg))), str(msg))
+        self.assertEqual(msg.identity, "AIVDM")
+        self.assertEqual(msg.aischan, "B")
+        self.assertEqual(msg.fillbits, 0)
+        with self.assertRaisesRegex(NMEAMessageError, "Object is immutable"):
+            msg.mmsi = 1
+
+    def testDecodeType5(self):  # two sentences, fill bits, text fields
+        vals = decode_ais(
+            "55?MbV02;H;s<HtKR20EHE:0@T4@Dn2222222216L961O5Gf0NSQEp6ClRp8"
+            "88888888880",
+            2,
+        )
+        self.assertEqual(vals["mmsi"], 351759000)
+        self.assertEqual(vals["imo"], 9134270)
+        self.assertEqual(vals["callsign"], "3FOF8")
+        self.assertEqual(vals["shipname"], "EVER DIADEM")
+        self.assertEqual(vals["destination"], "NEW YORK")
+        self.assertEqual(vals["draught"], 12.2)
+        self.assertEqual(
+            (vals["to_bow"], vals["to_stern"], vals["to_port"], vals["to_starboard"]),
+            (225, 70, 1, 31),
+        )
+
+    def testDecodeType18(self):
+        vals = decode_ais("B6CdCm0t3`tba35f@V9faHi7kP06")
+        self.assertEqual(vals["msgtype"], 18)
+        self.assertEqual(vals["mmsi"], 423302100)
+        self.assertEqual(vals["speed"], 1.4)
+        self.assertEqual(vals["course"], 177.0)
+        self.assertAlmostEqual(vals["lat"], 40.00528333, 6)
+        self.assertAlmostEqual(vals["lon"], 53.01099667, 6)
+        self.assertTrue(vals["cs"])
+
+    def testDecodeType21(self):  # variable length name extension
+        vals = decode_ais(
+            "E1mg=5J1T4W0h97aRh6ba84<h2d;W:Te=eLvH50```q:D44QDlp0C1DU00", 2
+        )
+        self.assertEqual(vals["mmsi"], 123456789)
+        self.assertEqual(vals["aid_type"], 20)
+        self.assertEqual(
+            vals["name"] + vals["name_ext"], "CHINA ROSE MURPHY EXPRESS ALERT"
+        )
+        self.assertAlmostEqual(vals["lat"], 47.92061833, 6)
+        self.assertAlmostEqual(vals["lon"], -122.69859167, 6)
+
+    def testDecodeType24(self):  # parts A and B
+        vals = decode_ais("H42O55i18tMET00000000000000", 2)
+        self.assertEqual((vals["partno"], vals["shipname"]), (0, "PROGUY"))
+        self.assertNotIn("callsign", vals)
+        vals = decode_ais("H42O55lti4hhhilD3nink000?050")
+        self.assertEqual(vals["partno"], 1)
+        self.assertEqual(vals["shiptype"], 60)
+        self.assertEqual(vals["vendorid"], "1D0")
+        self.assertEqual(vals["callsign"], "TC6163")
+
+    def testDecodeOther(self):  # unsupported type, truncated and invalid payloads
+        vals = decode_ais("85Mwp`1Kf3aCnsNvBWLi=wQuNhA5t43N`5nCuI=p<IBfVqnMgPGs")
+        self.assertEqual(vals, {"msgtype": 8, "repeat": 0, "mmsi": 366999712})
+        vals = decode_ais("15M67FC000G?ufbE`F")
+        self.assertEqual(vals["mmsi"], 366053209)
+        self.assertIsNone(vals["lat"])
+        self.assertIsNone(vals["radio"])
+        with self.assertRaisesRegex(NMEAMessageError, "Invalid AIS payload"):
+            decode_ais("15M67FC0xx")
+        with self.assertRaisesRegex(NMEAMessageError, "Invalid AIS payload"):
+            decode_ais("")
+
+    def testAssembler(self):
+        asm = AISAssembler()
+        self.assertIsNone(asm.add(NMEAReader.parse(VDM5A), VDM5A))
+        self.assertEqual(asm.pending, 1)
+        raw, msg = asm.add(NMEAReader.parse(VDM5B), VDM5B)
+        self.assertEqual(raw, VDM5A + VDM5B)
+        self.assertEqual(msg.shipname, "EVER DIADEM")
+        self.assertEqual(msg.fillbits, 2)
+        self.assertEqual(asm.pending, 0)
+        with self.assertRaisesRegex(NMEAParseError, "sentence 2 of 2 out of sequence"):
+            asm.add(NMEAReader.parse(VDM5B), VDM5B)
+        self.assertIsNone(asm.add(NMEAReader.parse(VDM5A), VDM5A))
+        asm.clear()
+        self.assertEqual(asm.pending, 0)
+
+    def testAssemblerMaxPending(self):  # oldest incomplete message discarded
+        asm = AISAssembler(maxpending=2)
+        for seqid in range(4):
+            asm.add(NMEAMessage("AI", "VDM", 0, numSen=2, senNum=1, seqid=seqid))
+        self.assertEqual(asm.pending, 2)
+        with self.assertRaisesRegex(NMEAParseError, "out of sequence"):
+            asm.add(NMEAMessage("AI", "VDM", 0, numSen=2, senNum=2, seqid=0))
+
+    def testSerialize(self):  # encapsulation sentences use '!'
+        msg = NMEAReader.parse(VDM1)
+        self.assertEqual(msg.serialize(), VDM1)
+        self.assertEqual(msg.itumsg, "15M67FC000G?ufbE`FepT@3n00Sa")
+        msg = NMEAMessage("AI", "VDO", 0, numSen=1, senNum=1, aischan="A")
+        self.assertEqual(msg.serialize(), b"!AIVDO,1,1,0,A,,0*14\r\n")
+
+    def testReaderDecodeAIS(self):  # mixed GNSS and AIS stream
+        data = (
+            GLL
+            + VDM1
+            + VDM5A
+            + b"\x00\xff"
+            + VDO18
+            + VDM5B
+            + b"\\s:2573135,c:1671620143*0B\\"
+            + VDM24A
+            + VDM21A
+            + VDM21B
+            + VDM24B
+            + GLL
+        )
+        expected = [
+            (GLL, "GNGLL"),
+            (VDM1, 1),
+            (VDO18, 18),
+            (VDM5A + VDM5B, 5),
+            (b"\\s:2573135,c:1671620143*0B\\" + VDM24A, 24),
+            (VDM21A + VDM21B, 21),
+            (VDM24B, 24),
+            (GLL, "GNGLL"),
+        ]
+        for blocksize in (0, 7, 4096):
+            nmr = NMEAReader(
+                BytesIO(data),
+                blocksize=blocksize,
+                decodeais=True,
+                quitonerror=ERR_RAISE,
+            )
+            res = [(raw, self.ident(parsed)) for raw, parsed in nmr]
+            self.assertEqual(res, expected)
+            self.assertEqual(nmr.stats["framed"], 10)
+            self.assertEqual(nmr.stats["identities"]["AIVDM"], 7)
+        nmp = NMEAStreamParser(decodeais=True)
+        res = []
+        for i in range(0, len(data), 11):
+            nmp.feed(data[i : i + 11])
+            res += [(raw, self.ident(parsed)) for raw, parsed in nmp.events()]
+        self.assertEqual(res, expected)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "ais.log")
+            with open(fname, "wb") as outfile:
+                outfile.write(data)
+            for copyraw in (True, False):
+                with NMEAFileReader(
+                    fname, copyraw=copyraw, decodeais=True, quitonerror=ERR_RAISE
+                ) as nmr:
+                    res = [(bytes(raw), self.ident(parsed)) for raw, parsed in nmr]
+                self.assertEqual(res, expected)
+
+    def testReaderNoDecode(self):  # AIS sentences returned as NMEAMessage by default
+        nmr = NMEAReader(BytesIO(VDM5A + VDM5B))
+        res = [parsed.senNum for _, parsed in nmr]
+        self.assertEqual(res, [1, 2])
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+Asyncio reader tests for pynmeagps
+
+Created on 17 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin (Steve Smith)
+"""
+
+import asyncio
+import os
+import unittest
+from io import BytesIO
+
+from pynmeagps import (
+    AsyncNMEAReader,
+    ERR_IGNORE,
+    ERR_RAISE,
+    NMEAParseError,
+    NMEAReader,
+    NMEAStreamError,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def stream_reader(data: bytes) -> asyncio.StreamReader:
+    """
+    Test method to create a pre-populated asyncio StreamReader.
+    """
+
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class AsyncTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def expected(self, fname: str) -> list:
+        with open(os.path.join(DIRNAME, fname), "rb") as stream:
+            nmr = NMEAReader(stream, quitonerror=ERR_IGNORE)
+            return [(raw, str(parsed)) for raw, parsed in nmr]
+
+    def testAsyncIter(self):  # async reader should match stream reader
+
+        async def run(data: bytes) -> list:
+            nmr = AsyncNMEAReader(stream_reader(data), quitonerror=ERR_IGNORE)
+            return [(raw, str(parsed)) async for raw, parsed in nmr]
+
+        for fname in (
+            "pygpsdata-nmea4.log",
+            "pygpsdata-mixed.log",
+            "pygpsdata-badeof.log",
+            "pygpsdata-nmeabadck2.log",
+        ):
+            with open(os.path.join(DIRNAME, fname), "rb") as stream:
+                data = stream.read()
+            self.assertEqual(asyncio.run(run(data)), self.expected(fname), fname)
+
+    def testAsyncOptions(self):  # shared reader options should match stream reader
+
+        async def run(data: bytes, **kwargs) -> list:
+            nmr = AsyncNMEAReader(stream_reader(data), **kwargs)
+            return [(raw, str(parsed)) async for raw, parsed in nmr]
+
+        with open(os.path.join(DIRNAME, "pygpsdata-mixed.log"), "rb") as stream:
+            data = stream.read()
+        for kwargs in (
+            {"msgfilter": ("GGA", "GNGLL")},
+            {"msgfilter": ("GSV",), "filterraw": True},
+            {"parsing": False},
+            {"lazy": True},
+            {"msgclasses": True},
+            {"fields": {"GGA": ("time", "lat", "lon")}},
+        ):
+            nmr = NMEAReader(BytesIO(data), quitonerror=ERR_IGNORE, **kwargs)
+            expected = [(raw, str(parsed)) for raw, parsed in nmr]
+            res = asyncio.run(run(data, quitonerror=ERR_IGNORE, **kwargs))
+            self.assertEqual(res, expected, kwargs)
+
+    def testAsyncBadHdr(self):  # invalid header with nmeaonly = True
+        EXPECTED_ERROR = "Unknown protocol header b'$&'."
+
+        async def run(data: bytes):
+            nmr = AsyncNMEAReader(
+                stream_reader(data), nmeaonly=True, quitonerror=ERR_RAISE
+            )
+            async for _ in nmr:
+                pass
+
+        with open(os.path.join(DIRNAME, "pygpsdata-BADHDR.log"), "rb") as stream:
+            data = stream.read()
+        with self.assertRaises(NMEAParseError) as context:
+            asyncio.run(run(data))
+        self.assertTrue(EXPECTED_ERROR in str(context.exception))
+
+    def testAsyncBadMode(self):  # invalid msgmode
+        EXPECTED_ERROR = "Invalid stream mode 4 - must be 0, 1 or 2."
+        with self.assertRaises(NMEAParseError) as context:
+            AsyncNMEAReader(None, msgmode=4)
+        self.assertTrue(EXPECTED_ERROR in str(context.exception))
+
+    def testAsyncOverrun(self):  # line exceeding stream limit is discarded
+
+        async def run() -> list:
+            reader = asyncio.StreamReader(limit=64)
+            reader.feed_data(b"x" * 200 + b"\n$GNGGA,,,,,,0,00,99.99,,,,,,*56\r\n")
+            reader.feed_eof()
+            nmr = AsyncNMEAReader(reader)
+            return [parsed.identity async for _, parsed in nmr]
+
+        self.assertEqual(asyncio.run(run()), ["GNGGA"])
+
+    def testAsyncConnection(self):  # TCP connection to local server
+        with open(os.path.join(DIRNAME, "pygpsdata-nmea4.log"), "rb") as stream:
+            data = stream.read()
+
+        async def handler(reader, writer):
+            await reader.readline()  # wait for poll
+            writer.write(data)
+            await writer.drain()
+            writer.close()
+
+        async def run() -> list:
+            server = await asyncio.start_server(handler, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                nmr = await AsyncNMEAReader.open_connection(
+                    "127.0.0.1", port, quitonerror=ERR_IGNORE
+                )
+                await nmr.write(b"$EIGNQ,RMC*24\r\n")
+                res = [(raw, str(parsed)) async for raw, parsed in nmr]
+            return res
+
+        self.assertEqual(asyncio.run(run()), self.expected("pygpsdata-nmea4.log"))
+
+    def testAsyncPipe(self):  # file descriptor serviced by event loop
+        with open(os.path.join(DIRNAME, "pygpsdata-nmea4sm.log"), "rb") as stream:
+            data = stream.read()
+
+        async def run() -> list:
+            rfd, wfd = os.pipe()
+            os.write(wfd, data)
+            os.close(wfd)
+            with os.fdopen(rfd, "rb", buffering=0) as pipe:
+                nmr = await AsyncNMEAReader.open_pipe(pipe, quitonerror=ERR_IGNORE)
+                self.assertIsInstance(nmr.datastream, asyncio.StreamReader)
+                with self.assertRaises(NMEAStreamError):
+                    await nmr.write(b"$EIGNQ,RMC*24\r\n")
+                return [(raw, str(parsed)) async for raw, parsed in nmr]
+
+        self.assertEqual(asyncio.run(run()), self.expected("pygpsdata-nmea4sm.log"))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Generated message class tests for pynmeagps
+
+Created on 17 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin (Steve Smith)
+"""
+
+import os
+import pickle
+import unittest
+
+from pynmeagps import (
+    ERR_RAISE,
+    NMEAMessage,
+    NMEAMessageError,
+    NMEAParseError,
+    NMEAReader,
+    NMEATypeError,
+    VALMSGID,
+    get_message_class,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+GGA = b"$GNGGA,103607.00,5327.03942,N,00214.42462,W,1,12,0.67,84.5,M,48.3,M,,*69\r\n"
+RMC = b"$GNRMC,103607.00,A,5327.03942,N,00214.42462,W,0.046,,060321,,,A,V*0F\r\n"
+GSV = b"$GPGSV,4,4,14,13,21,181,,14,15,302,*75\r\n"
+
+
+class ClassesTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testGenerated(self):  # generated classes for fixed-length sentences
+        for msgid in ("GGA", "RMC", "GSA", "VTG", "GST", "ZDA"):
+            cls = get_message_class(msgid)
+            self.assertEqual(cls.__name__, f"NMEAMessage{msgid}")
+            self.assertTrue(issubclass(cls, NMEAMessage))
+            self.assertIs(get_message_class(msgid), cls)  # cached
+        self.assertIsNone(get_message_class("GSV"))  # variable repeating group
+        self.assertIsNone(get_message_class("UBX"))  # proprietary
+        self.assertIsNone(get_message_class("XXX"))
+
+    def testParse(self):  # generated and generic classes are interchangeable
+        for raw in (GGA, RMC, GSV):
+            msg = NMEAReader.parse(raw, msgclasses=True)
+            generic = NMEAReader.parse(raw)
+            self.assertIsInstance(msg, NMEAMessage)
+            self.assertEqual(str(msg), str(generic))
+            self.assertEqual(repr(msg), repr(generic))
+            self.assertEqual(msg.serialize(), raw)
+        msg = NMEAReader.parse(GGA, msgclasses=True)
+        self.assertEqual(type(msg).__name__, "NMEAMessageGGA")
+        self.assertEqual((msg.lat, msg.lon, msg.numSV), (53.450657, -2.2404103333, 12))
+        self.assertEqual(msg.identity, "GNGGA")
+        self.assertEqual(vars(msg), vars(NMEAReader.parse(GGA)))
+        with self.assertRaisesRegex(NMEAMessageError, "Object is immutable"):
+            msg.lat = 54.0
+        self.assertEqual(
+            type(NMEAReader.parse(GGA, msgclasses=True, lazy=True)), NMEAMessage
+        )
+        copied = pickle.loads(pickle.dumps(msg))
+        self.assertEqual(type(copied), type(msg))
+        self.assertEqual(str(copied), str(msg))
+
+    def testFallback(self):  # truncated or invalid payloads use generic class
+        msg = NMEAReader.parse(
+            "$GNGGA,103607.00,5327.03942,N,00214.42462,W,1,12*5C\r\n", msgclasses=True
+        )
+        self.assertEqual(type(msg), NMEAMessage)
+        self.assertEqual(msg.numSV, 12)
+        self.assertFalse(hasattr(msg, "HDOP"))
+        with self.assertRaisesRegex(
+            NMEATypeError, "Incorrect type for attribute HDOP in msgID GGA"
+        ):
+            NMEAReader.parse(
+                b"$GNGGA,103607.00,5327.03942,N,00214.42462,W,1,12,x.5,84.5,M,48.3,M,,*00\r\n",
+                validate=0,
+                msgclasses=True,
+            )
+        with self.assertRaisesRegex(NMEAParseError, "Unknown talker XX"):
+            NMEAReader.parse(
+                b"$XXGGA,103607.00,5327.03942,N,00214.42462,W,1,12,0.67,84.5,M,48.3,M,,*00\r\n",
+                validate=VALMSGID,
+                msgclasses=True,
+            )
+
+    def testReader(self):  # generated classes give same results as generic
+        for filename in ("pygpsdata-nmea4.log", "pygpsdata-mixed.log"):
+            res = []
+            for msgclasses in (False, True):
+                with open(os.path.join(DIRNAME, filename), "rb") as stream:
+                    nmr = NMEAReader(
+                        stream, msgclasses=msgclasses, quitonerror=ERR_RAISE
+                    )
+                    res.append([(raw, str(parsed)) for raw, parsed in nmr])
+            self.assertEqual(res[0], res[1])
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
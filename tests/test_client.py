@@ -0,0 +1,228 @@
+"""
+NMEAClient tests for pynmeagps - uses local stand-in TCP server.
+
+Created on 17 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin (Steve Smith)
+"""
+
+import gzip
+import socket
+import socketserver
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from pynmeagps import NMEAClient, NMEAParseError, NMEAStreamError
+
+NMEADATA = (
+    b"$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*71\r\n"
+    b"$GNRMC,103607.00,A,5327.03942,N,10214.42462,W,0.046,,060321,,,A,V*0E\r\n"
+    b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+)
+
+
+class StandInHandler(socketserver.BaseRequestHandler):
+    """
+    Stand-in NMEA server handler. Responds to each connection
+    according to the server's list of responses, then closes it.
+    """
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            response = server.responses[min(server.count, len(server.responses) - 1)]
+            server.count += 1
+        if server.http:
+            request = b""
+            while not request.endswith(b"\r\n\r\n"):
+                request += self.request.recv(1)
+            server.requests.append(request)
+        if response is None:  # silent connection
+            time.sleep(0.5)
+            return
+        self.request.sendall(response)
+
+
+class StandInServer(socketserver.ThreadingTCPServer):
+    """
+    Stand-in NMEA server.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, responses: list, http: bool = False):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.responses = responses
+        self.http = http
+        self.requests = []
+        self.count = 0
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def chunked(data: bytes, size: int) -> bytes:
+    """
+    Test method to chunk encode a byte stream.
+    """
+
+    chunks = [data[i : i + size] for i in range(0, len(data), size)]
+    out = b"".join(f"{len(c):x}\r\n".encode() + c + b"\r\n" for c in chunks)
+    return out + b"0\r\n\r\n"
+
+
+class ClientTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def read(self, client: NMEAClient, count: int) -> list:
+        res = []
+        for raw, parsed in client:
+            res.append((raw, parsed.msgID))
+            if len(res) >= count:
+                break
+        client.close()
+        return res
+
+    def testClientReconnect(self):  # iteration continues across reconnections
+        server = StandInServer([NMEADATA])
+        client = NMEAClient("127.0.0.1", server.port, backoff=0.01, timeout=2)
+        res = self.read(client, 9)
+        server.stop()
+        self.assertEqual([msgid for _, msgid in res], ["DTM", "RMC", "GLL"] * 3)
+        metrics = client.metrics
+        self.assertEqual(metrics["connects"], 3)
+        self.assertEqual(metrics["reconnects"], 2)
+        self.assertEqual(metrics["disconnects"], 2)
+        self.assertEqual(metrics["failures"], 0)
+        self.assertEqual(metrics["messages"], 9)
+        self.assertGreater(metrics["connlatency"], 0)
+        self.assertGreaterEqual(metrics["maxlatency"], metrics["meanlatency"])
+        self.assertFalse(client.connected)
+        self.assertIsNone(client.reader)
+        client.reset_metrics()
+        self.assertEqual(client.metrics["connects"], 0)
+
+    def testClientResync(self):  # partial sentences at connection boundaries
+        server = StandInServer([b"\x00\xffRMC,1*00\r\n" + NMEADATA + NMEADATA[:20]])
+        client = NMEAClient("127.0.0.1", server.port, backoff=0.01, blocksize=16)
+        res = self.read(client, 6)
+        server.stop()
+        self.assertEqual([msgid for _, msgid in res], ["DTM", "RMC", "GLL"] * 2)
+
+    def testClientTimeout(self):  # silent connection times out and reconnects
+        server = StandInServer([None, NMEADATA])
+        client = NMEAClient("127.0.0.1", server.port, backoff=0.01, timeout=0.1)
+        res = self.read(client, 3)
+        server.stop()
+        self.assertEqual([msgid for _, msgid in res], ["DTM", "RMC", "GLL"])
+        self.assertEqual(client.metrics["disconnects"], 1)
+        self.assertEqual(client.metrics["reconnects"], 1)
+
+    def testClientHTTP(self):  # chunked and gzip encoded HTTP stream
+        body = chunked(gzip.compress(NMEADATA * 2), 17)
+        response = (
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/plain\r\n"
+            b"Transfer-Encoding: chunked\r\n"
+            b"Content-Encoding: gzip\r\n\r\n" + body
+        )
+        server = StandInServer([response], http=True)
+        client = NMEAClient(
+            "127.0.0.1",
+            server.port,
+            path="/nmea",
+            headers={"Authorization": "Basic dXNlcjpwYXNz"},
+            backoff=0.01,
+        )
+        res = self.read(client, 6)
+        server.stop()
+        self.assertEqual([msgid for _, msgid in res], ["DTM", "RMC", "GLL"] * 2)
+        request = server.requests[0].decode()
+        self.assertTrue(request.startswith("GET /nmea HTTP/1.1\r\n"))
+        self.assertIn("Authorization: Basic dXNlcjpwYXNz\r\n", request)
+        self.assertIn("Connection: keep-alive\r\n", request)
+
+    def testClientHTTPFail(self):  # unsuccessful HTTP response
+        server = StandInServer([b"HTTP/1.1 404 Not Found\r\n\r\n"], http=True)
+        client = NMEAClient(
+            "127.0.0.1", server.port, path="/nmea", retries=2, backoff=0.01
+        )
+        self.assertEqual(list(client), [])
+        server.stop()
+        self.assertEqual(client.metrics["failures"], 2)
+        self.assertEqual(client.metrics["connects"], 0)
+
+    def testClientRetries(self):  # connection refused, backoff between retries
+        server = StandInServer([NMEADATA])
+        port = server.port
+        server.stop()
+        client = NMEAClient("127.0.0.1", port, retries=3, backoff=0.05)
+        start = time.perf_counter()
+        self.assertEqual(list(client), [])
+        self.assertGreaterEqual(time.perf_counter() - start, 0.15)  # 0.05 + 0.1
+        self.assertEqual(client.metrics["failures"], 3)
+
+    def testClientUnstable(self):  # connections closed immediately still back off
+        server = StandInServer([b""])
+        client = NMEAClient("127.0.0.1", server.port, backoff=0.05)
+        threading.Timer(0.5, client.close).start()
+        self.assertEqual(list(client), [])
+        server.stop()
+        # 0.05 + 0.1 + 0.2 between reconnections, rather than a tight loop
+        self.assertLessEqual(client.metrics["connects"], 5)
+        self.assertGreaterEqual(client.metrics["connects"], 2)
+
+    def testClientConnectError(self):  # socket closed if reader cannot be created
+        server = StandInServer([NMEADATA])
+        socks = []
+        create = socket.create_connection
+
+        def create_connection(*args):
+            socks.append(create(*args))
+            return socks[-1]
+
+        client = NMEAClient("127.0.0.1", server.port, msgmode=9)
+        with patch("pynmeagps.nmeaclient.socket.create_connection", create_connection):
+            with self.assertRaises(NMEAParseError):
+                client.connect()
+        server.stop()
+        self.assertEqual(socks[0].fileno(), -1)
+        self.assertFalse(client.connected)
+
+    def testClientClose(self):  # close() ends iteration during backoff
+        server = StandInServer([NMEADATA])
+        port = server.port
+        server.stop()
+        client = NMEAClient("127.0.0.1", port, backoff=10)
+        threading.Timer(0.1, client.close).start()
+        start = time.perf_counter()
+        with client:
+            self.assertEqual(list(client), [])
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def testClientWrite(self):  # write requires connection
+        client = NMEAClient("127.0.0.1", 1)
+        with self.assertRaisesRegex(NMEAStreamError, "Not connected."):
+            client.write(b"$EIGNQ,RMC*24\r\n")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
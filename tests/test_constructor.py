@@ -8,6 +8,8 @@ Created on 4 Mar 2021
 :author: semuadmin (Steve Smith)
 """
 
+import copy
+import pickle
 import unittest
 from datetime import datetime
 from pynmeagps import (
@@ -183,6 +185,30 @@ class FillTest(unittest.TestCase):
             res.lon = 54.6666
         self.assertTrue(EXPECTED_ERROR in str(context.exception))
 
+    def testFill_GNGLLPICKLE(self):  # test slotted NMEAMessage pickle and copy
+        res = NMEAMessage(
+            "GN",
+            "GLL",
+            GET,
+            payload=["5327.04319", "S", "00214.41396", "E", "223232.00", "A", "A"],
+        )
+        gen = NMEAMessage("GN", "GLL", GET, lat=53.1, lon=-2.4)
+        for msg in (res, gen):
+            for copied in (pickle.loads(pickle.dumps(msg)), copy.deepcopy(msg)):
+                self.assertEqual(str(copied), str(msg))
+                self.assertEqual(copied.lat, msg.lat)
+                self.assertEqual(copied.payload, msg.payload)
+                with self.assertRaises(NMEAMessageError):
+                    copied.lat = 54.6666
+        self.assertEqual(res.lat, -53.4507198333)
+        self.assertEqual(
+            list(vars(res)), ["lat", "NS", "lon", "EW", "time", "status", "posMode"]
+        )
+        self.assertEqual(vars(res)["lat"], -53.4507198333)
+        self.assertFalse(hasattr(res, "foo"))
+        with self.assertRaises(AttributeError):
+            res._foo  # pylint: disable=pointless-statement, protected-access
+
     def testFill_BADMODE(self):  # test invalid mode
         EXPECTED_ERROR = "Invalid msgmode 4 - must be 0, 1 or 2."
         with self.assertRaises(NMEAMessageError) as context:
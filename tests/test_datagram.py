@@ -0,0 +1,164 @@
+"""
+NMEADatagramReader tests for pynmeagps - uses local UDP sockets.
+
+Created on 17 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin (Steve Smith)
+"""
+
+import socket
+import unittest
+
+from pynmeagps import (
+    ERR_RAISE,
+    NMEADatagramReader,
+    NMEAHeaderError,
+    NMEALengthError,
+    NMEAParseError,
+    VALNONE,
+)
+
+GLL = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+TAG = b"\\s:GP0001,c:1577836800*2B\\"
+DTM = b"$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*71\r\n"
+
+
+class DatagramTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def tearDown(self):
+        self.sender.close()
+
+    def send(self, reader: NMEADatagramReader, *datagrams: bytes):
+        port = reader.datastream.getsockname()[1]
+        for datagram in datagrams:
+            self.sender.sendto(datagram, ("127.0.0.1", port))
+
+    def testDatagramIter(self):  # several sentences per datagram
+        with NMEADatagramReader.open(0, host="127.0.0.1", timeout=0.2) as ndr:
+            self.send(
+                ndr,
+                GLL + DTM,
+                b"\x00\x01" + DTM + b"junk",
+                b"UdPbC\x00" + TAG + GLL,  # IEC 61162-450
+                b"",
+                DTM[:-2],  # unterminated
+            )
+            res = list(ndr)
+        self.assertEqual(
+            [raw for raw, _, _ in res], [GLL, DTM, DTM, TAG + GLL, DTM[:-2]]
+        )
+        self.assertEqual(
+            [parsed.msgID for _, parsed, _ in res], ["GLL", "DTM", "DTM", "GLL", "DTM"]
+        )
+        self.assertEqual(res[3][1].tagblock, {"s": "GP0001", "c": 1577836800})
+        addr = self.sender.getsockname()
+        for _, _, src in res:
+            self.assertEqual(src[1], addr[1])
+
+    def testDatagramErrors(self):  # bad checksum
+        bad = GLL.replace(b"*68", b"*69")
+        with NMEADatagramReader.open(0, host="127.0.0.1", timeout=0.2) as ndr:
+            self.send(ndr, bad + GLL)
+            self.assertEqual([raw for raw, _, _ in ndr], [GLL])
+        with NMEADatagramReader.open(
+            0, host="127.0.0.1", timeout=0.2, quitonerror=ERR_RAISE
+        ) as ndr:
+            self.send(ndr, bad)
+            with self.assertRaisesRegex(NMEAParseError, "invalid checksum"):
+                ndr.read()
+        with NMEADatagramReader.open(
+            0, host="127.0.0.1", timeout=0.2, parsing=False, validate=VALNONE
+        ) as ndr:
+            self.send(ndr, bad)
+            self.assertEqual(ndr.read()[:2], (bad, None))
+
+    def testDatagramBounds(self):  # non-NMEA data and overlong sentences
+        garbage = b"$GNGGA," + b"x" * 200  # no terminator
+        with NMEADatagramReader.open(
+            0, host="127.0.0.1", timeout=0.2, maxlen=100
+        ) as ndr:
+            self.send(
+                ndr,
+                garbage + GLL,
+                b"$&junk" + DTM,
+                b"\\s:GP0001*5F\\junk" + DTM,  # TAG block not followed by sentence
+                b"\\s:GP0001" + GLL,  # unterminated TAG block
+                garbage,
+            )
+            self.assertEqual([raw for raw, _, _ in ndr], [GLL, DTM, DTM, GLL])
+        with NMEADatagramReader.open(
+            0, host="127.0.0.1", timeout=0.2, maxlen=100, quitonerror=ERR_RAISE
+        ) as ndr:
+            self.send(ndr, garbage + GLL)
+            with self.assertRaisesRegex(NMEALengthError, "exceeds maximum length 100"):
+                ndr.read()
+            self.assertEqual(ndr.read()[0], GLL)
+        with NMEADatagramReader.open(
+            0, host="127.0.0.1", timeout=0.2, nmeaonly=True, quitonerror=ERR_RAISE
+        ) as ndr:
+            self.send(ndr, b"$&junk" + DTM)
+            with self.assertRaisesRegex(NMEAHeaderError, "Unknown protocol header"):
+                ndr.read()
+            self.assertEqual(ndr.read()[0], DTM)
+
+    def testDatagramOptions(self):  # shared reader options
+        with NMEADatagramReader.open(
+            0,
+            host="127.0.0.1",
+            timeout=0.2,
+            msgfilter=("GLL",),
+            fields={"GLL": ("lat", "lon")},
+        ) as ndr:
+            self.send(ndr, GLL + DTM + TAG + GLL)
+            res = list(ndr)
+        self.assertEqual([raw for raw, _, _ in res], [GLL, TAG + GLL])
+        self.assertEqual(res[0][1].lat, -53.4507198333)
+        self.assertFalse(hasattr(res[0][1], "time"))
+
+    def testDatagramSmallBuffer(self):  # reusable buffer shorter than datagram
+        with NMEADatagramReader.open(
+            0, host="127.0.0.1", timeout=0.2, bufsize=len(GLL)
+        ) as ndr:
+            self.send(ndr, GLL + DTM, DTM)
+            self.assertEqual([raw for raw, _, _ in ndr], [GLL, DTM])
+
+    def testDatagramMulticast(self):  # join multicast group on loopback
+        try:
+            ndr = NMEADatagramReader.open(
+                0, group="239.192.0.1", interface="127.0.0.1", timeout=0.2
+            )
+        except OSError:  # pragma: no cover
+            self.skipTest("multicast not available")
+        with ndr:
+            self.sender.setsockopt(
+                socket.IPPROTO_IP,
+                socket.IP_MULTICAST_IF,
+                socket.inet_aton("127.0.0.1"),
+            )
+            port = ndr.datastream.getsockname()[1]
+            self.sender.sendto(GLL, ("239.192.0.1", port))
+            res = list(ndr)
+        if not res:  # pragma: no cover
+            self.skipTest("multicast loopback not available")
+        self.assertEqual([raw for raw, _, _ in res], [GLL])
+        try:  # join on any interface
+            ndr = NMEADatagramReader.open(0, group="239.192.0.1", timeout=0.2)
+        except OSError:  # pragma: no cover
+            self.skipTest("multicast not available on default interface")
+        ndr.close()
+
+    def testDatagramBadMode(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        with self.assertRaisesRegex(NMEAParseError, "Invalid stream mode 3"):
+            NMEADatagramReader(sock, msgmode=3)
+        sock.close()
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -9,17 +9,30 @@ Created on 4 Mar 2021
 :author: semuadmin (Steve Smith)
 """
 
+import os
 import unittest
+from io import BytesIO
 from pynmeagps import (
     NMEAReader,
     NMEAMessageError,
     NMEAParseError,
+    NMEATypeError,
+    ERR_IGNORE,
+    ERR_LOG,
     ERR_RAISE,
+    PARSE_BADCKSUM,
+    PARSE_BADTYPE,
+    PARSE_MALFORMED,
+    PARSE_OK,
+    PARSE_UNKNOWN,
     SET,
     VALCKSUM,
     VALMSGID,
+    VALNONE,
 )
 
+DIRNAME = os.path.dirname(__file__)
+
 
 class ParseTest(unittest.TestCase):
     def setUp(self):
@@ -108,6 +121,242 @@ class ParseTest(unittest.TestCase):
             NMEAReader.parse(self.messageBADCK)
         self.assertTrue(EXPECTED_ERROR in str(context.exception))
 
+    def testParseMany(self):  # batch parse
+        res = NMEAReader.parse_many(
+            [self.messageGLL, self.messagePUBX.encode("utf-8"), self.messageNK]
+        )
+        self.assertEqual(
+            [str(msg) for msg in res],
+            [
+                str(NMEAReader.parse(self.messageGLL)),
+                str(NMEAReader.parse(self.messagePUBX)),
+                str(NMEAReader.parse(self.messageNK)),
+            ],
+        )
+        self.assertEqual(NMEAReader.parse_many([]), [])
+
+    def testParseManyErr(self):  # batch parse with invalid data
+        with self.assertRaisesRegex(NMEAParseError, "Invalid parse mode 3"):
+            NMEAReader.parse_many([self.messageGLL], msgmode=3)
+        with self.assertRaisesRegex(NMEAParseError, "invalid checksum 22"):
+            NMEAReader.parse_many([self.messageGLL, self.messageBADCK])
+
+    def testParseLazy(self):  # lazy attribute decoding
+        msg = NMEAReader.parse(self.messageGLL, lazy=True)
+        values = msg._values  # pylint: disable=protected-access
+        self.assertFalse(-53.4507198333 in values)
+        self.assertEqual(msg.identity, "GNGLL")
+        self.assertEqual(msg.payload, NMEAReader.parse(self.messageGLL).payload)
+        self.assertEqual(msg.lat, -53.4507198333)
+        self.assertEqual(msg.lon, 2.2402326667)
+        self.assertTrue(-53.4507198333 in values)
+        self.assertEqual(str(msg), str(NMEAReader.parse(self.messageGLL)))
+        with self.assertRaises(AttributeError):
+            msg.foo  # pylint: disable=pointless-statement
+        with self.assertRaises(NMEAMessageError):
+            msg.lat = 53.0
+        with self.assertRaisesRegex(NMEATypeError, "Incorrect type for attribute HDOP"):
+            NMEAReader.parse(  # invalid payloads rejected as if not lazy
+                "$GNGGA,223232.00,5327.04319,S,00214.41396,E,1,12,x.5,38.7,M,48.4,M,,*00\r\n",
+                validate=0,
+                lazy=True,
+            )
+        for filename in ("pygpsdata-nmeafoo1.log", "pygpsdata-nmeafoo2.log"):
+            res = []
+            for lazy in (False, True):
+                with open(os.path.join(DIRNAME, filename), "rb") as stream:
+                    nmr = NMEAReader(stream, lazy=lazy, quitonerror=ERR_IGNORE)
+                    res.append(([(raw, str(msg)) for raw, msg in nmr], nmr.stats))
+            self.assertEqual(res[0], res[1], filename)
+
+    def testParseTagBlock(self):  # leading TAG block
+        tag = b"\\s:GP0001,c:1577836800,n:12*50\\"
+        gll = self.messageGLL.encode()
+        msg = NMEAReader.parse(tag + gll)
+        self.assertEqual(msg.tagblock, {"s": "GP0001", "c": 1577836800, "n": 12})
+        self.assertEqual(str(msg), str(NMEAReader.parse(gll)))
+        self.assertEqual(msg.serialize(), tag + gll)
+        self.assertIsNone(NMEAReader.parse(gll).tagblock)
+        msg = NMEAReader.parse(memoryview(tag + gll), lazy=True)
+        self.assertEqual(msg.tagblock["c"], 1577836800)
+        self.assertEqual(msg.lat, -53.4507198333)
+        badtag = b"\\s:GP0001,c:1577836800,n:12*00\\"
+        with self.assertRaisesRegex(
+            NMEAParseError, "TAG block invalid checksum 00 - should be 50."
+        ):
+            NMEAReader.parse(badtag + gll)
+        msg = NMEAReader.parse(badtag + gll, validate=VALNONE)
+        self.assertEqual(msg.tagblock["s"], "GP0001")
+        self.assertIsNone(NMEAReader.parse(b"\\s:GP0001" + gll))
+        with self.assertRaisesRegex(NMEAParseError, "Badly formed TAG block"):
+            NMEAReader.parse(b"\\s:GP0001" + gll, validate=VALMSGID)
+
+    def testParsePlan(self):  # compiled payload plans
+        gsv4 = "$GPGSV,4,1,14,01,06,327,,02,49,101,22,03,24,053,,04,07,130,*75\r\n"
+        gsv2 = "$GPGSV,4,4,14,13,21,181,,14,15,302,*75\r\n"
+        for _ in range(2):  # second pass uses cached plans
+            msg = NMEAReader.parse(gsv4)
+            self.assertEqual((msg.svid_04, msg.elv_04, msg.az_04), (4, 7, 130))
+            msg = NMEAReader.parse(gsv2)
+            self.assertEqual(msg.svid_02, 14)
+            self.assertFalse(hasattr(msg, "svid_03"))
+        msg = NMEAReader.parse("$GNGLL,5327.04319,S,00214.41396,W*78\r\n")
+        self.assertEqual((msg.lat, msg.lon), (-53.4507198333, -2.2402326667))
+        self.assertFalse(hasattr(msg, "time"))
+        ubx = "$PUBX,03,2,3,U,304,59,39,062,4,U,172,19,44,064*5E\r\n"
+        msg = NMEAReader.parse(ubx, validate=VALNONE)
+        self.assertEqual((msg.numSv, msg.svid_02, msg.cno_02), (2, 4, 44))
+        self.assertFalse(hasattr(msg, "svid_03"))
+        with self.assertRaisesRegex(
+            NMEATypeError, "Incorrect type for attribute numSv in msgID UBX"
+        ):
+            NMEAReader.parse("$PUBX,03,x,3,U*00\r\n", validate=VALNONE)
+        with self.assertRaisesRegex(
+            NMEATypeError, "Incorrect type for attribute groupSV in msgID UBX"
+        ):
+            NMEAReader.parse("$PUBX,03,,3,U*00\r\n", validate=VALNONE)
+
+    def testParseSchemaCache(self):  # repeated headers resolved from cache
+        for _ in range(2):
+            msg = NMEAReader.parse(self.messagePUBX)
+            self.assertEqual((msg.identity, msg.msgId), ("PUBX00", "00"))
+            msg = NMEAReader.parse(
+                "$PASHR,142509.000,179.885,T,-0.624,0.245,,0.029,0.029,0.502,2,3*17\r\n"
+            )
+            self.assertEqual((msg.identity, msg.roll), ("PASHR", -0.624))
+            msg = NMEAReader.parse(self.messageGLL, validate=VALMSGID)
+            self.assertEqual(msg.lat, -53.4507198333)
+            gll = "$XXGLL,5327.04319,S,00214.41396,E,223232.00,A,A*61\r\n"
+            self.assertEqual(NMEAReader.parse(gll).lat, -53.4507198333)
+            with self.assertRaisesRegex(NMEAParseError, "Unknown talker XX"):
+                NMEAReader.parse(gll, validate=VALMSGID)
+
+    def testParseFields(self):  # field projection
+        fields = {"GLL": ("lat", "lon"), "GSV": ("svid", "elv_02")}
+        res = NMEAReader.parse(self.messageGLL, fields=fields)
+        self.assertEqual(
+            str(res), "<NMEA(GNGLL, lat=-53.4507198333, lon=2.2402326667)>"
+        )
+        self.assertEqual(res.payload[0:4], ["5327.04319", "S", "00214.41396", "E"])
+        self.assertFalse(hasattr(res, "time"))
+        self.assertEqual(res.serialize(), self.messageGLL.encode())
+        res = NMEAReader.parse(self.messageGLL, fields={"GLL": ["lon", "NS"]})
+        self.assertEqual(str(res), "<NMEA(GNGLL, NS=S, lon=2.2402326667)>")
+        gsv = "$GPGSV,4,4,14,13,21,181,,14,15,302,*75\r\n"
+        for kwargs in ({}, {"lazy": True}, {"msgclasses": True}):
+            res = NMEAReader.parse(gsv, fields=fields, **kwargs)
+            self.assertEqual(
+                str(res), "<NMEA(GPGSV, svid_01=13, svid_02=14, elv_02=15)>"
+            )
+            self.assertFalse(hasattr(res, "elv_01"))
+            res = NMEAReader.parse(self.messagePUBX, fields=fields, **kwargs)
+            self.assertEqual(res.lon, -2.2404103333)  # not projected
+        res = NMEAReader.parse_many([self.messageGLL, gsv], fields=fields)
+        self.assertEqual(res[0].lat, -53.4507198333)
+        self.assertFalse(hasattr(res[1], "sigID"))
+        fields = {"GGA": ("time", "lat", "lon", "quality"), "RMC": ("lat", "lon")}
+        with self.assertRaisesRegex(
+            NMEATypeError, "Incorrect type for attribute quality in msgID GGA"
+        ):
+            NMEAReader.parse(
+                "$GNGGA,103607.00,5327.03942,N,00214.42462,W,x,12,0.67,84.5,M,48.3,M,,*00\r\n",
+                validate=VALNONE,
+                fields=fields,
+            )
+        res = NMEAReader.parse(  # invalid but not projected
+            "$GNGGA,103607.00,5327.03942,N,00214.42462,W,1,x2,0.67,84.5,M,48.3,M,,*00\r\n",
+            validate=VALNONE,
+            fields=fields,
+        )
+        self.assertEqual((res.quality, res.payload[6]), (1, "x2"))
+        with open(os.path.join(DIRNAME, "pygpsdata-nmea4.log"), "rb") as stream:
+            full = [(raw, parsed) for raw, parsed in NMEAReader(stream)]
+        with open(os.path.join(DIRNAME, "pygpsdata-nmea4.log"), "rb") as stream:
+            nmr = NMEAReader(stream, fields=fields, quitonerror=ERR_RAISE)
+            for (raw, parsed), (raw1, parsed1) in zip(nmr, full):
+                self.assertEqual(raw, raw1)
+                self.assertEqual(parsed.payload, parsed1.payload)
+                for att in fields.get(parsed.msgID, ()):
+                    self.assertEqual(getattr(parsed, att), getattr(parsed1, att))
+                if parsed.msgID in fields:
+                    self.assertFalse(
+                        hasattr(parsed, "HDOP") or hasattr(parsed, "status")
+                    )
+                else:
+                    self.assertEqual(str(parsed), str(parsed1))
+
+    def testParseFieldsIdentity(self):  # projection keyed by message identity
+        ubx03 = "$PUBX,03,2,3,U,304,59,39,062,4,U,172,19,44,064*22\r\n"
+        fields = {"PUBX00": ("lat",), "UBX": ("numSv",), "GPGSV": ("svid",)}
+        for kwargs in ({}, {"lazy": True}):
+            res = NMEAReader.parse(self.messagePUBX, fields=fields, **kwargs)
+            self.assertEqual(res.identity, "PUBX00")
+            self.assertEqual(str(res), "<NMEA(PUBX00, msgId=00, lat=53.450657)>")
+            res = NMEAReader.parse(ubx03, fields=fields, **kwargs)
+            self.assertEqual(res.identity, "PUBX03")
+            self.assertEqual(str(res), "<NMEA(PUBX03, msgId=03, numSv=2)>")
+        gsv = "$GPGSV,4,4,14,13,21,181,,14,15,302,*75\r\n"
+        res = NMEAReader.parse(gsv, fields=fields)
+        self.assertEqual(str(res), "<NMEA(GPGSV, svid_01=13, svid_02=14)>")
+        gsv = "$GLGSV,4,4,14,13,21,181,,14,15,302,*69\r\n"
+        self.assertTrue(hasattr(NMEAReader.parse(gsv, fields=fields), "elv_01"))
+        stream = BytesIO((self.messagePUBX + ubx03).encode())
+        nmr = NMEAReader(stream, fields={"UBX": ("time",)})
+        self.assertEqual([parsed.identity for _, parsed in nmr], ["PUBX00", "PUBX03"])
+        self.assertEqual(nmr.stats["identities"], {"PUBX00": 1, "PUBX03": 1})
+
+    def testTryParse(self):  # result codes rather than exceptions
+        gga = "$GNGGA,103607.00,5327.03942,N,00214.42462,W,1,12,0.67,84.5,M,48.3,M,,*69\r\n"
+        code, res = NMEAReader.try_parse(self.messageGLL)
+        self.assertEqual(
+            (code, str(res)), (PARSE_OK, str(NMEAReader.parse(self.messageGLL)))
+        )
+        for msg, validate, code, parsed in (
+            (self.messageBADCK, VALCKSUM, PARSE_BADCKSUM, False),
+            (self.messageBADCK, VALNONE, PARSE_OK, True),
+            (self.messageNK, VALCKSUM, PARSE_UNKNOWN, True),
+            (self.messageNK, VALMSGID, PARSE_UNKNOWN, False),
+            (gga.replace("GN", "XX"), VALMSGID, PARSE_UNKNOWN, False),
+            ("$PUBX,99,1*00\r\n", VALNONE, PARSE_UNKNOWN, True),
+            ("$PUBX,99,1*00\r\n", VALMSGID, PARSE_UNKNOWN, False),
+            ("$GNGGA,103607.00,5327.03942\r\n", VALNONE, PARSE_MALFORMED, False),
+            (b"$GNGGA,10\xff3607.00*00\r\n", VALNONE, PARSE_MALFORMED, False),
+            (gga.replace(",1,12,", ",x,12,"), VALNONE, PARSE_BADTYPE, False),
+            (b"\\s:GP0001*00\\" + gga.encode(), VALCKSUM, PARSE_BADCKSUM, False),
+            (b"\\s:GP0001*00\\" + gga.encode(), VALNONE, PARSE_OK, True),
+            (b"\\s:GP0001" + gga.encode(), VALNONE, PARSE_MALFORMED, False),
+            ("$PQTMSN*00\r\n", VALNONE, PARSE_OK, True),  # empty payload
+        ):
+            res = NMEAReader.try_parse(msg, validate=validate)
+            self.assertEqual((res[0], res[1] is not None), (code, parsed), msg)
+        code, res = NMEAReader.try_parse(gga, fields={"GGA": ("lat",)}, lazy=True)
+        self.assertEqual((code, str(res)), (PARSE_OK, "<NMEA(GNGGA, lat=53.450657)>"))
+        code, res = NMEAReader.try_parse(gga, msgclasses=True)
+        self.assertEqual((code, type(res).__name__), (PARSE_OK, "NMEAMessageGGA"))
+        with self.assertRaisesRegex(NMEAParseError, "Invalid parse mode 3"):
+            NMEAReader.try_parse(gga, msgmode=3)
+
+    def testTryParseReader(self):  # ignored errors give same results as logged
+        for filename in (
+            "pygpsdata-nmeabadck.log",
+            "pygpsdata-nmeafoo2.log",
+            "pygpsdata-userdefined.log",
+            "locosys_set_nmea.log",
+            "quectel_nmea_command.log",
+        ):
+            for validate in (VALCKSUM, VALCKSUM | VALMSGID):
+                res = []
+                for quitonerror in (ERR_IGNORE, ERR_LOG):
+                    with open(os.path.join(DIRNAME, filename), "rb") as stream:
+                        nmr = NMEAReader(
+                            stream,
+                            validate=validate,
+                            quitonerror=quitonerror,
+                            errorhandler=lambda err: None,
+                        )
+                        res.append(([(raw, str(msg)) for raw, msg in nmr], nmr.stats))
+                self.assertEqual(res[0], res[1], filename)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
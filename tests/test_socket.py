@@ -9,7 +9,9 @@ Created on 11 May 2022
 :author: semuadmin (Steve Smith)
 """
 
+import gzip
 import unittest
+import zlib
 from socket import socket
 from pynmeagps import (
     NMEAReader,
@@ -18,8 +20,11 @@ from pynmeagps import (
     ENCODE_CHUNKED,
     ENCODE_NONE,
     DEFAULT_BUFSIZE,
+    ENCODE_DEFLATE,
+    ENCODE_GZIP,
     SocketWrapper,
 )
+from pynmeagps.socketwrapper import CHUNK_SIZE
 
 
 def chunk(data: bytes, chunksize: int = 10) -> bytes:
@@ -51,8 +56,8 @@ SOCKETPOOL_CHUNKED = chunk(SOCKETPOOL)
 
 class DummySocket(socket):
     """
-    Dummy socket class which simulates recv() method
-    and TimeoutError.
+    Dummy socket class which simulates recv() and recv_into()
+    methods and TimeoutError.
     """
 
     def __init__(self, pool: bytes, *args, **kwargs):
@@ -73,6 +78,11 @@ class DummySocket(socket):
         self._buffer = self._buffer[num:]
         return buff
 
+    def recv_into(self, buffer, nbytes: int = 0) -> int:
+        buff = self.recv(nbytes or len(buffer))
+        buffer[: len(buff)] = buff
+        return len(buff)
+
     def send(self, data: bytes):
         if self._timeout:
             raise TimeoutError
@@ -97,6 +107,57 @@ class SocketTest(unittest.TestCase):
         self.assertIsInstance(sw.buffer, bytearray)
         self.assertEqual(sw.in_waiting(), 4096)
 
+    def testSocketWrapperLines(self):  # lines spanning multiple receives
+        lines = SOCKETPOOL.splitlines(keepends=True)
+        for bufsize in (1, 7, 64, 4096):
+            sw = SocketWrapper(DummySocket(SOCKETPOOL), bufsize=bufsize)
+            for i in range(60):
+                self.assertEqual(sw.readline(), lines[i % 30], bufsize)
+            self.assertEqual(sw.read(6), b"$GNDTM", bufsize)
+            self.assertEqual(sw.readline(10), b",W84,,0.0,", bufsize)
+            self.assertEqual(sw.readline(100), lines[0][16:], bufsize)
+            self.assertEqual(sw.read(len(lines[1])), lines[1], bufsize)
+            self.assertEqual(sw.in_waiting(), len(sw.buffer), bufsize)
+
+    def testSocketCompressed(self):  # compressed stream spanning multiple chunks
+        gzipped = gzip.compress(SOCKETPOOL[:900]) + gzip.compress(SOCKETPOOL[900:])
+        dcp = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        deflated = dcp.compress(SOCKETPOOL) + dcp.flush()
+
+        def chunked(data: bytes, size: int) -> bytes:
+            chunks = [data[i : i + size] for i in range(0, len(data), size)]
+            out = b"".join(f"{len(c):x}\r\n".encode() + c + b"\r\n" for c in chunks)
+            return out + b"0\r\n\r\n"
+
+        for encoding, data in (
+            (ENCODE_CHUNKED | ENCODE_GZIP, chunked(gzipped, 37)),
+            (ENCODE_CHUNKED | ENCODE_DEFLATE, chunked(deflated, 5)),
+            (ENCODE_DEFLATE, deflated),
+        ):
+            for bufsize in (3, 64, 4096):
+                sw = SocketWrapper(
+                    DummySocket(data), encoding=encoding, bufsize=bufsize
+                )
+                self.assertEqual(sw.read(len(SOCKETPOOL)), SOCKETPOOL)
+
+    def testSocketDecompressError(self):  # corrupt data discarded, stream restarts
+        sw = SocketWrapper(DummySocket(SOCKETPOOL), encoding=ENCODE_GZIP)
+        self.assertEqual(sw._decompress(b"not gzip data"), b"")
+        self.assertEqual(sw._decompress(gzip.compress(b"hello")), b"hello")
+
+    def testSocketDechunk(self):  # partial chunks retained between segments
+        sw = SocketWrapper(DummySocket(SOCKETPOOL), encoding=ENCODE_CHUNKED)
+        sw._chunkstate = CHUNK_SIZE  # discard initial buffer contents
+        sw._sizeline.clear()
+        data = b"garbage\r\n5;ext=1\r\nhello\r\n10\r\n" + b"x" * 16 + b"\r\n0\r\n\r\n"
+        res = bytearray()
+        for i in range(len(data)):
+            chunks, partial = sw.dechunk(data[i : i + 1])
+            self.assertEqual(partial, b"")
+            res += chunks
+        self.assertEqual(res, b"hello" + b"x" * 16)
+        self.assertEqual(sw.dechunk(b"5\r\nhello\r\n"), (b"", b""))
+
     def testSocketStub(self):
         EXPECTED_RESULTS = (
             "<NMEA(GNDTM, datum=W84, subDatum=, latOfset=0.0, NS=N, lonOfset=0.0, EW=E, alt=0.0, refDatum=W84)>",
@@ -15,6 +15,7 @@ import unittest
 from pynmeagps import (
     NMEAMessage,
     NMEAMessageError,
+    NMEAParseError,
     NMEAReader,
     NMEATypeError,
     NMEA_MSGIDS,
@@ -33,6 +34,8 @@ from pynmeagps.nmeahelpers import (
     area,
     bearing,
     calc_checksum,
+    calc_crc24q,
+    calc_ubx_checksum,
     date2str,
     date2utc,
     ddd2dmm,
@@ -44,6 +47,7 @@ from pynmeagps.nmeahelpers import (
     hex2str,
     generate_checksum,
     get_parts,
+    get_tagblock,
     groupsize,
     haversine,
     knots2spd,
@@ -53,10 +57,12 @@ from pynmeagps.nmeahelpers import (
     llh2iso6709,
     msgdesc,
     planar,
+    tagblock2str,
     time2str,
     time2utc,
     leapsecond,
     utc2wnotow,
+    verify_checksum,
     wnotow2utc,
 )
 from pynmeagps.nmeatypes_core import GET, POLL
@@ -224,12 +230,35 @@ class StaticTest(unittest.TestCase):
         self.assertEqual(res, date(2020, 3, 12))
         res = date2utc("12032020", "DTL")
         self.assertEqual(res, date(2020, 3, 12))
+        res = date2utc("120369")
+        self.assertEqual(res, date(1969, 3, 12))
+        for dates in ("310220", "12032", "1203xx", "12-03-20", "00032020", None):
+            self.assertEqual(date2utc(dates), "")
+        self.assertEqual(date2utc("30022020", "DTL"), "")
+        self.assertEqual(date2utc(["120320"]), "")
+        self.assertEqual(NMEAMessage.str2val("12032020", "DTL"), date(2020, 3, 12))
 
     def testTime2UTC(self):
         res = time2utc("")
         self.assertEqual(res, "")
         res = time2utc("081123.000")
         self.assertEqual(res, time(8, 11, 23))
+        res = time2utc("081123")
+        self.assertEqual(res, time(8, 11, 23))
+        res = time2utc("081123.5")
+        self.assertEqual(res, time(8, 11, 23, 500000))
+        res = time2utc("081123.123456")
+        self.assertEqual(res, time(8, 11, 23, 123456))
+        for times in (
+            "081123.",
+            "081123.1234567",
+            "241123.00",
+            "086023",
+            "0811x3",
+            None,
+        ):
+            self.assertEqual(time2utc(times), "")
+        self.assertEqual(time2utc(["081123"]), "")
 
     def testTime2str(self):
         res = time2str(time(8, 11, 23))
@@ -720,6 +749,45 @@ class StaticTest(unittest.TestCase):
         # print(wno, tow, ls)
         self.assertEqual((wno, tow, ls), (364, 266602000, 18))
 
+    def testbinarychecksums(self):
+        rtcm = bytes.fromhex("d300133ed7d30202980edeef34b4bd62ac0941986f33360b98")
+        self.assertEqual(calc_crc24q(rtcm), 0)
+        self.assertEqual(calc_crc24q(rtcm[:-3]), 0x360B98)
+        self.assertEqual(calc_ubx_checksum(b"\x01\x07\x00\x00"), b"\x08\x19")
+        self.assertEqual(calc_ubx_checksum(b""), b"\x00\x00")
+
+    def testverifychecksum(self):
+        verify_checksum(b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n")
+        verify_checksum(
+            bytearray(b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68")
+        )
+        verify_checksum(memoryview(b"$PGRMM,WGS84*26\r\n"))
+        verify_checksum(b"$PGRMO,PGRMM,2*30\r\n")
+        with self.assertRaisesRegex(
+            NMEAParseError, "Message GNGLL invalid checksum 22 - should be 68."
+        ):
+            verify_checksum(b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*22\r\n")
+        with self.assertRaisesRegex(NMEAParseError, "Message PGRMM invalid checksum"):
+            verify_checksum(b"$PGRMM,WGS84\r\n")
+
+    def testtagblock(self):
+        tag, msg = get_tagblock(b"\\s:GP0001,c:1577836800*2B\\$PGRMM,WGS84*26\r\n")
+        self.assertEqual(tag, {"s": "GP0001", "c": 1577836800})
+        self.assertEqual(msg, b"$PGRMM,WGS84*26\r\n")
+        self.assertEqual(tagblock2str(tag), "\\s:GP0001,c:1577836800*2B\\")
+        self.assertEqual(tagblock2str({}), "")
+        tag, _ = get_tagblock(memoryview(b"\\s:GP0001,n:abc*00\\$PGRMM"), False)
+        self.assertEqual(tag, {"s": "GP0001", "n": "abc"})
+        with self.assertRaisesRegex(
+            NMEAParseError, "TAG block invalid checksum 00 - should be 2B."
+        ):
+            get_tagblock(b"\\s:GP0001,c:1577836800*00\\$PGRMM,WGS84*26\r\n")
+        with self.assertRaisesRegex(NMEAMessageError, "Badly formed TAG block"):
+            get_tagblock(b"\\s:GP0001,c:1577836800*2B$PGRMM,WGS84*26\r\n")
+        verify_checksum(b"\\s:GP0001,c:1577836800*2B\\$PGRMM,WGS84*26\r\n")
+        with self.assertRaisesRegex(NMEAParseError, "TAG block invalid checksum"):
+            verify_checksum(b"\\s:GP0001,c:1577836800*2C\\$PGRMM,WGS84*26\r\n")
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
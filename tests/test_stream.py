@@ -10,14 +10,27 @@ Created on 4 Mar 2021
 
 import os
 import sys
+import tempfile
 import unittest
+from io import BytesIO
 from logging import ERROR
 
 from pynmeagps import (
+    NMEAFileReader,
     NMEAReader,
+    NMEAStreamParser,
+    calc_ubx_checksum,
+    get_ranges,
+    parse_file_parallel,
+    NMEAChecksumError,
+    NMEAHeaderError,
+    NMEALengthError,
     NMEAParseError,
+    NMEAStreamError,
     NMEATypeError,
     VALCKSUM,
+    VALMSGID,
+    VALNONE,
     ERR_RAISE,
     ERR_IGNORE,
     ERR_LOG,
@@ -31,6 +44,7 @@ from pynmeagps import (
     ST,
     FMI_STATUS,
 )
+from pynmeagps.nmeaparallel import _parse_range
 
 DIRNAME = os.path.dirname(__file__)
 
@@ -787,6 +801,592 @@ class StreamTest(unittest.TestCase):
                 i += 1
             self.assertEqual(i, 2)
 
+    def testBLOCKMODE(self):  # block-buffered framing should match byte-by-byte framing
+        for fname in (
+            "pygpsdata-nmea4.log",
+            "pygpsdata-mixed.log",
+            "pygpsdata-badeof.log",
+            "pygpsdata-nmeabadck2.log",
+            "pygpsdata-BADHDR.log",
+            "pygpsdata-maritime.log",
+            "pygpsdata-um981.log",
+            "quectel_nmea_get.log",
+        ):
+            with open(os.path.join(DIRNAME, fname), "rb") as stream:
+                nmr = NMEAReader(stream, quitonerror=ERR_IGNORE)
+                expected = [(raw, str(parsed)) for raw, parsed in nmr]
+            for blocksize in (1, 7, 65536):
+                with open(os.path.join(DIRNAME, fname), "rb") as stream:
+                    nmr = NMEAReader(
+                        stream, quitonerror=ERR_IGNORE, blocksize=blocksize
+                    )
+                    res = [(raw, str(parsed)) for raw, parsed in nmr]
+                self.assertEqual(res, expected, f"{fname} blocksize {blocksize}")
+
+    def testBLOCKMODE_BADHDR(self):  # invalid header in block mode with nmeaonly = True
+        EXPECTED_ERROR = "Unknown protocol header b'$&'."
+        with self.assertRaises(NMEAParseError) as context:
+            with open(os.path.join(DIRNAME, "pygpsdata-BADHDR.log"), "rb") as stream:
+                ubr = NMEAReader(
+                    stream, quitonerror=ERR_RAISE, nmeaonly=True, blocksize=4096
+                )
+                for _, _ in ubr:
+                    pass
+        self.assertTrue(EXPECTED_ERROR in str(context.exception))
+
+    def testFILEREADER(self):  # memory-mapped file reader should match stream reader
+        for fname in (
+            "pygpsdata-nmea4.log",
+            "pygpsdata-mixed.log",
+            "pygpsdata-badeof.log",
+            "pygpsdata-nmeabadck2.log",
+            "pygpsdata-maritime.log",
+        ):
+            with open(os.path.join(DIRNAME, fname), "rb") as stream:
+                nmr = NMEAReader(stream, quitonerror=ERR_IGNORE)
+                expected = [(raw, str(parsed)) for raw, parsed in nmr]
+            with NMEAFileReader(
+                os.path.join(DIRNAME, fname), quitonerror=ERR_IGNORE
+            ) as nmr:
+                res = [(raw, str(parsed)) for raw, parsed in nmr]
+            self.assertEqual(res, expected, fname)
+
+    def testFILEREADER_NOCOPY(self):  # memory-mapped file reader returning memoryviews
+        with NMEAFileReader(
+            os.path.join(DIRNAME, "pygpsdata-nmea4sm.log"), copyraw=False
+        ) as nmr:
+            raw, parsed = nmr.read()
+            self.assertIsInstance(raw, memoryview)
+            self.assertEqual(bytes(raw), parsed.serialize())
+            raw.release()
+
+    def testFILEREADER_BADHDR(self):  # memory-mapped file reader with nmeaonly = True
+        EXPECTED_ERROR = "Unknown protocol header b'$&'."
+        with self.assertRaises(NMEAParseError) as context:
+            with NMEAFileReader(
+                os.path.join(DIRNAME, "pygpsdata-BADHDR.log"),
+                quitonerror=ERR_RAISE,
+                nmeaonly=True,
+            ) as nmr:
+                for _, _ in nmr:
+                    pass
+        self.assertTrue(EXPECTED_ERROR in str(context.exception))
+
+    def testFILEREADER_EMPTY(self):  # memory-mapped file reader with empty file
+        fname = os.path.join(DIRNAME, "pygpsdata-empty.tmp")
+        with open(fname, "wb"):
+            pass
+        try:
+            with NMEAFileReader(fname) as nmr:
+                self.assertEqual(nmr.read(), (None, None))
+        finally:
+            os.remove(fname)
+
+    def testLAZY(self):  # lazily-decoded messages should match eagerly-decoded messages
+        for fname in (
+            "pygpsdata-nmea4.log",
+            "pygpsdata-mixed.log",
+            "pygpsdata-maritime.log",
+            "pygpsdata-um981.log",
+            "quectel_nmea_get.log",
+        ):
+            with open(os.path.join(DIRNAME, fname), "rb") as stream:
+                nmr = NMEAReader(stream, quitonerror=ERR_IGNORE)
+                expected = [(raw, str(parsed)) for raw, parsed in nmr]
+            with open(os.path.join(DIRNAME, fname), "rb") as stream:
+                nmr = NMEAReader(stream, quitonerror=ERR_IGNORE, lazy=True)
+                res = [(raw, str(parsed)) for raw, parsed in nmr]
+            self.assertEqual(res, expected, fname)
+
+    def testMSGFILTER(self):  # filter sentences on header before parsing
+        fname = os.path.join(DIRNAME, "pygpsdata-nmea4.log")
+        with open(fname, "rb") as stream:
+            expected = [
+                (raw, str(parsed))
+                for raw, parsed in NMEAReader(stream)
+                if parsed.identity in ("GNGGA", "INGGA", "GPGSV", "PGRMM")
+                or parsed.identity[:4] == "PUBX"
+            ]
+        for blocksize in (0, 4096):
+            with open(fname, "rb") as stream:
+                nmr = NMEAReader(
+                    stream,
+                    blocksize=blocksize,
+                    msgfilter={"GGA", "GPGSV", "PGRMM", "PUBX"},
+                )
+                res = [(raw, str(parsed)) for raw, parsed in nmr]
+            self.assertEqual(res, expected)
+        with open(fname, "rb") as stream:
+            nmr = NMEAReader(stream, msgfilter=("GNGGA", "GRMM"), filterraw=True)
+            res = [(raw[:6], parsed) for raw, parsed in nmr]
+        self.assertEqual(len(res), 57)
+        self.assertEqual(
+            [raw for raw, parsed in res if parsed is not None], [b"$GNGGA", b"$PGRMM"]
+        )
+        with NMEAFileReader(fname, msgfilter=[]) as nmr:
+            self.assertEqual(list(nmr), [])
+
+    def testNOPARSE(self):  # framing and checksum validation only
+        for fname in ("pygpsdata-nmea4.log", "pygpsdata-nmeabadck2.log"):
+            with open(os.path.join(DIRNAME, fname), "rb") as stream:
+                nmr = NMEAReader(stream, quitonerror=ERR_IGNORE)
+                expected = [raw for raw, _ in nmr]
+            for blocksize in (0, 4096):
+                with open(os.path.join(DIRNAME, fname), "rb") as stream:
+                    nmr = NMEAReader(
+                        stream,
+                        quitonerror=ERR_IGNORE,
+                        blocksize=blocksize,
+                        parsing=False,
+                    )
+                    res = list(nmr)
+                self.assertEqual([raw for raw, _ in res], expected, fname)
+                self.assertEqual({parsed for _, parsed in res}, {None})
+            nsp = NMEAStreamParser(quitonerror=ERR_IGNORE, parsing=False)
+            with open(os.path.join(DIRNAME, fname), "rb") as stream:
+                nsp.feed(stream.read())
+            self.assertEqual([raw for raw, _ in nsp.events()], expected, fname)
+        with NMEAFileReader(
+            os.path.join(DIRNAME, "pygpsdata-nmeabadck2.log"),
+            quitonerror=ERR_RAISE,
+            parsing=False,
+        ) as nmr:
+            with self.assertRaisesRegex(
+                NMEAParseError, "Message GNVTG invalid checksum 3\\) - should be 30."
+            ):
+                list(nmr)
+        with open(os.path.join(DIRNAME, "pygpsdata-nmeabadck2.log"), "rb") as stream:
+            nmr = NMEAReader(stream, validate=VALNONE, parsing=False)
+            self.assertEqual(len(list(nmr)), 8)
+
+    def testSTATS(self):  # reader statistics
+        EXPECTED_STATS = {
+            "bytes": 1333,
+            "discarded": 568,
+            "framed": 15,
+            "checksum": 0,
+            "unknown": 0,
+            "typeerrors": 0,
+            "badheaders": 0,
+            "binary": 4,
+            "overlong": 0,
+            "errors": 0,
+        }
+        for blocksize in (0, 4096):
+            with open(os.path.join(DIRNAME, "pygpsdata-mixed.log"), "rb") as stream:
+                nmr = NMEAReader(stream, blocksize=blocksize)
+                for _ in nmr:
+                    pass
+                stats = nmr.stats
+                identities = stats.pop("identities")
+                self.assertEqual(stats, EXPECTED_STATS)
+                self.assertEqual(sum(identities.values()), 15)
+                self.assertEqual(identities["GNGGA"], 2)
+                nmr.reset_stats()
+                self.assertEqual(
+                    nmr.stats, dict.fromkeys(EXPECTED_STATS, 0) | {"identities": {}}
+                )
+        for fname, key, val in (
+            ("pygpsdata-nmeabadck2.log", "checksum", 1),
+            ("pygpsdata-nmeafoo2.log", "typeerrors", 2),
+        ):
+            with NMEAFileReader(
+                os.path.join(DIRNAME, fname), quitonerror=ERR_IGNORE
+            ) as nmr:
+                for _ in nmr:
+                    pass
+                self.assertEqual(nmr.stats[key], val)
+        stream = BytesIO(b"$GNXXX,5327.04319,S,00214.41396,E,223232.00,A,A*77\r\n")
+        for validate, idcount in ((VALCKSUM, 1), (VALCKSUM | VALMSGID, 0)):
+            stream.seek(0)
+            nmr = NMEAReader(stream, validate=validate, quitonerror=ERR_IGNORE)
+            for _ in nmr:
+                pass
+            self.assertEqual(nmr.stats["unknown"], 1)
+            self.assertEqual(len(nmr.stats["identities"]), idcount)
+
+    def testSTATS_ERRORTYPES(self):  # errors classified by exception type
+        gga = b"$GNGGA,103607.00,5327.03942,N,00214.42462,W,1,12,0.67,84.5,M,48.3,M,,*69\r\n"
+        for data, maxlen, nmeaonly, err in (
+            (gga.replace(b"*69", b"*00"), 1024, False, NMEAChecksumError),
+            (b"$XY\x00\x01" + gga, 1024, True, NMEAHeaderError),
+            (gga, 32, False, NMEALengthError),
+        ):
+            for blocksize in (0, 4096):
+                with self.assertRaises(err):
+                    nmr = NMEAReader(
+                        BytesIO(data),
+                        maxlen=maxlen,
+                        nmeaonly=nmeaonly,
+                        blocksize=blocksize,
+                        quitonerror=ERR_RAISE,
+                    )
+                    list(nmr)
+        nmr = NMEAReader(BytesIO(b""))
+        for err, key in (
+            (NMEAChecksumError("reworded"), "checksum"),
+            (NMEALengthError("reworded"), "overlong"),
+            (NMEAHeaderError("reworded"), None),
+            (NMEATypeError("reworded"), "typeerrors"),
+            (NMEAParseError("reworded invalid checksum"), "errors"),
+            (NMEAStreamError("reworded maximum length"), "errors"),
+        ):
+            nmr.reset_stats()
+            nmr._count_error(err)  # pylint: disable=protected-access
+            counts = {k: v for k, v in nmr.stats.items() if v and k != "identities"}
+            self.assertEqual(counts, {} if key is None else {key: 1}, err)
+
+    def testBINARYSKIP(self):  # skip UBX and RTCM3 frames in mixed protocol stream
+        nmea = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+        ubx = b"\xb5\x62\x01\x07\x08\x00$GNGGA,\n\xce\x32"  # payload resembles NMEA
+        rtcm = bytes.fromhex("d300133ed7d30202980edeef34b4bd62ac0941986f33360b98")
+        data = (
+            b"\x01\x02"
+            + nmea
+            + ubx
+            + rtcm
+            + nmea
+            + b"\xb5\x62\x01\x07\xff\x00"  # invalid UBX frame
+            + nmea
+            + rtcm[:-1]
+            + b"\x00"  # invalid RTCM3 frame
+            + nmea
+            + rtcm[:-5]  # incomplete RTCM3 frame
+        )
+        for blocksize in (0, 7, 4096):
+            frames = []
+            nmr = NMEAReader(
+                BytesIO(data),
+                blocksize=blocksize,
+                quitonerror=ERR_RAISE,
+                binaryhandler=frames.append,
+            )
+            self.assertEqual([raw for raw, _ in nmr], [nmea] * 4, blocksize)
+            self.assertEqual(frames, [ubx, rtcm], blocksize)
+            stats = nmr.stats
+            self.assertEqual(stats["binary"], 2)
+            self.assertEqual(stats["framed"], 4)
+            self.assertEqual(stats["badheaders"], 0)
+        # binary frames are not recognised if nmeaonly = True
+        nmr = NMEAReader(BytesIO(nmea + ubx + nmea), nmeaonly=True)
+        self.assertEqual([raw for raw, _ in nmr], [nmea, b"$GNGGA,\n", nmea])
+        self.assertEqual(nmr.stats["binary"], 0)
+
+    def testMAXLEN(self):  # resynchronise after sentence with no terminator
+        nmea = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+        data = nmea + b"$GNGSV," + b"x" * 200 + nmea + b"$GPXXX" + b"y" * 50 + nmea
+        for blocksize in (0, 7, 4096):
+            nmr = NMEAReader(BytesIO(data), blocksize=blocksize, maxlen=100)
+            self.assertEqual([raw for raw, _ in nmr], [nmea] * 3, blocksize)
+            stats = nmr.stats
+            self.assertEqual(stats["overlong"], 2, blocksize)
+            self.assertEqual(stats["discarded"], 263, blocksize)
+            self.assertEqual(stats["bytes"], len(data), blocksize)
+            nmr = NMEAReader(
+                BytesIO(data), blocksize=blocksize, maxlen=100, quitonerror=ERR_RAISE
+            )
+            nmr.read()
+            with self.assertRaisesRegex(
+                NMEAStreamError, "Sentence exceeds maximum length 100 bytes."
+            ):
+                nmr.read()
+            # unbounded
+            nmr = NMEAReader(
+                BytesIO(data),
+                blocksize=blocksize,
+                maxlen=0,
+                validate=VALNONE,
+                parsing=False,
+            )
+            self.assertEqual(
+                [raw for raw, _ in nmr],
+                [nmea, b"$GNGSV," + b"x" * 200 + nmea, b"$GPXXX" + b"y" * 50 + nmea],
+                blocksize,
+            )
+        nmp = NMEAStreamParser(maxlen=100)
+        res = []
+        for i in range(0, len(data), 13):
+            nmp.feed(data[i : i + 13])
+            res += [raw for raw, _ in nmp.events()]
+        self.assertEqual(res, [nmea] * 3)
+        self.assertEqual(nmp.discarded, 263)
+
+    def testMAXLEN_TAGBLOCK(self):  # maximum length excludes leading TAG block
+        nmea = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+        tag = b"\\s:GP0001,c:1577836800*2B\\"
+        data = tag + nmea + tag + b"$GNGSV," + b"x" * 200 + nmea + tag + nmea
+        res = []
+        for blocksize in (0, 7, 4096):
+            nmr = NMEAReader(BytesIO(data), blocksize=blocksize, maxlen=len(nmea))
+            raws = [raw for raw, _ in nmr]
+            stats = nmr.stats
+            stats.pop("identities")
+            self.assertEqual(raws, [tag + nmea, nmea, tag + nmea], blocksize)
+            self.assertEqual(stats["overlong"], 1, blocksize)
+            self.assertEqual(stats["bytes"], len(data), blocksize)
+            res.append(stats)
+        self.assertEqual(res[0], res[1])
+        self.assertEqual(res[0], res[2])
+
+    def testMAXLEN_READLINE(self):  # stream readline() without size argument
+        class LineStream:
+            def __init__(self, data):
+                self._stream = BytesIO(data)
+
+            def read(self, size):
+                return self._stream.read(size)
+
+            def readline(self):
+                return self._stream.readline()
+
+        nmea = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+        data = nmea + b"$GNGSV," + b"x" * 200 + nmea + nmea
+        for maxlen in (0, 100):
+            nmr = NMEAReader(
+                LineStream(data), maxlen=maxlen, validate=VALNONE, parsing=False
+            )
+            raws = [raw for raw, _ in nmr]
+            if maxlen:
+                self.assertEqual(raws, [nmea] * 3)
+                self.assertEqual(nmr.stats["overlong"], 1)
+            else:
+                self.assertEqual(raws, [nmea, b"$GNGSV," + b"x" * 200 + nmea, nmea])
+
+    def testTAGBLOCK(self):  # sentences with leading TAG blocks
+        nmea = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+        tag1 = b"\\s:GP0001,c:1577836800*2B\\"
+        tag2 = b"\\s:GP0001,n:123*17\\"
+        data = (
+            tag1
+            + nmea
+            + b"\\junk"  # not a TAG block
+            + nmea
+            + tag2
+            + b"\r\n"  # TAG block without sentence
+            + tag2
+            + nmea
+            + b"\\s:GP0001*00\\"  # invalid TAG block checksum
+            + nmea
+            + b"\\"
+            + b"a" * 100  # TAG block too long
+            + nmea
+        )
+        for blocksize in (0, 7, 4096):
+            nmr = NMEAReader(BytesIO(data), blocksize=blocksize, quitonerror=ERR_IGNORE)
+            res = list(nmr)
+            self.assertEqual(
+                [raw for raw, _ in res], [tag1 + nmea, nmea, tag2 + nmea, nmea]
+            )
+            self.assertEqual(
+                [parsed.tagblock for _, parsed in res],
+                [
+                    {"s": "GP0001", "c": 1577836800},
+                    None,
+                    {"s": "GP0001", "n": 123},
+                    None,
+                ],
+            )
+            self.assertEqual(str(res[0][1]), str(res[1][1]))
+            stats = nmr.stats
+            self.assertEqual(stats["checksum"], 1, blocksize)
+            self.assertEqual(stats["bytes"], len(data), blocksize)
+            nmr = NMEAReader(
+                BytesIO(data), blocksize=blocksize, msgfilter=["GLL"], parsing=False
+            )
+            self.assertEqual(
+                [raw for raw, _ in nmr], [tag1 + nmea, nmea, tag2 + nmea, nmea]
+            )
+        nmp = NMEAStreamParser(quitonerror=ERR_IGNORE)
+        res = []
+        for i in range(0, len(data), 5):
+            nmp.feed(data[i : i + 5])
+            res += [raw for raw, _ in nmp.events()]
+        self.assertEqual(res, [tag1 + nmea, nmea, tag2 + nmea, nmea])
+
+    def testTAGBLOCK_RESYNC(self):  # TAG block starting at end of candidate block
+        nmea = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+        tag = b"\\s:GP0001,n:123*17\\"
+        data = b"junk\\xx" + tag + nmea
+        for blocksize in (0, 7, 4096):
+            nmr = NMEAReader(BytesIO(data), blocksize=blocksize)
+            res = list(nmr)
+            self.assertEqual([raw for raw, _ in res], [tag + nmea], blocksize)
+            self.assertEqual(res[0][1].tagblock, {"s": "GP0001", "n": 123})
+            self.assertEqual(nmr.stats["discarded"], 7, blocksize)
+        nmp = NMEAStreamParser()
+        nmp.feed(data)
+        self.assertEqual([raw for raw, _ in nmp.events()], [tag + nmea])
+
+    def testSTREAMPARSER(self):  # sans-IO parser fed in arbitrary chunks
+        for fname in (
+            "pygpsdata-nmea4.log",
+            "pygpsdata-mixed.log",
+            "pygpsdata-badeof.log",
+            "pygpsdata-nmeabadck2.log",
+            "pygpsdata-maritime.log",
+        ):
+            with open(os.path.join(DIRNAME, fname), "rb") as stream:
+                data = stream.read()
+                stream.seek(0)
+                nmr = NMEAReader(stream, quitonerror=ERR_IGNORE)
+                expected = [(raw, str(parsed)) for raw, parsed in nmr]
+            for chunksize in (1, 13, 100000):
+                nmp = NMEAStreamParser(quitonerror=ERR_IGNORE)
+                res = []
+                for i in range(0, len(data), chunksize):
+                    nmp.feed(data[i : i + chunksize])
+                    res += [(raw, str(parsed)) for raw, parsed in nmp.events()]
+                self.assertEqual(res, expected, f"{fname} chunksize {chunksize}")
+
+    def testSTREAMPARSER_OPTIONS(self):  # shared reader options, framer not exposed
+        with open(os.path.join(DIRNAME, "pygpsdata-mixed.log"), "rb") as stream:
+            data = stream.read()
+        for kwargs in (
+            {"msgfilter": ("GGA", "GNGLL")},
+            {"msgfilter": ("GSV",), "filterraw": True},
+            {"lazy": True},
+            {"msgclasses": True},
+            {"fields": {"GGA": ("time", "lat", "lon")}},
+        ):
+            nmr = NMEAReader(BytesIO(data), quitonerror=ERR_IGNORE, **kwargs)
+            expected = [(raw, str(parsed)) for raw, parsed in nmr]
+            nmp = NMEAStreamParser(quitonerror=ERR_IGNORE, **kwargs)
+            nmp.feed(data)
+            res = [(raw, str(parsed)) for raw, parsed in nmp.events(eof=True)]
+            self.assertEqual(res, expected, kwargs)
+        for attr in ("next_frame", "next_span", "set_eof", "binary_length"):
+            self.assertFalse(hasattr(nmp, attr), attr)
+        self.assertEqual(nmp.binframes, 4)
+        nmp.reset_counts()
+        self.assertEqual(nmp.binframes, 0)
+        nmp.feed(b"\xb5\x62\x01\x07\x00\x10")  # truncated UBX frame
+        self.assertEqual(list(nmp.events()), [])
+        self.assertEqual(nmp.in_waiting, 6)
+        self.assertEqual(list(nmp.events(eof=True)), [])
+        self.assertEqual(nmp.in_waiting, 0)
+        self.assertEqual(nmp.discarded, 6)
+
+    def testSTREAMPARSER_PARTIAL(self):  # partial sentence retained until complete
+        nmp = NMEAStreamParser()
+        nmp.feed(b"\xb5\x01\x02$GNGGA,,,,,,0,00,99.99,,")
+        self.assertEqual(list(nmp.events()), [])
+        self.assertEqual(nmp.in_waiting, 24)
+        nmp.feed(b",,,,*56\r\n$GNG")
+        res = list(nmp.events())
+        self.assertEqual(res[0][0], b"$GNGGA,,,,,,0,00,99.99,,,,,,*56\r\n")
+        self.assertEqual(res[0][1].identity, "GNGGA")
+        self.assertEqual(nmp.in_waiting, 4)
+
+    def testSTREAMPARSER_ERR(self):  # sans-IO parser error handling
+        errs = []
+        nmp = NMEAStreamParser(nmeaonly=True, errorhandler=errs.append)
+        nmp.feed(b"$&xyz\r\n$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*99\r\n")
+        self.assertEqual(list(nmp.events()), [])
+        self.assertEqual(
+            [str(e) for e in errs],
+            [
+                "Unknown protocol header b'$&'.",
+                "Message GNGLL invalid checksum 99 - should be 68.",
+            ],
+        )
+        nmp = NMEAStreamParser(nmeaonly=True, quitonerror=ERR_RAISE)
+        nmp.feed(b"$&xyz\r\n")
+        with self.assertRaises(NMEAParseError):
+            list(nmp.events())
+        with self.assertRaises(NMEAParseError):
+            NMEAStreamParser(msgmode=4)
+
+    def testITERBATCHES(self):  # batched iteration
+        with open(os.path.join(DIRNAME, "pygpsdata-nmea4.log"), "rb") as stream:
+            expected = list(NMEAReader(stream))
+            stream.seek(0)
+            nmr = NMEAReader(stream, blocksize=4096)
+            batches = list(nmr.iter_batches(10))
+        self.assertEqual([len(b) for b in batches], [10, 10, 10, 10, 10, 7])
+        self.assertEqual(
+            [(raw, str(parsed)) for batch in batches for raw, parsed in batch],
+            [(raw, str(parsed)) for raw, parsed in expected],
+        )
+        with self.assertRaises(ValueError):
+            next(nmr.iter_batches(0))
+
+    def testPARALLEL(self):  # multi-process parser should match stream reader
+        fname = os.path.join(DIRNAME, "pygpsdata-nmea4.log")
+        with open(fname, "rb") as stream:
+            expected = [(raw, str(parsed)) for raw, parsed in NMEAReader(stream)]
+        ranges = get_ranges(fname, 1000)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], os.path.getsize(fname))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+        res = [
+            (raw, str(parsed))
+            for raw, parsed in parse_file_parallel(fname, workers=2, rangesize=1000)
+        ]
+        self.assertEqual(res, expected)
+        res = [
+            (raw, str(parsed))
+            for raw, parsed in parse_file_parallel(
+                fname, workers=2, ordered=False, rangesize=1000
+            )
+        ]
+        self.assertEqual(sorted(res), sorted(expected))
+
+    def testPARALLEL_ERR(self):  # multi-process parser error handling
+        fname = os.path.join(DIRNAME, "pygpsdata-nmeabadck2.log")
+        with self.assertRaisesRegex(NMEAParseError, "invalid checksum"):
+            list(parse_file_parallel(fname, workers=1, quitonerror=ERR_RAISE))
+        with self.assertRaisesRegex(NMEAParseError, "Invalid stream mode 4"):
+            list(parse_file_parallel(fname, msgmode=4))
+
+    def testPARALLEL_TRUNCATED(self):  # binary header truncated by end of range
+        gga = b"$GNGGA,103607.00,5327.03942,N,00214.42462,W,1,12,0.67,84.5,M,48.3,M,,*69\r\n"
+        data = gga * 3 + b"\xd3\x03\xff" + gga * 3
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "truncated.log")
+            with open(fname, "wb") as stream:
+                stream.write(data)
+            res = _parse_range(fname, 0, len(data), {})
+            self.assertEqual([raw for raw, _ in res], [gga] * 6)
+            res = list(parse_file_parallel(fname, workers=1))
+            self.assertEqual([raw for raw, _ in res], [gga] * 6)
+
+    def testPARALLEL_MIXED(self):  # range boundaries in mixed-protocol data
+        gll = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+        tag = b"\\s:GP0001,n:123*17\\"
+        content = b"\x01\x07" + len(gll).to_bytes(2, "little") + gll
+        ubx = b"\xb5\x62" + content + calc_ubx_checksum(content)  # payload is NMEA
+        with open(os.path.join(DIRNAME, "pygpsdata-mixed.log"), "rb") as stream:
+            data = (stream.read() + ubx + tag + gll + ubx + gll) * 2
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "mixed.log")
+            with open(fname, "wb") as stream:
+                stream.write(data)
+            nmr = NMEAReader(BytesIO(data), quitonerror=ERR_IGNORE)
+            expected = [(raw, str(parsed)) for raw, parsed in nmr]
+            for rangesize in range(5, len(data), 5):
+                res = []
+                for start, end in get_ranges(fname, rangesize):
+                    res += _parse_range(fname, start, end, {"quitonerror": ERR_IGNORE})
+                res = [(raw, str(parsed)) for raw, parsed in res]
+                self.assertEqual(res, expected, rangesize)
+            kwargs = {
+                "quitonerror": ERR_IGNORE,
+                "lazy": True,
+                "msgclasses": True,
+                "msgfilter": ("GLL", "GNGGA", "PUBX"),
+                "fields": {"GGA": ("time", "lat", "lon")},
+            }
+            nmr = NMEAReader(BytesIO(data), **kwargs)
+            expected = [(raw, str(parsed)) for raw, parsed in nmr]
+            res = [
+                (raw, str(parsed))
+                for raw, parsed in parse_file_parallel(
+                    fname, workers=2, rangesize=500, **kwargs
+                )
+            ]
+            self.assertEqual(res, expected)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']